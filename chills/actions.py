@@ -0,0 +1,69 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Assembly of the teleop data into the ``[delta_pose, gripper]`` actions of the IK-Rel Lift task.
+"""
+
+import numpy as np
+import torch
+
+
+def pre_process_actions(
+    teleop_data: tuple[np.ndarray, bool] | list[tuple[np.ndarray, np.ndarray, np.ndarray]], num_envs: int, device: str
+) -> torch.Tensor:
+    """ Convert teleop data to  Processed actions as a tensor """
+    # resolve gripper command, convert to torch and computes actions
+    delta_pose, gripper_command = teleop_data
+    delta_pose = torch.tensor(delta_pose, dtype=torch.float, device=device).repeat(num_envs, 1)
+    gripper_vel = torch.zeros((delta_pose.shape[0], 1), dtype=torch.float, device=device)
+    gripper_vel[:] = -1 if gripper_command else 1
+    return torch.concat([delta_pose, gripper_vel], dim=1)
+
+
+class ActionBuffer:
+    """Persistent ``(num_envs, 7)`` action buffer written in place every step.
+
+    Same output as :func:`pre_process_actions` without allocating a new tensor per frame.
+    The delta pose is either shared ``(6,)`` or per environment ``(num_envs, 6)``, e.g. one per
+    operator or replayed demonstration, and the gripper command a bool or a ``(num_envs,)`` bool mask
+    (``True`` closes the gripper).
+
+    The returned tensor is the buffer itself, it is overwritten by the next call.
+    """
+
+    def __init__(self, num_envs: int, device: str, dtype: torch.dtype = torch.float):
+        self.num_envs = num_envs
+        self.device = device
+        self._actions = torch.zeros((num_envs, 7), dtype=dtype, device=device)
+        self._delta_pose = self._actions[:, :6]
+        self._gripper_vel = self._actions[:, 6]
+
+    def __call__(self, teleop_data: tuple[np.ndarray | torch.Tensor, bool | np.ndarray | torch.Tensor]) -> torch.Tensor:
+        delta_pose, gripper_command = teleop_data
+        return self.assemble(delta_pose, gripper_command)
+
+    @property
+    def actions(self) -> torch.Tensor:
+        return self._actions
+
+    def assemble(
+        self, delta_pose: np.ndarray | torch.Tensor, gripper_command: bool | np.ndarray | torch.Tensor
+    ) -> torch.Tensor:
+        """Write the delta pose and gripper command into the buffer and return it."""
+        if isinstance(delta_pose, np.ndarray):
+            # view on the numpy memory, the only copy is the one into the buffer
+            delta_pose = torch.from_numpy(delta_pose)
+        # broadcasts a shared (6,) pose over all environments
+        self._delta_pose.copy_(delta_pose)
+
+        if isinstance(gripper_command, (bool, np.bool_)):
+            self._gripper_vel.fill_(-1 if gripper_command else 1)
+        else:
+            if isinstance(gripper_command, np.ndarray):
+                gripper_command = torch.from_numpy(gripper_command)
+            # closed (1) -> -1, open (0) -> 1
+            self._gripper_vel.copy_(gripper_command).mul_(-2).add_(1)
+        return self._actions
@@ -0,0 +1,195 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Precomputed convex collision hulls of the labware meshes, cached on disk by mesh content and parameters.
+
+The mesh is split greedily into convex parts: the part with the largest hull is cut in two by the plane, among a few
+along its principal axes, that gives the least total hull volume. This repeats until ``max_hulls`` parts exist or,
+for watertight meshes, until the hulls are within ``max_concavity`` of the mesh volume. Every hull is limited to
+``max_hull_vertices`` vertices. Fewer and simpler hulls are cheaper PhysX contacts, more hulls follow the concave
+glassware (e.g. the inside of a beaker) closer.
+``max_hulls=1`` is the plain convex hull.
+
+The hulls are stored as one compressed ``.npz`` per mesh and parameter set in ``.hull_cache`` next to the mesh,
+``convert_mesh.py --max-hulls`` authors them as convex hull colliders of the converted asset.
+
+python collision_hulls.py beaker.obj --max-hulls 16 --max-hull-vertices 32
+
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+
+import numpy as np
+from scipy.spatial import ConvexHull, QhullError
+
+from mesh_cache import file_hash
+from obj_mesh import ObjMesh, load_obj, mesh_stats
+
+HULL_CACHE_DIR = ".hull_cache"
+# positions of the candidate cuts along each axis
+_CUT_QUANTILES = (0.25, 0.5, 0.75)
+
+
+@dataclass(frozen=True)
+class HullParams:
+    """Quality / cost knobs of the hull approximation."""
+
+    max_hulls: int = 8
+    """Maximum number of convex hulls."""
+    max_hull_vertices: int = 32
+    """Maximum number of vertices per hull (PhysX supports up to 255, 64 or less is cheaper)."""
+    max_concavity: float = 0.1
+    """Stop splitting once the hull volume exceeds the mesh volume by at most this ratio (watertight meshes)."""
+
+    def key(self) -> str:
+        return hashlib.sha256(json.dumps(asdict(self), sort_keys=True).encode()).hexdigest()[:8]
+
+
+def _hull(points: np.ndarray) -> ConvexHull:
+    try:
+        return ConvexHull(points)
+    except QhullError:
+        # flat or degenerate part, joggle the input
+        return ConvexHull(points, qhull_options="QJ")
+
+
+def _limit_vertices(points: np.ndarray, max_vertices: int) -> np.ndarray:
+    """Farthest point sampling of the hull vertices down to ``max_vertices``."""
+    selected = [int(np.argmax(np.linalg.norm(points - points.mean(axis=0), axis=1)))]
+    distances = np.linalg.norm(points - points[selected[0]], axis=1)
+    for _ in range(max_vertices - 1):
+        selected.append(int(np.argmax(distances)))
+        distances = np.minimum(distances, np.linalg.norm(points - points[selected[-1]], axis=1))
+    return points[selected]
+
+
+def _hull_mesh(points: np.ndarray, max_vertices: int) -> tuple[np.ndarray, np.ndarray]:
+    """Vertices and outward oriented triangles of the convex hull of the points."""
+    hull = _hull(points)
+    vertices = points[hull.vertices]
+    if len(vertices) > max_vertices:
+        hull = _hull(_limit_vertices(vertices, max_vertices))
+        vertices = hull.points[hull.vertices]
+    else:
+        hull = _hull(vertices)
+    faces = hull.simplices.copy()
+    # orient the triangles outwards, qhull does not guarantee a winding
+    normals = np.cross(vertices[faces[:, 1]] - vertices[faces[:, 0]], vertices[faces[:, 2]] - vertices[faces[:, 0]])
+    inward = np.einsum("ij,ij->i", normals, vertices[faces[:, 0]] - vertices.mean(axis=0)) < 0
+    faces[inward] = faces[inward][:, ::-1]
+    return vertices.astype(np.float32), faces.astype(np.int32)
+
+
+def compute_hulls(mesh: ObjMesh, params: HullParams) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Approximate the mesh by at most ``params.max_hulls`` convex hulls of ``(vertices, faces)``."""
+    stats = mesh_stats(mesh)
+    target_volume = abs(stats.volume) * (1.0 + params.max_concavity) if stats.watertight else 0.0
+    centroids = mesh.vertices[mesh.faces].mean(axis=1)
+
+    def part(triangles: np.ndarray) -> tuple[float, np.ndarray]:
+        return _hull(mesh.vertices[np.unique(mesh.faces[triangles])]).volume, triangles
+
+    def split(triangles: np.ndarray) -> list[tuple[float, np.ndarray]] | None:
+        # candidate cuts along the principal axes of the part, keep the one with the least hull volume
+        points = centroids[triangles] - centroids[triangles].mean(axis=0)
+        best = None
+        for axis in np.linalg.svd(points, full_matrices=False)[2]:
+            projection = points @ axis
+            for cut in np.quantile(projection, _CUT_QUANTILES):
+                below = projection <= cut
+                if below.all() or not below.any():
+                    continue
+                halves = [part(triangles[below]), part(triangles[~below])]
+                if best is None or halves[0][0] + halves[1][0] < best[0][0] + best[1][0]:
+                    best = halves
+        return best
+
+    parts = [part(np.arange(len(mesh.faces)))]
+    while len(parts) < params.max_hulls and sum(volume for volume, _ in parts) > target_volume:
+        # cut the largest hull
+        parts.sort(key=lambda p: p[0])
+        halves = split(parts[-1][1]) if len(parts[-1][1]) > 1 else None
+        if halves is None:
+            break
+        parts[-1:] = halves
+
+    return [_hull_mesh(mesh.vertices[np.unique(mesh.faces[t])], params.max_hull_vertices) for _, t in parts]
+
+
+def save_hulls(path: str, hulls: list[tuple[np.ndarray, np.ndarray]], params: HullParams):
+    np.savez_compressed(
+        path,
+        vertices=np.concatenate([v for v, _ in hulls]),
+        vertex_counts=np.array([len(v) for v, _ in hulls], dtype=np.int32),
+        faces=np.concatenate([f for _, f in hulls]),
+        face_counts=np.array([len(f) for _, f in hulls], dtype=np.int32),
+        params=json.dumps(asdict(params)),
+    )
+
+
+def load_hulls(path: str) -> list[tuple[np.ndarray, np.ndarray]]:
+    with np.load(path) as data:
+        vertices = np.split(data["vertices"], np.cumsum(data["vertex_counts"])[:-1])
+        faces = np.split(data["faces"], np.cumsum(data["face_counts"])[:-1])
+    return list(zip(vertices, faces))
+
+
+def hull_cache_path(mesh_path: str, params: HullParams, mesh_hash: str | None = None) -> str:
+    """Cache file of the mesh content and parameters, ``mesh_hash`` is computed if not given."""
+    mesh_hash = mesh_hash or file_hash(mesh_path)
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(mesh_path)), HULL_CACHE_DIR)
+    return os.path.join(cache_dir, f"{mesh_hash[:16]}-{params.key()}.npz")
+
+
+def cached_hulls(
+    mesh_path: str, params: HullParams, mesh_hash: str | None = None
+) -> tuple[list[tuple[np.ndarray, np.ndarray]], bool]:
+    """Load the hulls from the cache or compute and store them.
+
+    Returns:
+        The hulls and whether they came from the cache.
+    """
+    cache_path = hull_cache_path(mesh_path, params, mesh_hash)
+    if os.path.exists(cache_path):
+        return load_hulls(cache_path), True
+    if not mesh_path.lower().endswith(".obj"):
+        raise ValueError(f"Collision hulls can only be precomputed for OBJ meshes: {mesh_path}")
+    hulls = compute_hulls(load_obj(mesh_path), params)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    save_hulls(cache_path, hulls, params)
+    return hulls, False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the convex collision hulls of OBJ meshes.")
+    parser.add_argument("input", type=str, nargs="+", help="The paths to the OBJ files.")
+    parser.add_argument("--max-hulls", type=int, default=HullParams.max_hulls, help="Maximum number of hulls.")
+    parser.add_argument(
+        "--max-hull-vertices", type=int, default=HullParams.max_hull_vertices, help="Maximum vertices per hull."
+    )
+    parser.add_argument(
+        "--max-concavity", type=float, default=HullParams.max_concavity, help="Accepted hull / mesh volume excess."
+    )
+    args = parser.parse_args()
+
+    params = HullParams(args.max_hulls, args.max_hull_vertices, args.max_concavity)
+    for path in args.input:
+        start = time.perf_counter()
+        hulls, from_cache = cached_hulls(path, params)
+        elapsed = time.perf_counter() - start
+        num_vertices = sum(len(v) for v, _ in hulls)
+        num_faces = sum(len(f) for _, f in hulls)
+        source = "cache" if from_cache else "computed"
+        print(f"{path}: {len(hulls)} hulls, {num_vertices} vertices, {num_faces} triangles ({source}, {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,9 +23,16 @@ This script uses the asset converter extension from Isaac Sim (``omni.kit.asset_
 OBJ/STL/FBX asset into USD format. It is designed as a convenience script for command-line use.
 
 
+Several meshes are converted in one app instance by passing a directory of meshes, each ``<name>.obj`` is
+converted to ``<output>/<name>/<name>.usd``, or a ``.yaml`` manifest with a list of ``{input, output}`` entries
+(optionally with their own ``make_instanceable``, ``collision_approximation`` and ``mass``). Meshes whose USD
+was already converted from the same file content with the same settings are skipped, see ``mesh_cache.py``.
+The app is not launched at all when every mesh is up to date.
+
+
 positional arguments:
-  input               The path to the input mesh (.OBJ/.STL/.FBX) file.
-  output              The path to store the USD file.
+  input               The path to the input mesh (.OBJ/.STL/.FBX) file, a directory of meshes or a .yaml manifest.
+  output              The path to store the USD file, or the output directory of a batch. (default: input directory)
 
 optional arguments:
   -h, --help                    Show this help message and exit
@@ -33,6 +40,13 @@ optional arguments:
   --collision-approximation     The method used for approximating collision mesh. Defaults to convexDecomposition.
                                 Set to \"none\" to not add a collision mesh to the converted mesh. (default: convexDecomposition)
   --mass                        The mass (in kg) to assign to the converted asset. (default: None)
+  --max-hulls                   Use at most this many precomputed convex hulls as colliders instead of the
+                                collision approximation, cached per mesh content, see ``collision_hulls.py``.
+                                (default: None)
+  --max-hull-vertices           Maximum number of vertices per precomputed hull. (default: 32)
+  --simplify                    Convert a level of detail with at most this many triangles instead of the full
+                                resolution mesh, cached per mesh content, see ``mesh_lod.py``. (default: None)
+  --force                       Convert even the meshes that are up to date. (default: False)
 
 """
 
@@ -40,13 +54,19 @@ optional arguments:
 
 
 import argparse
+import sys
 
 from isaaclab.app import AppLauncher
 
+from mesh_cache import MeshJob, collect_jobs, invalidate, plan_conversions, write_hull_settings
+from mesh_lod import cached_lod
+
 # add argparse arguments
 parser = argparse.ArgumentParser(description="Utility to convert a mesh file into USD format.")
-parser.add_argument("input", type=str, help="The path to the input mesh file.")
-parser.add_argument("output", type=str, help="The path to store the USD file.")
+parser.add_argument("input", type=str, help="The path to the input mesh file, a directory of meshes or a manifest.")
+parser.add_argument(
+    "output", type=str, nargs="?", default=None, help="The path to store the USD file, or the batch output directory."
+)
 parser.add_argument(
     "--make-instanceable",
     action="store_true",
@@ -69,11 +89,61 @@ parser.add_argument(
     default=None,
     help="The mass (in kg) to assign to the converted asset. If not provided, then no mass is added.",
 )
+parser.add_argument(
+    "--max-hulls",
+    type=int,
+    default=None,
+    help="Use at most this many precomputed convex hulls as colliders instead of the collision approximation.",
+)
+parser.add_argument(
+    "--max-hull-vertices",
+    type=int,
+    default=32,
+    help="Maximum number of vertices per precomputed hull, fewer is cheaper in PhysX.",
+)
+parser.add_argument(
+    "--simplify",
+    type=int,
+    default=None,
+    help="Convert a level of detail with at most this many triangles instead of the full resolution mesh.",
+)
+parser.add_argument(
+    "--force",
+    action="store_true",
+    default=False,
+    help="Convert even the meshes whose USD is up to date.",
+)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
 args_cli = parser.parse_args()
 
+# resolve the conversions before launching the app
+jobs = collect_jobs(
+    args_cli.input,
+    args_cli.output,
+    make_instanceable=args_cli.make_instanceable,
+    collision_approximation=args_cli.collision_approximation,
+    mass=args_cli.mass,
+    max_hulls=args_cli.max_hulls,
+    max_hull_vertices=args_cli.max_hull_vertices,
+)
+# the levels of detail replace the inputs, so the conversion cache follows their content
+if args_cli.simplify is not None:
+    for job in jobs:
+        mesh_path = job.input
+        job.input, lod_deviation = cached_lod(mesh_path, args_cli.simplify)
+        print(
+            f"Simplified {mesh_path} to {args_cli.simplify} triangles, max deviation {lod_deviation.max:.4g}"
+            f" ({lod_deviation.relative_max:.2%} of the diagonal): {job.input}"
+        )
+pending_jobs, up_to_date_jobs = plan_conversions(jobs, force=args_cli.force)
+for job in up_to_date_jobs:
+    print(f"Up to date, skipping: {job.output}")
+if not pending_jobs:
+    print(f"All {len(jobs)} mesh(es) are up to date, nothing to convert. Use --force to convert anyway.")
+    sys.exit(0)
+
 # launch omniverse app
 app_launcher = AppLauncher(args_cli)
 simulation_app = app_launcher.app
@@ -86,54 +156,95 @@ import os
 import carb
 import isaacsim.core.utils.stage as stage_utils
 import omni.kit.app
+from pxr import Gf, Usd, UsdGeom, UsdPhysics
 
 from isaaclab.sim.converters import MeshConverter, MeshConverterCfg
 from isaaclab.sim.schemas import schemas_cfg
-from isaaclab.utils.assets import check_file_path
 from isaaclab.utils.dict import print_dict
 
-
-def main():
-    # check valid file path
-    mesh_path = args_cli.input
-    if not os.path.isabs(mesh_path):
-        mesh_path = os.path.abspath(mesh_path)
-    if not check_file_path(mesh_path):
-        raise ValueError(f"Invalid mesh file path: {mesh_path}")
-
-    # create destination path
-    dest_path = args_cli.output
-    if not os.path.isabs(dest_path):
-        dest_path = os.path.abspath(dest_path)
-
+from collision_hulls import HullParams, cached_hulls
+
+
+def _hulls_target(mesh_prim: Usd.Prim) -> tuple[Usd.Stage, Usd.Prim, Usd.Prim]:
+    """Stage and prim to author the hulls under, and the mesh as seen from that stage.
+
+    With ``--make-instanceable`` the mesh is an instance proxy of the prim referencing the props layer
+    (``Props/instanceable_meshes.usd``), the hulls then go under the referenced prim of that layer so that they
+    stay instanced. Otherwise they go under the default prim of the asset.
+    """
+    stage = mesh_prim.GetStage()
+    instance = mesh_prim
+    while instance.IsInstanceProxy() and not instance.IsInstance():
+        instance = instance.GetParent()
+    if not instance.IsInstance():
+        return stage, stage.GetDefaultPrim(), mesh_prim
+
+    reference = instance.GetMetadata("references").GetAddedOrExplicitItems()[0]
+    props_stage = Usd.Stage.Open(stage.GetRootLayer().ComputeAbsolutePath(reference.assetPath))
+    root_path = reference.primPath if not reference.primPath.isEmpty else props_stage.GetDefaultPrim().GetPath()
+    # the prototype of the instance is the referenced prim
+    mesh_path = mesh_prim.GetPrimInPrototype().GetPath().ReplacePrefix(instance.GetPrototype().GetPath(), root_path)
+    return props_stage, props_stage.GetPrimAtPath(root_path), props_stage.GetPrimAtPath(mesh_path)
+
+
+def author_hulls(usd_path: str, hulls: list):
+    """Add the convex hulls as invisible convex hull colliders of the converted asset.
+
+    The hulls are in the coordinates of the mesh file, they get the transform of the converted mesh. They are
+    authored next to the mesh in the instanceable props layer when the asset is instanceable.
+    """
+    stage = Usd.Stage.Open(usd_path)
+    mesh_prim = next(
+        prim
+        for prim in Usd.PrimRange(stage.GetDefaultPrim(), Usd.TraverseInstanceProxies())
+        if prim.IsA(UsdGeom.Mesh)
+    )
+    hull_stage, root, mesh_prim = _hulls_target(mesh_prim)
+    mesh_transform, _ = UsdGeom.XformCache().ComputeRelativeTransform(mesh_prim, root)
+
+    collisions = UsdGeom.Xform.Define(hull_stage, root.GetPath().AppendChild("collisions"))
+    collisions.AddTransformOp().Set(Gf.Matrix4d(mesh_transform))
+    for i, (vertices, faces) in enumerate(hulls):
+        hull = UsdGeom.Mesh.Define(hull_stage, collisions.GetPath().AppendChild(f"hull_{i}"))
+        hull.CreatePointsAttr([Gf.Vec3f(*vertex) for vertex in vertices.tolist()])
+        hull.CreateFaceVertexCountsAttr([3] * len(faces))
+        hull.CreateFaceVertexIndicesAttr(faces.reshape(-1).tolist())
+        hull.CreatePurposeAttr(UsdGeom.Tokens.guide)
+        UsdPhysics.CollisionAPI.Apply(hull.GetPrim())
+        UsdPhysics.MeshCollisionAPI.Apply(hull.GetPrim()).CreateApproximationAttr(UsdPhysics.Tokens.convexHull)
+    hull_stage.Save()
+
+
+def convert(job: MeshJob) -> MeshConverter:
+    """Convert the mesh of the job to USD."""
     # Mass properties
-    if args_cli.mass is not None:
-        mass_props = schemas_cfg.MassPropertiesCfg(mass=args_cli.mass)
+    if job.mass is not None:
+        mass_props = schemas_cfg.MassPropertiesCfg(mass=job.mass)
         rigid_props = schemas_cfg.RigidBodyPropertiesCfg()
     else:
         mass_props = None
         rigid_props = None
 
     # Collision properties
-    collision_props = schemas_cfg.CollisionPropertiesCfg(collision_enabled=args_cli.collision_approximation != "none")
+    collision_props = schemas_cfg.CollisionPropertiesCfg(collision_enabled=job.converter_approximation != "none")
 
     # Create Mesh converter config
     mesh_converter_cfg = MeshConverterCfg(
         mass_props=mass_props,
         rigid_props=rigid_props,
         collision_props=collision_props,
-        asset_path=mesh_path,
+        asset_path=job.input,
         force_usd_conversion=True,
-        usd_dir=os.path.dirname(dest_path),
-        usd_file_name=os.path.basename(dest_path),
-        make_instanceable=args_cli.make_instanceable,
-        collision_approximation=args_cli.collision_approximation,
+        usd_dir=os.path.dirname(job.output),
+        usd_file_name=os.path.basename(job.output),
+        make_instanceable=job.make_instanceable,
+        collision_approximation=job.converter_approximation,
     )
 
     # Print info
     print("-" * 80)
     print("-" * 80)
-    print(f"Input Mesh file: {mesh_path}")
+    print(f"Input Mesh file: {job.input}")
     print("Mesh importer config:")
     print_dict(mesh_converter_cfg.to_dict(), nesting=0)
     print("-" * 80)
@@ -144,8 +255,39 @@ def main():
     # print output
     print("Mesh importer output:")
     print(f"Generated USD file: {mesh_converter.usd_path}")
+
+    # Replace the converter collision approximation with the precomputed hulls
+    if job.max_hulls is not None:
+        hull_params = HullParams(max_hulls=job.max_hulls, max_hull_vertices=job.max_hull_vertices)
+        hulls, from_cache = cached_hulls(job.input, hull_params)
+        author_hulls(mesh_converter.usd_path, hulls)
+        print(f"Collision hulls: {len(hulls)} ({'cached' if from_cache else 'computed'})")
     print("-" * 80)
     print("-" * 80)
+    return mesh_converter
+
+
+def main():
+    # convert all pending meshes in this app instance
+    failed = []
+    for job in pending_jobs:
+        try:
+            mesh_converter = convert(job)
+        except Exception as e:
+            print(f"[ERROR] Failed to convert '{job.input}': {e}")
+            failed.append(job.input)
+            # the converter hash is written before the conversion, convert again on the next run
+            invalidate(job)
+            continue
+        # the hull settings are not in the converter hash
+        write_hull_settings(job)
+    num_converted = len(pending_jobs) - len(failed)
+    print(f"Converted {num_converted}, skipped {len(up_to_date_jobs)}, failed {len(failed)} mesh(es).")
+    if failed:
+        raise RuntimeError(f"Failed to convert: {failed}")
+    # only a single converted asset is shown
+    if len(jobs) > 1:
+        return
 
     # Determine if there is a GUI to update:
     # acquire settings interface
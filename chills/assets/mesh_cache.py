@@ -0,0 +1,181 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Planning of batch mesh conversions and the check for outputs that are already up to date.
+
+Does not import Isaac Sim, so ``convert_mesh.py`` can decide what to convert before launching the app.
+
+A conversion is up to date when the ``config.yaml`` written by ``MeshConverter`` next to the USD has the
+same converter settings and its ``.asset_hash`` still matches. ``MeshConverter`` hashes its config (without the
+paths) and the content of the input file, :func:`converter_hash` computes the same hash from the dumped
+``config.yaml`` and the current input file. The precomputed collision hulls are not part of the converter
+config, their settings are kept in ``collision_hulls.yaml`` next to the USD.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import yaml
+
+MESH_EXTENSIONS = (".obj", ".stl", ".fbx")
+# written by MeshConverter next to the USD
+ASSET_HASH_FILE = ".asset_hash"
+HULLS_FILE = "collision_hulls.yaml"
+
+
+@dataclass
+class MeshJob:
+    """One mesh to convert and its converter settings."""
+
+    input: str
+    output: str
+    make_instanceable: bool = False
+    collision_approximation: str = "convexDecomposition"
+    mass: float | None = None
+    max_hulls: int | None = None
+    """Use precomputed convex hulls as colliders instead of the converter approximation."""
+    max_hull_vertices: int = 32
+
+    @property
+    def converter_approximation(self) -> str:
+        """Collision approximation of ``MeshConverter``, none when the precomputed hulls are the colliders."""
+        return "none" if self.max_hulls is not None else self.collision_approximation
+
+    @property
+    def hull_settings(self) -> dict | None:
+        """Settings of the precomputed hulls stored in ``collision_hulls.yaml``, ``None`` without them."""
+        if self.max_hulls is None:
+            return None
+        return {"max_hulls": self.max_hulls, "max_hull_vertices": self.max_hull_vertices}
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of the file content, read in blocks."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def collect_jobs(input_path: str, output_path: str | None, **settings) -> list[MeshJob]:
+    """Resolve a mesh file, a directory of meshes or a manifest into conversion jobs.
+
+    * A mesh file converts to ``output_path``.
+    * A directory converts every mesh ``<name>.obj`` to ``<output_path>/<name>/<name>.usd``,
+      ``output_path`` defaults to the directory itself.
+    * A ``.yaml`` manifest is a list of ``{input, output, ...}`` entries, relative paths are relative to the
+      manifest. The entries may override the settings given on the command line.
+    """
+    input_path = os.path.abspath(input_path)
+    if os.path.isdir(input_path):
+        output_root = os.path.abspath(output_path or input_path)
+        jobs = []
+        for file_name in sorted(os.listdir(input_path)):
+            name, ext = os.path.splitext(file_name)
+            if ext.lower() in MESH_EXTENSIONS:
+                output = os.path.join(output_root, name, f"{name}.usd")
+                jobs.append(MeshJob(os.path.join(input_path, file_name), output, **settings))
+        return jobs
+
+    if input_path.endswith((".yaml", ".yml")):
+        root = os.path.dirname(input_path)
+        with open(input_path) as f:
+            entries = yaml.safe_load(f) or []
+        jobs = []
+        for entry in entries:
+            entry = {**settings, **entry}
+            entry["input"] = os.path.join(root, entry["input"])
+            entry["output"] = os.path.join(root, entry["output"])
+            jobs.append(MeshJob(**entry))
+        return jobs
+
+    if output_path is None:
+        raise ValueError(f"An output USD path is required to convert the mesh file: {input_path}")
+    return [MeshJob(input_path, os.path.abspath(output_path), **settings)]
+
+
+def _load_converter_config(usd_path: str) -> dict | None:
+    config_path = os.path.join(os.path.dirname(usd_path), "config.yaml")
+    if not os.path.exists(config_path):
+        return None
+    with open(config_path) as f:
+        # the config is dumped with python tuples
+        return yaml.load(f, Loader=yaml.FullLoader)
+
+
+def converter_hash(config: dict, asset_path: str) -> str:
+    """The ``.asset_hash`` ``MeshConverter`` writes for its config dict and the content of ``asset_path``."""
+    config = {key: value for key, value in config.items() if key not in ("asset_path", "usd_dir", "usd_file_name")}
+    md5 = hashlib.md5(json.dumps(config).encode())
+    with open(asset_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            md5.update(block)
+    return md5.hexdigest()
+
+
+def _read_hull_settings(usd_path: str) -> dict | None:
+    hulls_path = os.path.join(os.path.dirname(usd_path), HULLS_FILE)
+    if not os.path.exists(hulls_path):
+        return None
+    with open(hulls_path) as f:
+        return yaml.safe_load(f)
+
+
+def is_up_to_date(job: MeshJob) -> bool:
+    """Whether the USD of the job was converted from the same mesh content with the same settings."""
+    hash_path = os.path.join(os.path.dirname(job.output), ASSET_HASH_FILE)
+    config = _load_converter_config(job.output)
+    if not os.path.exists(job.output) or not os.path.exists(hash_path) or config is None:
+        return False
+    with open(hash_path) as f:
+        if f.readline().strip() != converter_hash(config, job.input):
+            return False
+    if _read_hull_settings(job.output) != job.hull_settings:
+        return False
+
+    mass = (config.get("mass_props") or {}).get("mass")
+    collision_enabled = (config.get("collision_props") or {}).get("collision_enabled")
+    return (
+        config.get("usd_file_name") == os.path.basename(job.output)
+        and config.get("make_instanceable") == job.make_instanceable
+        and config.get("collision_approximation") == job.converter_approximation
+        and collision_enabled == (job.converter_approximation != "none")
+        and mass == job.mass
+    )
+
+
+def plan_conversions(jobs: list[MeshJob], force: bool = False) -> tuple[list[MeshJob], list[MeshJob]]:
+    """Check the jobs in parallel (hashing the inputs) and split them into pending and up to date ones."""
+    for job in jobs:
+        if not os.path.isfile(job.input):
+            raise ValueError(f"Invalid mesh file path: {job.input}")
+    if force:
+        return list(jobs), []
+    with ThreadPoolExecutor() as executor:
+        up_to_date = list(executor.map(is_up_to_date, jobs))
+    return [job for job, done in zip(jobs, up_to_date) if not done], [job for job, done in zip(jobs, up_to_date) if done]
+
+
+def write_hull_settings(job: MeshJob):
+    """Record the hull settings of the job next to the converted USD, after a successful conversion."""
+    hulls_path = os.path.join(os.path.dirname(job.output), HULLS_FILE)
+    if job.hull_settings is None:
+        if os.path.exists(hulls_path):
+            os.remove(hulls_path)
+        return
+    with open(hulls_path, "w") as f:
+        yaml.safe_dump(job.hull_settings, f)
+
+
+def invalidate(job: MeshJob):
+    """Remove the ``.asset_hash`` of a failed conversion, ``MeshConverter`` writes it before converting."""
+    hash_path = os.path.join(os.path.dirname(job.output), ASSET_HASH_FILE)
+    if os.path.exists(hash_path):
+        os.remove(hash_path)
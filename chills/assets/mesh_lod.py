@@ -0,0 +1,250 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Levels of detail of the labware meshes with NumPy only, and how far each one deviates from the original.
+
+The mesh is simplified by vertex clustering on a regular grid. Every cluster is replaced by the point that
+minimizes the quadric error of its triangles, which keeps sharp rims and edges, e.g. the lip of a beaker,
+better than the cluster mean. The grid size is searched for the largest triangle count below the target.
+
+The deviation is the symmetric surface distance, estimated from points sampled on both surfaces: the maximum
+approximates the Hausdorff distance, reported also relative to the bounding box diagonal.
+
+The levels are written as OBJ files into ``.lod_cache`` next to the mesh, keyed by mesh content and target,
+with their deviation in a ``.json`` of the same name. ``convert_mesh.py --simplify`` converts such a level
+instead of the full resolution mesh.
+
+python mesh_lod.py beaker.obj --triangles 20000 5000 1000
+python mesh_lod.py beaker.obj --triangles 5000 --output beaker_lod.obj
+
+"""
+
+import argparse
+import json
+import os
+from dataclasses import asdict, dataclass
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from mesh_cache import file_hash
+from obj_mesh import ObjMesh, load_obj, weld_vertices
+
+LOD_CACHE_DIR = ".lod_cache"
+
+
+@dataclass
+class LodDeviation:
+    """Symmetric surface distance between a level and the original mesh, in the units of the file."""
+
+    max: float
+    mean: float
+    relative_max: float
+    """Maximum relative to the bounding box diagonal of the original mesh."""
+
+
+def _row_keys(rows: np.ndarray, bits: int) -> np.ndarray:
+    """Pack rows of 3 non negative integers below ``2**bits`` into one int64 key, 1D unique is much faster."""
+    rows = rows.astype(np.int64)
+    return (rows[:, 0] << (2 * bits)) | (rows[:, 1] << bits) | rows[:, 2]
+
+
+def _cluster(vertices: np.ndarray, faces: np.ndarray, cell_size: float) -> tuple[np.ndarray, np.ndarray]:
+    """Cluster ids of the vertices on the grid and the surviving, non degenerate triangles."""
+    cells = np.floor((vertices - vertices.min(axis=0)) / cell_size).astype(np.int64)
+    # cells are below 2**20 per axis for cell sizes down to 1e-6 of the diagonal
+    _, cluster_ids = np.unique(_row_keys(cells, 21), return_inverse=True)
+    cluster_ids = cluster_ids.reshape(-1)
+    clustered = cluster_ids[faces]
+    collapsed = (clustered == np.roll(clustered, 1, axis=1)).any(axis=1)
+    clustered = clustered[~collapsed]
+    # triangles collapsed onto the same clusters
+    sorted_rows = np.sort(clustered, axis=1)
+    if len(vertices) < 1 << 21:
+        _, unique = np.unique(_row_keys(sorted_rows, 21), return_index=True)
+    else:
+        _, unique = np.unique(sorted_rows, axis=0, return_index=True)
+    return cluster_ids, clustered[np.sort(unique)]
+
+
+def _quadric_positions(
+    vertices: np.ndarray, faces: np.ndarray, cluster_ids: np.ndarray, num_clusters: int
+) -> np.ndarray:
+    """Position of every cluster minimizing the squared distance to the planes of its triangles."""
+    v0, v1, v2 = (vertices[faces[:, i]] for i in range(3))
+    normals = np.cross(v1 - v0, v2 - v0)
+    # area weighted plane quadrics n n^T x = n n^T p of the triangles
+    areas = np.linalg.norm(normals, axis=1, keepdims=True)
+    unit = normals / np.maximum(areas, 1e-12)
+    nnt = areas[:, :, None] * unit[:, :, None] * unit[:, None, :]
+    nntp = np.einsum("fij,fj->fi", nnt, v0)
+
+    A = np.zeros((num_clusters, 3, 3))
+    b = np.zeros((num_clusters, 3))
+    for corner in range(3):
+        np.add.at(A, cluster_ids[faces[:, corner]], nnt)
+        np.add.at(b, cluster_ids[faces[:, corner]], nntp)
+
+    counts = np.bincount(cluster_ids, minlength=num_clusters)[:, None]
+    mean = np.zeros((num_clusters, 3))
+    np.add.at(mean, cluster_ids, vertices)
+    mean /= np.maximum(counts, 1)
+
+    # solve around the mean, regularized towards it for flat or edge-only clusters
+    scale = np.trace(A, axis1=1, axis2=2)[:, None, None] + 1e-12
+    A_reg = A + 1e-3 * scale * np.eye(3)
+    positions = mean + np.linalg.solve(A_reg, (b - np.einsum("cij,cj->ci", A, mean))[:, :, None])[:, :, 0]
+
+    # keep the positions inside the bounds of their cluster
+    lower = np.full((num_clusters, 3), np.inf)
+    upper = np.full((num_clusters, 3), -np.inf)
+    np.minimum.at(lower, cluster_ids, vertices)
+    np.maximum.at(upper, cluster_ids, vertices)
+    return np.clip(positions, lower, upper)
+
+
+def _compact(positions: np.ndarray, faces: np.ndarray) -> ObjMesh:
+    used, faces = np.unique(faces, return_inverse=True)
+    return ObjMesh(
+        vertices=positions[used].astype(np.float32),
+        faces=faces.reshape(-1, 3).astype(np.int32),
+        normals=np.empty((0, 3), dtype=np.float32),
+    )
+
+
+def simplify(mesh: ObjMesh, target_triangles: int, iterations: int = 24) -> ObjMesh:
+    """Simplify the mesh to at most ``target_triangles`` triangles, as close to the target as the grid allows."""
+    vertices, faces = weld_vertices(mesh.vertices.astype(np.float64), mesh.faces)
+    if len(faces) <= target_triangles:
+        return _compact(vertices, faces)
+
+    # bisection of the cell size in log space, coarse enough for the target but as fine as possible
+    diagonal = np.linalg.norm(vertices.max(axis=0) - vertices.min(axis=0))
+    fine, coarse = np.log(diagonal * 1e-6), np.log(diagonal)
+    best = None
+    for _ in range(iterations):
+        cell_size = np.exp(0.5 * (fine + coarse))
+        cluster_ids, clustered = _cluster(vertices, faces, cell_size)
+        if len(clustered) <= target_triangles:
+            coarse = np.log(cell_size)
+            best = (cluster_ids, clustered)
+        else:
+            fine = np.log(cell_size)
+    if best is None:
+        best = _cluster(vertices, faces, diagonal)
+
+    cluster_ids, clustered = best
+    positions = _quadric_positions(vertices, faces, cluster_ids, int(cluster_ids.max()) + 1)
+    return _compact(positions, clustered)
+
+
+def sample_surface(mesh: ObjMesh, num_samples: int, seed: int = 0) -> np.ndarray:
+    """Area weighted uniform samples of the surface, plus the vertices."""
+    v0, v1, v2 = (mesh.vertices[mesh.faces[:, i]].astype(np.float64) for i in range(3))
+    areas = 0.5 * np.linalg.norm(np.cross(v1 - v0, v2 - v0), axis=1)
+    rng = np.random.default_rng(seed)
+    triangles = rng.choice(len(areas), size=num_samples, p=areas / areas.sum())
+    u, v = rng.random((2, num_samples, 1))
+    # fold the samples outside of the triangle back in
+    outside = (u + v) > 1
+    u, v = np.where(outside, 1 - u, u), np.where(outside, 1 - v, v)
+    samples = v0[triangles] + u * (v1 - v0)[triangles] + v * (v2 - v0)[triangles]
+    return np.concatenate((samples, mesh.vertices))
+
+
+def deviation(original: ObjMesh, simplified: ObjMesh, num_samples: int = 50000) -> LodDeviation:
+    """Symmetric sampled surface distance between the two meshes."""
+    original_points = sample_surface(original, num_samples)
+    simplified_points = sample_surface(simplified, num_samples)
+    forward, _ = cKDTree(simplified_points).query(original_points)
+    backward, _ = cKDTree(original_points).query(simplified_points)
+    distances = np.concatenate((forward, backward))
+    diagonal = np.linalg.norm(original.vertices.max(axis=0) - original.vertices.min(axis=0))
+    return LodDeviation(
+        max=float(distances.max()), mean=float(distances.mean()), relative_max=float(distances.max() / diagonal)
+    )
+
+
+def write_obj(path: str, mesh: ObjMesh):
+    with open(path, "w") as f:
+        f.write(f"# {len(mesh.vertices)} vertices, {len(mesh.faces)} triangles\n")
+        np.savetxt(f, mesh.vertices, fmt="v %.7g %.7g %.7g")
+        np.savetxt(f, mesh.faces + 1, fmt="f %d %d %d")
+
+
+def lod_cache_path(mesh_path: str, target_triangles: int, mesh_hash: str | None = None) -> str:
+    """Cache file of the mesh content and target, ``mesh_hash`` is computed if not given."""
+    mesh_hash = mesh_hash or file_hash(mesh_path)
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(mesh_path)), LOD_CACHE_DIR)
+    name = os.path.splitext(os.path.basename(mesh_path))[0]
+    return os.path.join(cache_dir, f"{name}-{mesh_hash[:16]}-{target_triangles}.obj")
+
+
+def write_deviation(lod_path: str, lod_deviation: LodDeviation):
+    """Store the deviation next to the level, ``<name>.json`` for ``<name>.obj``."""
+    with open(os.path.splitext(lod_path)[0] + ".json", "w") as f:
+        json.dump(asdict(lod_deviation), f, indent=2)
+
+
+def read_deviation(lod_path: str) -> LodDeviation | None:
+    """Deviation stored next to the level, ``None`` if there is none."""
+    try:
+        with open(os.path.splitext(lod_path)[0] + ".json") as f:
+            return LodDeviation(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def cached_lod(mesh_path: str, target_triangles: int) -> tuple[str, LodDeviation]:
+    """Path of the simplified mesh and its deviation, generated if not cached.
+
+    A cached level without its deviation file, e.g. from an older cache, gets it measured and stored.
+    """
+    cache_path = lod_cache_path(mesh_path, target_triangles)
+    if os.path.exists(cache_path):
+        lod_deviation = read_deviation(cache_path)
+        if lod_deviation is None:
+            lod_deviation = deviation(load_obj(mesh_path), load_obj(cache_path))
+            write_deviation(cache_path, lod_deviation)
+        return cache_path, lod_deviation
+    mesh = load_obj(mesh_path)
+    lod = simplify(mesh, target_triangles)
+    lod_deviation = deviation(mesh, lod)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    write_obj(cache_path, lod)
+    write_deviation(cache_path, lod_deviation)
+    return cache_path, lod_deviation
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate simplified levels of detail of an OBJ mesh.")
+    parser.add_argument("input", type=str, help="The path to the OBJ file.")
+    parser.add_argument("--triangles", type=int, nargs="+", required=True, help="Target triangle counts.")
+    parser.add_argument("--output", type=str, default=None, help="Output OBJ (single target), default: .lod_cache.")
+    parser.add_argument(
+        "--max-deviation", type=float, default=0.01, help="Flag levels deviating more, relative to the diagonal."
+    )
+    args = parser.parse_args()
+
+    mesh = load_obj(args.input)
+    print(f"{args.input}: {len(mesh.faces)} triangles")
+    print(f"{'target':>8} {'triangles':>10} {'max dev':>10} {'mean dev':>10} {'rel. max':>9}  path")
+    for target in args.triangles:
+        lod = simplify(mesh, target)
+        lod_deviation = deviation(mesh, lod)
+        path = args.output if args.output and len(args.triangles) == 1 else lod_cache_path(args.input, target)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        write_obj(path, lod)
+        write_deviation(path, lod_deviation)
+        flag = "  [exceeds --max-deviation]" if lod_deviation.relative_max > args.max_deviation else ""
+        print(
+            f"{target:>8} {len(lod.faces):>10} {lod_deviation.max:>10.4g} {lod_deviation.mean:>10.4g}"
+            f" {lod_deviation.relative_max:>9.2%}  {path}{flag}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Streaming OBJ loader and mesh statistics with NumPy only, no Isaac Sim required.
+
+The file is read in blocks and each block is parsed with vectorized byte operations: the lines are classified
+by their first characters, comments are blanked, and the vertex / normal / face records are cut out as one
+buffer and converted by NumPy's C number parser. No Python object is created per line or per number, so large
+scans stay fast and small in memory.
+
+Only the positions (``v``), normals (``vn``) and the position indices of the faces (``f``) are read. Polygons
+are fan-triangulated and negative (relative) indices are resolved.
+
+python obj_mesh.py beaker.obj con_flask.obj round_bot.obj
+python obj_mesh.py beaker.obj --json
+
+"""
+
+import argparse
+import json
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+_NEWLINE, _CR, _SPACE, _TAB, _SLASH, _HASH = (ord(c) for c in "\n\r \t/#")
+_LFS_POINTER = b"version https://git-lfs"
+
+
+@dataclass
+class ObjMesh:
+    """Triangle mesh read from an OBJ file."""
+
+    vertices: np.ndarray
+    """Vertex positions ``(V, 3)`` float32."""
+    faces: np.ndarray
+    """Triangle vertex indices ``(F, 3)`` int32."""
+    normals: np.ndarray
+    """Normals ``(N, 3)`` float32 of the ``vn`` records, may be empty."""
+
+
+@dataclass
+class MeshStats:
+    """Geometric statistics of a triangle mesh, in the units of the file."""
+
+    num_vertices: int
+    num_triangles: int
+    bounds_min: list[float]
+    bounds_max: list[float]
+    extents: list[float]
+    surface_area: float
+    volume: float
+    """Signed volume, negative for inward facing triangles. Only meaningful for watertight meshes."""
+    watertight: bool
+    """Every edge is shared by exactly two triangles, after welding coincident vertices."""
+    winding_consistent: bool
+    """Every directed edge appears once, i.e. neighbouring triangles have the same orientation."""
+
+
+def _record_values(buf: np.ndarray, line_lengths: np.ndarray, lines: np.ndarray, dtype) -> np.ndarray:
+    """Parse the whitespace separated numbers of the selected lines (prefix already blanked)."""
+    if not lines.any():
+        return np.empty(0, dtype=dtype)
+    text = buf[np.repeat(lines, line_lengths)].tobytes()
+    # C-level parse of the joined records, the comments are already blanked
+    return np.fromstring(text, dtype=dtype, sep=" ")
+
+
+def _blank_ranges(buf: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+    """Blank ``buf[starts[i]:ends[i]]`` of every range, in time proportional to the blanked bytes."""
+    lengths = ends - starts
+    offsets = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    buf[np.repeat(starts, lengths) + offsets] = _SPACE
+
+
+def _is_space(buf: np.ndarray) -> np.ndarray:
+    return (buf == _SPACE) | (buf == _TAB) | (buf == _CR) | (buf == _NEWLINE)
+
+
+def _as_rows(values: np.ndarray, num_lines: int, kind: str) -> np.ndarray:
+    if num_lines == 0:
+        return np.empty((0, 3), dtype=np.float32)
+    if len(values) % num_lines != 0:
+        raise ValueError(f"The '{kind}' records do not all have the same number of values.")
+    return values.reshape(num_lines, -1)[:, :3].astype(np.float32)
+
+
+def _parse_block(block: bytes, vertex_offset: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse a block of complete lines, ``vertex_offset`` is the number of vertices of the previous blocks."""
+    buf = np.frombuffer(block, dtype=np.uint8).copy()
+    line_ends = np.flatnonzero(buf == _NEWLINE)
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    # bytes of every line, with its newline
+    line_lengths = line_ends - line_starts + 1
+
+    # blank the comments, every byte from a '#' to the end of its line
+    hashes = np.flatnonzero(buf == _HASH)
+    if len(hashes) > 0:
+        _blank_ranges(buf, hashes, line_ends[np.searchsorted(line_ends, hashes)])
+
+    # classify the lines by their first characters
+    padded = np.concatenate((buf, [_NEWLINE, _NEWLINE]))
+    c0, c1, c2 = padded[line_starts], padded[line_starts + 1], padded[line_starts + 2]
+    is_vertex = (c0 == ord("v")) & ((c1 == _SPACE) | (c1 == _TAB))
+    is_normal = (c0 == ord("v")) & (c1 == ord("n")) & ((c2 == _SPACE) | (c2 == _TAB))
+    is_face = (c0 == ord("f")) & ((c1 == _SPACE) | (c1 == _TAB))
+
+    # blank the record prefixes so only numbers remain
+    buf[line_starts[is_vertex | is_normal | is_face]] = _SPACE
+    buf[line_starts[is_normal] + 1] = _SPACE
+
+    vertices = _as_rows(_record_values(buf, line_lengths, is_vertex, np.float64), int(is_vertex.sum()), "v")
+    normals = _as_rows(_record_values(buf, line_lengths, is_normal, np.float64), int(is_normal.sum()), "vn")
+    if not is_face.any():
+        return vertices, np.empty((0, 3), dtype=np.int32), normals
+
+    # keep the position index of each "v/vt/vn" face corner: blank every byte after a slash up to the next space
+    slashes = np.flatnonzero(buf == _SLASH)
+    if len(slashes) > 0:
+        spaces = np.flatnonzero(_is_space(buf))
+        _blank_ranges(buf, slashes, spaces[np.searchsorted(spaces, slashes)])
+
+    corners = _record_values(buf, line_lengths, is_face, np.int64)
+    # corners per face, counted from the token starts
+    is_space = _is_space(buf)
+    token_starts = np.flatnonzero(~is_space & np.concatenate(([True], is_space[:-1])))
+    corner_counts = np.bincount(np.searchsorted(line_ends, token_starts), minlength=len(line_starts))[is_face]
+
+    # resolve to 0-based indices, negative ones are relative to the vertices read so far
+    vertices_before = vertex_offset + np.cumsum(is_vertex) - is_vertex
+    vertices_before = np.repeat(vertices_before[is_face], corner_counts)
+    corners = np.where(corners < 0, corners + vertices_before, corners - 1)
+
+    # fan triangulation of the polygons
+    first_corner = np.cumsum(corner_counts) - corner_counts
+    triangle_counts = np.maximum(corner_counts - 2, 0)
+    face_of_triangle = np.repeat(np.arange(len(corner_counts)), triangle_counts)
+    fan = np.arange(len(face_of_triangle)) - np.repeat(np.cumsum(triangle_counts) - triangle_counts, triangle_counts)
+    base = first_corner[face_of_triangle]
+    faces = np.stack((corners[base], corners[base + fan + 1], corners[base + fan + 2]), axis=1)
+    return vertices, faces.astype(np.int32), normals
+
+
+def load_obj(path: str, block_size: int = 1 << 22) -> ObjMesh:
+    """Stream an OBJ file in blocks of ``block_size`` bytes into a triangle mesh."""
+    vertices, faces, normals = [], [], []
+    num_vertices = 0
+    remainder = b""
+    with open(path, "rb") as f:
+        if f.read(len(_LFS_POINTER)) == _LFS_POINTER:
+            raise ValueError(f"'{path}' is a Git LFS pointer, fetch the mesh with 'git lfs pull'.")
+        f.seek(0)
+        while True:
+            data = f.read(block_size)
+            block = remainder + data
+            if data:
+                # parse up to the last complete line, carry the rest over
+                cut = block.rfind(b"\n") + 1
+                block, remainder = block[:cut], block[cut:]
+            elif block and not block.endswith(b"\n"):
+                block += b"\n"
+            if block:
+                block_vertices, block_faces, block_normals = _parse_block(block, num_vertices)
+                num_vertices += len(block_vertices)
+                vertices.append(block_vertices)
+                faces.append(block_faces)
+                normals.append(block_normals)
+            if not data:
+                break
+
+    mesh = ObjMesh(
+        vertices=np.concatenate(vertices) if vertices else np.empty((0, 3), dtype=np.float32),
+        faces=np.concatenate(faces) if faces else np.empty((0, 3), dtype=np.int32),
+        normals=np.concatenate(normals) if normals else np.empty((0, 3), dtype=np.float32),
+    )
+    if len(mesh.faces) > 0 and (mesh.faces.min() < 0 or mesh.faces.max() >= len(mesh.vertices)):
+        raise ValueError(f"'{path}' has face indices out of the range of its {len(mesh.vertices)} vertices.")
+    return mesh
+
+
+def weld_vertices(vertices: np.ndarray, faces: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge the vertices with identical positions, e.g. duplicated along UV seams."""
+    welded, inverse = np.unique(vertices, axis=0, return_inverse=True)
+    return welded, inverse.reshape(-1)[faces].astype(np.int32)
+
+
+def mesh_stats(mesh: ObjMesh) -> MeshStats:
+    """Bounds, triangle count, surface, volume and watertightness of the mesh."""
+    vertices, faces = weld_vertices(mesh.vertices, mesh.faces)
+    if len(vertices) == 0:
+        bounds_min = bounds_max = np.zeros(3)
+    else:
+        bounds_min, bounds_max = vertices.min(axis=0), vertices.max(axis=0)
+
+    v0, v1, v2 = (vertices[faces[:, i]].astype(np.float64) for i in range(3))
+    cross = np.cross(v1 - v0, v2 - v0)
+    surface_area = 0.5 * np.linalg.norm(cross, axis=1).sum()
+    # divergence theorem, sum of the signed tetrahedra spanned with the origin
+    volume = np.einsum("ij,ij->", v0, np.cross(v1, v2)) / 6.0
+
+    directed = np.concatenate((faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]))
+    _, undirected_counts = np.unique(np.sort(directed, axis=1), axis=0, return_counts=True)
+    _, directed_counts = np.unique(directed, axis=0, return_counts=True)
+
+    return MeshStats(
+        num_vertices=len(vertices),
+        num_triangles=len(faces),
+        bounds_min=bounds_min.tolist(),
+        bounds_max=bounds_max.tolist(),
+        extents=(bounds_max - bounds_min).tolist(),
+        surface_area=float(surface_area),
+        volume=float(volume),
+        watertight=bool(len(faces) > 0 and np.all(undirected_counts == 2)),
+        winding_consistent=bool(np.all(directed_counts == 1)),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Statistics of OBJ meshes, without Isaac Sim.")
+    parser.add_argument("input", type=str, nargs="+", help="The paths to the OBJ files.")
+    parser.add_argument("--json", action="store_true", default=False, help="Print the statistics as JSON.")
+    args = parser.parse_args()
+
+    stats = {path: asdict(mesh_stats(load_obj(path))) for path in args.input}
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return
+    for path, path_stats in stats.items():
+        print("-" * 80)
+        print(path)
+        for key, value in path_stats.items():
+            print(f"  {key:<20} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Preflight of the converted labware USDs with plain USD (``pxr``, e.g. ``pip install usd-core``), no Isaac Sim required.
+
+Every asset is composed on the CPU and walked including its instance proxies, which gives what one environment
+clone adds to the scene:
+
+- prims: real prims on the stage (instance proxies are not, they live once in the shared prototypes), and the
+  expanded count including the proxies
+- meshes and triangles, split into the geometry shared through the instance prototypes and the geometry copied
+  into every environment
+- colliders by approximation, and an upper bound of the convex hulls PhysX cooks for them (``convexHull`` is one,
+  ``convexDecomposition`` its ``maxConvexHulls``, 32 when not authored)
+
+An asset is flagged when its visual meshes are not instanced (``--make-instanceable`` missing or the
+``Props/instanceable_meshes.usd`` reference broken), when a layer or asset it references does not resolve, or
+when it exceeds the triangle, hull, prim or size limits. The totals are projected to ``--num_envs`` for every asset
+alone and for all assets assigned round-robin (``--multi_labware``). The memory is a rough estimate: the mesh
+arrays, the shared ones once, plus ``--prim_kb`` per stage prim and environment.
+
+python usd_preflight.py
+python usd_preflight.py beaker con_flask --num_envs 4096 --max-triangles 20000
+python usd_preflight.py beaker\\beaker.usd --json
+
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+import yaml
+from pxr import Usd, UsdGeom, UsdPhysics, UsdUtils
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+_LFS_POINTER = b"version https://git-lfs"
+# hulls of a convex decomposition without an authored maxConvexHulls (PhysX default)
+DEFAULT_MAX_CONVEX_HULLS = 32
+MAX_CONVEX_HULLS_ATTR = "physxConvexDecompositionCollision:maxConvexHulls"
+
+
+@dataclass
+class AssetReport:
+    """What one environment clone of an asset adds to the scene."""
+
+    name: str
+    usd_path: str
+    stage_prims: int = 0
+    """Prims on the stage, without the instance proxies."""
+    expanded_prims: int = 0
+    """Prims including the instance proxies."""
+    instances: int = 0
+    prototypes: int = 0
+    meshes: int = 0
+    instanced_meshes: int = 0
+    """Meshes reached through an instance, their geometry is shared by all environments."""
+    triangles: int = 0
+    """Triangles of all meshes of the clone, instanced or not."""
+    copied_triangles: int = 0
+    """Triangles of the meshes that are not instanced, copied into every environment."""
+    colliders: dict[str, int] = field(default_factory=dict)
+    """Collision prims by approximation (``none`` is a triangle mesh, ``shape`` a USD shape primitive)."""
+    max_hulls: int = 0
+    """Upper bound of the convex hulls cooked for the colliders."""
+    shared_bytes: int = 0
+    """Mesh arrays of the prototypes, loaded once."""
+    copied_bytes: int = 0
+    """Mesh arrays of the meshes that are not instanced, per environment."""
+    size: list[float] | None = None
+    """Bounding box size in meters with the spawn scale of ``labware.yaml``."""
+    issues: list[str] = field(default_factory=list)
+
+
+def _asset_paths(names: list[str], root: str) -> list[tuple[str, str, tuple[float, ...]]]:
+    """``(name, usd_path, spawn_scale)`` of the given asset names or USD files, all assets of ``root`` if empty."""
+    if not names:
+        names = sorted(
+            entry.name for entry in os.scandir(root)
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "config.yaml"))
+        )
+    assets = []
+    for name in names:
+        if name.lower().endswith((".usd", ".usda", ".usdc")):
+            assets.append((os.path.splitext(os.path.basename(name))[0], name, (1.0, 1.0, 1.0)))
+            continue
+        asset_dir = os.path.join(root, name)
+        if not os.path.exists(os.path.join(asset_dir, "config.yaml")):
+            raise ValueError(f"No converted asset '{name}' in {root}.")
+        with open(os.path.join(asset_dir, "config.yaml")) as f:
+            converter_cfg = yaml.load(f, Loader=yaml.FullLoader)
+        scale = (1.0, 1.0, 1.0)
+        sidecar_path = os.path.join(asset_dir, "labware.yaml")
+        if os.path.exists(sidecar_path):
+            with open(sidecar_path) as f:
+                scale = tuple((yaml.safe_load(f) or {}).get("scale", scale))
+        assets.append((name, os.path.join(asset_dir, converter_cfg["usd_file_name"]), scale))
+    return assets
+
+
+def _mesh_bytes(mesh: UsdGeom.Mesh) -> tuple[int, int]:
+    """Triangles and bytes of the point, normal and index arrays of a mesh."""
+    counts = np.asarray(mesh.GetFaceVertexCountsAttr().Get() or [], dtype=np.int64)
+    num_points = len(mesh.GetPointsAttr().Get() or [])
+    num_normals = len(mesh.GetNormalsAttr().Get() or [])
+    triangles = int(np.maximum(counts - 2, 0).sum())
+    return triangles, 12 * (num_points + num_normals) + 4 * (len(counts) + int(counts.sum()))
+
+
+def _collider(prim: Usd.Prim) -> tuple[str, int]:
+    """Approximation of a collision prim and the most convex hulls PhysX cooks for it."""
+    if not prim.IsA(UsdGeom.Mesh):
+        return "shape", 0
+    approximation = "none"
+    if prim.HasAPI(UsdPhysics.MeshCollisionAPI):
+        approximation = UsdPhysics.MeshCollisionAPI(prim).GetApproximationAttr().Get() or "none"
+    if approximation == UsdPhysics.Tokens.convexHull:
+        return approximation, 1
+    if approximation == UsdPhysics.Tokens.convexDecomposition:
+        max_hulls = prim.GetAttribute(MAX_CONVEX_HULLS_ATTR).Get() if prim.HasAttribute(MAX_CONVEX_HULLS_ATTR) else None
+        return approximation, int(max_hulls or DEFAULT_MAX_CONVEX_HULLS)
+    return approximation, 0
+
+
+def inspect_asset(name: str, usd_path: str, scale: tuple[float, ...] = (1.0, 1.0, 1.0)) -> AssetReport:
+    """Compose the asset and count what one environment clone of it adds."""
+    report = AssetReport(name=name, usd_path=usd_path)
+    if not os.path.exists(usd_path):
+        report.issues.append(f"USD file not found: {usd_path}")
+        return report
+    with open(usd_path, "rb") as f:
+        if f.read(len(_LFS_POINTER)) == _LFS_POINTER:
+            report.issues.append("the USD is a Git LFS pointer, fetch it with 'git lfs pull'")
+            return report
+
+    _, _, unresolved = UsdUtils.ComputeAllDependencies(usd_path)
+    for path in unresolved:
+        report.issues.append(f"unresolved reference: {path}")
+    stage = Usd.Stage.Open(usd_path, Usd.Stage.LoadAll)
+    report.prototypes = len(stage.GetPrototypes())
+
+    shared_meshes = set()
+    copied_visual_meshes = 0
+    for prim in Usd.PrimRange.Stage(stage, Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)):
+        report.expanded_prims += 1
+        is_proxy = prim.IsInstanceProxy()
+        if not is_proxy:
+            report.stage_prims += 1
+        if prim.IsInstance():
+            report.instances += 1
+
+        if prim.IsA(UsdGeom.Mesh):
+            triangles, nbytes = _mesh_bytes(UsdGeom.Mesh(prim))
+            report.meshes += 1
+            report.triangles += triangles
+            if is_proxy:
+                report.instanced_meshes += 1
+                # a prototype shared by several instances is loaded once
+                prototype_path = prim.GetPrimInPrototype().GetPath()
+                if prototype_path not in shared_meshes:
+                    shared_meshes.add(prototype_path)
+                    report.shared_bytes += nbytes
+            else:
+                report.copied_triangles += triangles
+                report.copied_bytes += nbytes
+                # the precomputed hull colliders are guides, only visual geometry should be instanced
+                if UsdGeom.Imageable(prim).ComputePurpose() != UsdGeom.Tokens.guide:
+                    copied_visual_meshes += 1
+
+        if prim.HasAPI(UsdPhysics.CollisionAPI):
+            approximation, hulls = _collider(prim)
+            report.colliders[approximation] = report.colliders.get(approximation, 0) + 1
+            report.max_hulls += hulls
+
+    if copied_visual_meshes > 0:
+        report.issues.append(
+            f"{copied_visual_meshes} visual meshes ({report.copied_triangles} triangles) are not instanced and are"
+            " copied into every environment, convert with --make-instanceable"
+        )
+
+    bounds = UsdGeom.BBoxCache(Usd.TimeCode.Default(), [UsdGeom.Tokens.default_, UsdGeom.Tokens.render])
+    box = bounds.ComputeWorldBound(stage.GetPseudoRoot()).ComputeAlignedRange()
+    if not box.IsEmpty():
+        meters_per_unit = UsdGeom.GetStageMetersPerUnit(stage)
+        report.size = [float(s * k * meters_per_unit) for s, k in zip(box.GetSize(), scale)]
+    return report
+
+
+def check_limits(
+    report: AssetReport, max_triangles: int, max_hulls: int, max_prims: int, max_size: float
+) -> list[str]:
+    """Limits the asset exceeds, also added to its issues."""
+    issues = []
+    if report.triangles > max_triangles:
+        issues.append(f"{report.triangles} triangles, more than {max_triangles}")
+    if report.max_hulls > max_hulls:
+        issues.append(f"up to {report.max_hulls} convex hulls, more than {max_hulls}")
+    if report.stage_prims > max_prims:
+        issues.append(f"{report.stage_prims} stage prims per environment, more than {max_prims}")
+    if report.size is not None and max(report.size) > max_size:
+        issues.append(f"{max(report.size):.2f} m across, more than {max_size} m (check the spawn scale)")
+    report.issues += issues
+    return issues
+
+
+def project(reports: list[AssetReport], counts: list[int], prim_kb: float) -> dict[str, float]:
+    """Scene totals with ``counts[i]`` environments of ``reports[i]``."""
+    used = [(report, count) for report, count in zip(reports, counts) if count > 0]
+    stage_prims = sum(report.stage_prims * count for report, count in used)
+    nbytes = sum(report.shared_bytes + report.copied_bytes * count for report, count in used)
+    return {
+        "num_envs": sum(counts),
+        "stage_prims": stage_prims,
+        "expanded_prims": sum(report.expanded_prims * count for report, count in used),
+        "triangles": sum(report.triangles * count for report, count in used),
+        "max_hulls": sum(report.max_hulls * count for report, count in used),
+        "memory_mb": (nbytes + stage_prims * prim_kb * 1024) / 2**20,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the labware USDs and project their cost, without Isaac Sim.")
+    parser.add_argument("assets", type=str, nargs="*", help="Asset names in this directory or USD files, all by default.")
+    parser.add_argument("--num_envs", type=int, default=1024, help="Number of environments of the projection.")
+    parser.add_argument("--max-triangles", type=int, default=50000, help="Triangles per asset before it is flagged.")
+    parser.add_argument("--max-hulls", type=int, default=64, help="Convex hulls per asset before it is flagged.")
+    parser.add_argument("--max-prims", type=int, default=100, help="Stage prims per asset before it is flagged.")
+    parser.add_argument("--max-size", type=float, default=0.5, help="Size [m] before the asset is flagged.")
+    parser.add_argument("--prim_kb", type=float, default=2.0, help="Estimated memory per stage prim [KB].")
+    parser.add_argument("--json", action="store_true", default=False, help="Print the reports as JSON.")
+    args = parser.parse_args()
+
+    reports = []
+    for name, usd_path, scale in _asset_paths(args.assets, ASSETS_DIR):
+        report = inspect_asset(name, usd_path, scale)
+        if report.expanded_prims > 0:
+            check_limits(report, args.max_triangles, args.max_hulls, args.max_prims, args.max_size)
+        reports.append(report)
+
+    # every asset alone, and all of them round-robin like --multi_labware
+    projections = {
+        report.name: project([report], [args.num_envs], args.prim_kb) for report in reports if report.expanded_prims
+    }
+    valid = [report for report in reports if report.expanded_prims]
+    if len(valid) > 1:
+        counts = [args.num_envs // len(valid) + (i < args.num_envs % len(valid)) for i in range(len(valid))]
+        projections["round-robin"] = project(valid, counts, args.prim_kb)
+
+    if args.json:
+        print(json.dumps({"assets": [asdict(r) for r in reports], "projections": projections}, indent=2))
+        return int(any(report.issues for report in reports))
+
+    header = (
+        f"{'asset':<12} {'prims':>6} {'expanded':>9} {'instanced':>10} {'triangles':>10} {'copied':>8}"
+        f" {'colliders':>10} {'hulls':>6} {'size [m]':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for report in reports:
+        size = f"{max(report.size):.3f}" if report.size is not None else "-"
+        print(
+            f"{report.name:<12} {report.stage_prims:>6} {report.expanded_prims:>9}"
+            f" {f'{report.instanced_meshes}/{report.meshes}':>10} {report.triangles:>10} {report.copied_triangles:>8}"
+            f" {sum(report.colliders.values()):>10} {report.max_hulls:>6} {size:>9}"
+        )
+    print()
+    header = (
+        f"{f'{args.num_envs} envs':<12} {'prims':>10} {'expanded':>10} {'triangles':>12} {'hulls':>9} {'memory [MB]':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, row in projections.items():
+        print(
+            f"{name:<12} {row['stage_prims']:>10} {row['expanded_prims']:>10} {row['triangles']:>12}"
+            f" {row['max_hulls']:>9} {row['memory_mb']:>12.1f}"
+        )
+    for report in reports:
+        for issue in report.issues:
+            print(f"[{report.name}] {issue}")
+    return int(any(report.issues for report in reports))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+CPU microbenchmark of the action assembly, :func:`pre_process_actions` against :class:`ActionBuffer`.
+
+Runs without Isaac Sim:
+
+python .\\bench_actions.py
+python .\\bench_actions.py --num_envs 1 64 4096 --steps 20000
+
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import torch
+
+from actions import ActionBuffer, pre_process_actions
+
+parser = argparse.ArgumentParser(description="Microbenchmark of the teleop action assembly.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1, 16, 256, 4096], help="Numbers of environments.")
+parser.add_argument("--steps", type=int, default=10000, help="Number of assembled actions per measurement.")
+parser.add_argument("--repeat", type=int, default=5, help="Number of measurements, the best one is reported.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device of the actions.")
+
+
+def main():
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    delta_pose = rng.uniform(-0.1, 0.1, size=6)
+
+    print(f"{'num_envs':>10} {'pre_process_actions [us]':>26} {'ActionBuffer [us]':>19} {'speedup':>8}")
+    for num_envs in args.num_envs:
+        action_buffer = ActionBuffer(num_envs, args.device)
+        # both produce the same actions
+        teleop_data = (delta_pose, True)
+        torch.testing.assert_close(action_buffer(teleop_data), pre_process_actions(teleop_data, num_envs, args.device))
+
+        baseline = min(timeit.repeat(
+            lambda: pre_process_actions(teleop_data, num_envs, args.device), number=args.steps, repeat=args.repeat
+        ))
+        buffered = min(timeit.repeat(lambda: action_buffer(teleop_data), number=args.steps, repeat=args.repeat))
+        baseline_us = 1e6 * baseline / args.steps
+        buffered_us = 1e6 * buffered / args.steps
+        print(f"{num_envs:>10} {baseline_us:>26.2f} {buffered_us:>19.2f} {baseline_us / buffered_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
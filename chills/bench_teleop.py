@@ -0,0 +1,121 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Headless CPU benchmark of the teleop step loop of ``object_override.py``, without Isaac Sim.
+
+Runs the loop ``advance()`` -> action assembly -> ``env.step`` (-> recording) against a stub environment
+and a scripted teleop device, and reports the latency percentiles of every stage and the steps per second
+for each ``--num_envs``. The physics is a stub, so this measures the Chills host side only.
+
+python .\\bench_teleop.py
+python .\\bench_teleop.py --num_envs 1 256 4096 --steps 2000 --record
+python .\\bench_teleop.py --legacy_actions
+python .\\bench_teleop.py --async_input
+
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import torch
+
+from actions import ActionBuffer, pre_process_actions
+from stub_env import StubEnv, StubTeleop
+
+parser = argparse.ArgumentParser(description="Benchmark of the teleop step loop against a stub environment.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1, 16, 256, 4096], help="Numbers of environments.")
+parser.add_argument("--steps", type=int, default=1000, help="Number of measured steps.")
+parser.add_argument("--warmup", type=int, default=50, help="Number of steps before measuring.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device of the stub environment.")
+parser.add_argument("--record", action="store_true", default=False, help="Also record the steps to HDF5.")
+parser.add_argument(
+    "--legacy_actions", action="store_true", default=False, help="Assemble with pre_process_actions."
+)
+parser.add_argument(
+    "--async_input", action="store_true", default=False, help="Read the teleop device on its own thread."
+)
+parser.add_argument(
+    "--termination_prob", type=float, default=0.01, help="Per step termination probability of the stub environment."
+)
+
+PERCENTILES = (50, 90, 99)
+
+
+def run(num_envs: int, args) -> tuple[float, dict[str, np.ndarray]]:
+    """Run the loop, returns the steps per second and the per step latency of every stage in seconds."""
+    env = StubEnv(num_envs, args.device, termination_prob=args.termination_prob)
+    teleop_interface = StubTeleop()
+    if args.async_input:
+        from teleop_input import AsyncTeleop
+
+        teleop_interface = AsyncTeleop(teleop_interface)
+    action_buffer = ActionBuffer(num_envs, args.device)
+    stages = ["advance", "actions", "step"]
+
+    recorder = None
+    if args.record:
+        from recorder import EpisodeRecorder
+
+        stages.append("record")
+        record_dir = tempfile.mkdtemp()
+        recorder = EpisodeRecorder(os.path.join(record_dir, "bench.hdf5"), num_envs)
+
+    timings = {stage: np.zeros(args.steps) for stage in stages}
+    obs, _ = env.reset()
+    teleop_interface.reset()
+    with torch.inference_mode():
+        for i in range(-args.warmup, args.steps):
+            t0 = time.perf_counter()
+            teleop_data = teleop_interface.advance()
+            t1 = time.perf_counter()
+            if args.legacy_actions:
+                actions = pre_process_actions(teleop_data, num_envs, args.device)
+            else:
+                actions = action_buffer(teleop_data)
+            t2 = time.perf_counter()
+            next_obs, rewards, terminated, truncated, _ = env.step(actions)
+            t3 = time.perf_counter()
+            if recorder is not None:
+                recorder.add_step(obs, actions, rewards)
+                dones = terminated | truncated
+                if dones.any():
+                    recorder.end_episode(dones.nonzero().flatten(), success=terminated[dones])
+            t4 = time.perf_counter()
+            obs = next_obs
+            if i >= 0:
+                timings["advance"][i] = t1 - t0
+                timings["actions"][i] = t2 - t1
+                timings["step"][i] = t3 - t2
+                if recorder is not None:
+                    timings["record"][i] = t4 - t3
+
+    total = sum(timings.values())
+    if recorder is not None:
+        recorder.close()
+    if args.async_input:
+        teleop_interface.close()
+    return args.steps / total.sum(), timings
+
+
+def main():
+    args = parser.parse_args()
+
+    header = f"{'num_envs':>10} {'steps/s':>10}  {'stage':<8}" + "".join(f" {f'p{p} [us]':>10}" for p in PERCENTILES)
+    print(header)
+    print("-" * len(header))
+    for num_envs in args.num_envs:
+        steps_per_second, timings = run(num_envs, args)
+        for i, (stage, latency) in enumerate(timings.items()):
+            prefix = f"{num_envs:>10} {steps_per_second:>10.0f}" if i == 0 else " " * 21
+            percentiles = np.percentile(latency * 1e6, PERCENTILES)
+            print(f"{prefix}  {stage:<8}" + "".join(f" {value:>10.1f}" for value in percentiles))
+
+
+if __name__ == "__main__":
+    main()
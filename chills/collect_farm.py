@@ -0,0 +1,266 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Multi-process data-collection farm, one simulator per worker process, one dataset shard per worker.
+
+The parent launches ``--workers`` copies of ``object_override.py --teleop_device scripted`` (or of the CPU
+``stub_collect.py`` with ``--stub``), each with its own labware subset, seed and shard. It aggregates the
+progress the workers write, restarts crashed workers for their remaining episodes into a new shard, and
+writes ``index.json`` listing the readable shards with their demo counts at the end.
+
+python .\\collect_farm.py --workers 4 --num_envs 64 --episodes 10000 --output_dir farm -- --task Isaac-Lift-Cube-Franka-IK-Rel-v0
+python .\\collect_farm.py --workers 8 --num_envs 16 --episodes 2000 --output_dir farm_stub --stub
+
+Arguments after ``--`` are passed to every worker.
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import h5py
+
+from labware import Labwear
+from startup import is_converted
+
+CHILLS_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_FILE = "index.json"
+
+
+def write_progress(path: str, **progress):
+    """Atomically replace the JSON progress file of a worker."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({**progress, "time": time.time()}, f)
+    os.replace(tmp_path, path)
+
+
+def read_progress(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class ProgressWriter:
+    """Episode, success and step counts of a worker, written at most every ``interval`` seconds."""
+
+    def __init__(self, path: str | None, interval: float = 1.0):
+        self.path = path
+        self.interval = interval
+        self.episodes = 0
+        self.successes = 0
+        self.steps = 0
+        self._last_write = 0.0
+
+    def update(self, episodes: int = 0, successes: int = 0, steps: int = 0, force: bool = False):
+        self.episodes += episodes
+        self.successes += successes
+        self.steps += steps
+        now = time.perf_counter()
+        if self.path is not None and (force or now - self._last_write >= self.interval):
+            write_progress(self.path, episodes=self.episodes, successes=self.successes, steps=self.steps)
+            self._last_write = now
+
+
+def split_labware(names: list[str], num_workers: int) -> list[list[str]]:
+    """Round-robin labware subset of every worker, with more workers than labware they share one each."""
+    return [names[k::num_workers] or [names[k % len(names)]] for k in range(num_workers)]
+
+
+def shard_info(path: str) -> dict:
+    """Demo, sample and success counts of the finished episodes of a shard, ``{}`` if it is unreadable."""
+    try:
+        with h5py.File(path, "r") as f:
+            demos = [demo for demo in f["data"].values() if "success" in demo.attrs]
+            return {
+                "env_name": f["data"].attrs.get("env_name", ""),
+                "num_demos": len(demos),
+                "num_samples": int(sum(demo.attrs["num_samples"] for demo in demos)),
+                "num_success": int(sum(bool(demo.attrs["success"]) for demo in demos)),
+            }
+    except (OSError, KeyError):
+        return {}
+
+
+class Worker:
+    """One worker slot of the farm, relaunched on crashes."""
+
+    def __init__(self, worker_id: int, labware: list[str], episodes: int, seed: int, args):
+        self.worker_id = worker_id
+        self.labware = labware
+        self.episodes = episodes
+        self.seed = seed
+        self.args = args
+        self.attempt = -1
+        self.process: subprocess.Popen | None = None
+        self.shards: list[dict] = []
+        self.done_episodes = 0
+        self.failed = False
+
+    @property
+    def name(self) -> str:
+        return f"shard_{self.worker_id:03d}_{self.attempt}"
+
+    @property
+    def progress_path(self) -> str:
+        return os.path.join(self.args.output_dir, f"{self.name}.progress.json")
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None
+
+    def progress(self) -> dict:
+        """Counts of the finished attempts plus the current one."""
+        current = read_progress(self.progress_path) if self.running else {}
+        return {
+            key: sum(shard.get(key, 0) for shard in self.shards) + current.get(key, 0)
+            for key in ("episodes", "successes", "steps")
+        }
+
+    def launch(self):
+        self.attempt += 1
+        output = os.path.join(self.args.output_dir, f"{self.name}.hdf5")
+        script = "stub_collect.py" if self.args.stub else "object_override.py"
+        cmd = [sys.executable, os.path.join(CHILLS_DIR, script)]
+        cmd += ["--num_envs", str(self.args.num_envs), "--multi_labware", *self.labware]
+        cmd += ["--output", output, "--progress", self.progress_path]
+        cmd += ["--seed", str(self.seed + self.attempt), "--max_episodes", str(self.episodes - self.done_episodes)]
+        if not self.args.stub:
+            cmd += ["--teleop_device", "scripted", "--headless"]
+        cmd += self.args.worker_args
+        log = open(os.path.join(self.args.output_dir, f"{self.name}.log"), "w")
+        self.process = subprocess.Popen(cmd, cwd=CHILLS_DIR, stdout=log, stderr=subprocess.STDOUT)
+        log.close()
+        self.shards.append(
+            {
+                "path": os.path.basename(output),
+                "worker": self.worker_id,
+                "attempt": self.attempt,
+                "seed": self.seed + self.attempt,
+                "labware": self.labware,
+            }
+        )
+
+    def poll(self):
+        """Check the process, restart it after a crash, returns whether it is still working."""
+        if self.process is None:
+            return False
+        returncode = self.process.poll()
+        if returncode is None:
+            return True
+        self._finish(returncode)
+        if returncode != 0:
+            if self.attempt < self.args.max_restarts and self.done_episodes < self.episodes:
+                print(f"[farm] worker {self.worker_id} exited with {returncode}, restarting ({self.attempt + 1})")
+                self.launch()
+                return True
+            self.failed = True
+        return False
+
+    def terminate(self):
+        if self.process is not None:
+            self.process.terminate()
+            self._finish(self.process.wait())
+
+    def _finish(self, returncode: int):
+        progress = read_progress(self.progress_path)
+        progress.pop("time", None)
+        # the demos that made it into the shard count, not the last reported progress
+        info = shard_info(os.path.join(self.args.output_dir, self.shards[-1]["path"]))
+        progress["episodes"] = info.get("num_demos", 0)
+        self.shards[-1].update(returncode=returncode, **progress)
+        self.done_episodes += progress["episodes"]
+        self.process = None
+
+
+def write_index(output_dir: str, workers: list[Worker]) -> dict:
+    """Write ``index.json`` with the readable shards of all workers."""
+    shards, unreadable = [], []
+    for worker in workers:
+        for shard in worker.shards:
+            info = shard_info(os.path.join(output_dir, shard["path"]))
+            if not info or info["num_demos"] == 0:
+                unreadable.append(shard["path"])
+                continue
+            shards.append({**shard, **info})
+    index = {
+        "shards": shards,
+        "num_demos": sum(shard["num_demos"] for shard in shards),
+        "num_samples": sum(shard["num_samples"] for shard in shards),
+        "num_success": sum(shard["num_success"] for shard in shards),
+        "skipped": unreadable,
+    }
+    with open(os.path.join(output_dir, INDEX_FILE), "w") as f:
+        json.dump(index, f, indent=2)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run several data-collection processes into dataset shards.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes, each runs its own Isaac Sim.")
+    parser.add_argument("--num_envs", type=int, default=16, help="Number of environments per worker.")
+    parser.add_argument("--episodes", type=int, default=1000, help="Total number of episodes to collect.")
+    parser.add_argument("--labware", type=str, nargs="*", default=None, help="Labware to collect (all by default).")
+    parser.add_argument("--output_dir", type=str, default="farm", help="Directory of the shards and index.")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed, worker k uses seed + 1000 * k.")
+    parser.add_argument("--max_restarts", type=int, default=3, help="Restarts of a crashed worker.")
+    parser.add_argument("--poll", type=float, default=2.0, help="Seconds between progress reports.")
+    parser.add_argument("--stub", action="store_true", default=False, help="Collect from the CPU stub env.")
+    args, worker_args = parser.parse_known_args()
+    args.worker_args = [arg for arg in worker_args if arg != "--"]
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # the simulator workers need the converted labware, the stub spawns none
+    names = args.labware or [name for name in Labwear if args.stub or is_converted(name)]
+    subsets = split_labware(names, args.workers)
+    workers = []
+    for k in range(args.workers):
+        # the remainder of the episodes goes to the first workers
+        episodes = args.episodes // args.workers + (k < args.episodes % args.workers)
+        workers.append(Worker(k, subsets[k], episodes, args.seed + 1000 * k, args))
+    for worker in workers:
+        if worker.episodes > 0:
+            worker.launch()
+
+    start_time = time.perf_counter()
+    try:
+        while True:
+            running = [worker.poll() for worker in workers]
+            progress = [worker.progress() for worker in workers]
+            episodes = sum(p["episodes"] for p in progress)
+            steps = sum(p["steps"] for p in progress)
+            elapsed = time.perf_counter() - start_time
+            print(
+                f"[farm] {episodes}/{args.episodes} episodes, {steps} steps, {episodes / elapsed:.1f} episodes/s,"
+                f" {sum(running)} running, {sum(worker.attempt for worker in workers if worker.attempt > 0)} restarts"
+            )
+            if not any(running):
+                break
+            time.sleep(args.poll)
+    except KeyboardInterrupt:
+        print("[farm] interrupted, stopping the workers")
+        for worker in workers:
+            worker.terminate()
+
+    index = write_index(args.output_dir, workers)
+    print(
+        f"[farm] {index['num_demos']} demos ({index['num_success']} successful) in {len(index['shards'])} shards,"
+        f" index: {os.path.join(args.output_dir, INDEX_FILE)}"
+    )
+    failed = [worker.worker_id for worker in workers if worker.failed]
+    if failed:
+        print(f"[farm] workers {failed} failed after {args.max_restarts} restarts, see their logs")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compaction of recorded teleop episodes: idle-frame run-length encoding and quantized delta encoding.
+
+While the operator pauses the device sends zero delta poses and the scene settles, so long sessions are
+mostly repeated frames. A compacted episode keeps:
+
+- the float streams quantized to multiples of ``step``, as integer deltas along time in the smallest integer
+  type that fits, so the gzip filter sees small, repetitive values. Quantization and expansion run in float64,
+  the error is at most ``step / 2`` plus the rounding back to the stream dtype, half an ulp of the value
+  (:func:`error_bound`, e.g. 3.8e-6 at 100 in float32)
+- only the frames that differ from the previous one after quantization, ``run_lengths`` holds how often each
+  kept frame repeats
+
+:func:`read_key` expands a compacted dataset back to the original ``(num_samples, ...)`` timeline, and reads
+plain recordings unchanged, so the readers (``demo_dataset.py``, ``metrics.py``) take both.
+
+    data/demo_k/            attrs: ..., compacted
+        run_lengths         (K,)
+        actions             (K, 7) int8/16/32/64 deltas, attrs: quant_step, dtype
+
+python .\\compaction.py demos.hdf5 demos_compact.hdf5 --step 1e-4
+python .\\compaction.py demos_compact.hdf5 demos_expanded.hdf5 --expand
+
+"""
+
+import argparse
+import os
+
+import h5py
+import numpy as np
+
+RUN_LENGTHS = "run_lengths"
+INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def demo_keys(demo: h5py.Group) -> list[str]:
+    """Recorded streams of an episode (``actions``, ``rewards``, ``obs/<group>/<term>``)."""
+    keys = []
+    demo.visititems(lambda name, item: keys.append(name) if isinstance(item, h5py.Dataset) else None)
+    return sorted(key for key in keys if key != RUN_LENGTHS)
+
+
+def key_layout(demo: h5py.Group, key: str) -> tuple[tuple[int, ...], np.dtype]:
+    """Per-step shape and dtype of a stream as read by :func:`read_key`."""
+    dataset = demo[key]
+    return dataset.shape[1:], np.dtype(dataset.attrs.get("dtype", dataset.dtype.str))
+
+
+def read_key(demo: h5py.Group, key: str) -> np.ndarray:
+    """Stream ``(num_samples, ...)`` of an episode, expanded if it is compacted."""
+    dataset = demo[key]
+    if not demo.attrs.get("compacted", False):
+        return dataset[()]
+    values = dataset[()]
+    step = dataset.attrs["quant_step"]
+    if step > 0:
+        values = np.cumsum(values, axis=0, dtype=np.int64) * step
+    values = values.astype(dataset.attrs["dtype"])
+    return np.repeat(values, demo[RUN_LENGTHS][()], axis=0)
+
+
+def _smallest_int(values: np.ndarray) -> np.dtype:
+    if values.size == 0:
+        return np.dtype(np.int8)
+    low, high = values.min(), values.max()
+    for int_type in INT_TYPES:
+        info = np.iinfo(int_type)
+        if info.min <= low and high <= info.max:
+            return np.dtype(int_type)
+    return np.dtype(np.int64)
+
+
+def compact_episode(
+    streams: dict[str, np.ndarray], step: float = 1e-4, raw_keys: tuple[str, ...] = ()
+) -> tuple[dict[str, tuple[np.ndarray, float, str]], np.ndarray]:
+    """Compact the ``(T, ...)`` streams of one episode.
+
+    Args:
+        streams: Streams of the episode by key.
+        step: Quantization step of the float streams, 0 keeps them exact.
+        raw_keys: Float streams kept exact.
+
+    Returns:
+        The encoded ``(values, quant_step, dtype)`` of every key for the kept frames, and the run lengths.
+    """
+    quantized = {}
+    for key, values in streams.items():
+        quant_step = step if np.issubdtype(values.dtype, np.floating) and key not in raw_keys else 0.0
+        encoded = np.rint(values.astype(np.float64) / quant_step).astype(np.int64) if quant_step > 0 else values
+        quantized[key] = (encoded, quant_step, values.dtype.str)
+
+    # a frame is kept if any stream differs from the previous frame
+    length = len(next(iter(streams.values())))
+    keep = np.zeros(length, dtype=bool)
+    keep[:1] = True
+    for encoded, _, _ in quantized.values():
+        if length > 1:
+            keep[1:] |= (encoded[1:] != encoded[:-1]).reshape(length - 1, -1).any(axis=1)
+    kept = np.flatnonzero(keep)
+    run_lengths = np.diff(np.append(kept, length))
+
+    compacted = {}
+    for key, (encoded, quant_step, dtype) in quantized.items():
+        encoded = encoded[kept]
+        if quant_step > 0:
+            encoded = np.diff(encoded, axis=0, prepend=np.zeros_like(encoded[:1]))
+            encoded = encoded.astype(_smallest_int(encoded))
+        compacted[key] = (encoded, quant_step, dtype)
+    return compacted, run_lengths.astype(_smallest_int(run_lengths))
+
+
+def _copy_attrs(source: h5py.AttributeManager, target: h5py.AttributeManager):
+    for name, value in source.items():
+        target[name] = value
+
+
+def compact_file(
+    source: str, target: str, step: float = 1e-4, raw_keys: tuple[str, ...] = (), compression: str | None = "gzip"
+):
+    """Write the compacted copy of a recording."""
+    with h5py.File(source, "r") as f_in, h5py.File(target, "w") as f_out:
+        data = f_out.create_group("data")
+        _copy_attrs(f_in["data"].attrs, data.attrs)
+        for name, demo in f_in["data"].items():
+            group = data.create_group(name)
+            _copy_attrs(demo.attrs, group.attrs)
+            streams = {key: read_key(demo, key) for key in demo_keys(demo)}
+            compacted, run_lengths = compact_episode(streams, step, raw_keys)
+            group.attrs["compacted"] = True
+            group.create_dataset(RUN_LENGTHS, data=run_lengths, compression=compression)
+            for key, (values, quant_step, dtype) in compacted.items():
+                dataset = group.create_dataset(key, data=values, compression=compression, shuffle=compression is not None)
+                dataset.attrs["quant_step"] = quant_step
+                dataset.attrs["dtype"] = dtype
+
+
+def expand_file(source: str, target: str, compression: str | None = "gzip"):
+    """Write the expanded, plain copy of a compacted recording."""
+    with h5py.File(source, "r") as f_in, h5py.File(target, "w") as f_out:
+        data = f_out.create_group("data")
+        _copy_attrs(f_in["data"].attrs, data.attrs)
+        for name, demo in f_in["data"].items():
+            group = data.create_group(name)
+            _copy_attrs(demo.attrs, group.attrs)
+            if "compacted" in group.attrs:
+                del group.attrs["compacted"]
+            for key in demo_keys(demo):
+                group.create_dataset(key, data=read_key(demo, key), compression=compression)
+
+
+def max_error(original: str, compacted: str) -> float:
+    """Largest absolute difference between the streams of a recording and its compacted copy."""
+    error = 0.0
+    with h5py.File(original, "r") as f_a, h5py.File(compacted, "r") as f_b:
+        for name, demo in f_a["data"].items():
+            for key in demo_keys(demo):
+                a, b = read_key(demo, key), read_key(f_b["data"][name], key)
+                if a.shape != b.shape:
+                    raise ValueError(f"'{name}/{key}' expanded to {b.shape}, expected {a.shape}.")
+                if a.size:
+                    error = max(error, float(np.abs(a.astype(np.float64) - b.astype(np.float64)).max()))
+    return error
+
+
+def error_bound(original: str, step: float, raw_keys: tuple[str, ...] = ()) -> float:
+    """Largest error :func:`compact_file` may introduce, ``step / 2`` plus half an ulp of the largest value."""
+    rounding = 0.0
+    with h5py.File(original, "r") as f:
+        for demo in f["data"].values():
+            for key in demo_keys(demo):
+                values = read_key(demo, key)
+                if np.issubdtype(values.dtype, np.floating) and key not in raw_keys and values.size:
+                    # the expanded value is up to step / 2 larger than the original one
+                    largest = np.asarray(np.abs(values).max() + step / 2, dtype=values.dtype)
+                    rounding = max(rounding, float(np.spacing(largest)) / 2)
+    return step / 2 + rounding
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact (or expand) a recording of object_override.py.")
+    parser.add_argument("source", type=str, help="Input HDF5 recording.")
+    parser.add_argument("target", type=str, help="Output HDF5 file.")
+    parser.add_argument("--step", type=float, default=1e-4, help="Quantization step of the float streams.")
+    parser.add_argument("--raw", type=str, nargs="*", default=[], help="Float streams kept exact, e.g. rewards.")
+    parser.add_argument("--expand", action="store_true", default=False, help="Expand a compacted recording.")
+    args = parser.parse_args()
+
+    if args.expand:
+        expand_file(args.source, args.target)
+    else:
+        compact_file(args.source, args.target, args.step, tuple(args.raw))
+        bound = error_bound(args.source, args.step, tuple(args.raw))
+        print(f"max error: {max_error(args.source, args.target):.3g} (bound {bound:.3g})")
+    source_size, target_size = os.path.getsize(args.source), os.path.getsize(args.target)
+    print(f"{source_size / 2**20:.2f} MB -> {target_size / 2**20:.2f} MB ({source_size / target_size:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Memory-mapped windows of recorded teleop demos for training with a torch ``DataLoader``.
+
+The recorder writes chunked, gzip compressed HDF5 shards, which cannot be memory-mapped. The finished
+episodes of all shards are therefore converted once into a cache directory with one flat ``.npy`` file
+per key (all episodes concatenated along time) and a ``meta.json`` with the episode table:
+
+    cache/
+        meta.json           sources, keys, episodes (shard, demo, start, length, success)
+        actions.npy         (total_steps, 7)
+        rewards.npy         (total_steps,)
+        obs__policy.npy     (total_steps, 35)
+
+Compacted shards (``compaction.py``) are expanded on conversion. The cache is rebuilt when a source shard
+changes. Every sample is a window of ``window`` consecutive steps within one episode, read as a slice of the
+memory-maps. The memory-maps are opened lazily in each process, so the dataset is safe to use with
+``DataLoader`` workers (fork or spawn).
+
+python .\\demo_dataset.py farm\\index.json --cache farm\\cache --window 16 --batch_size 256 --num_workers 4
+
+"""
+
+import argparse
+import json
+import os
+import time
+
+import h5py
+import numpy as np
+import torch
+from torch.utils.data import DataLoader, Dataset
+
+from compaction import demo_keys, key_layout, read_key
+
+META_FILE = "meta.json"
+
+
+def _source_shards(sources: list[str]) -> list[str]:
+    """HDF5 shards of the sources, a ``collect_farm.py`` ``index.json`` expands to its shards."""
+    shards = []
+    for source in sources:
+        if source.endswith(".json"):
+            with open(source) as f:
+                index = json.load(f)
+            shards += [os.path.join(os.path.dirname(source), shard["path"]) for shard in index["shards"]]
+        else:
+            shards.append(source)
+    return [os.path.abspath(shard) for shard in shards]
+
+
+def _stamp(path: str) -> list:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _cache_file(key: str) -> str:
+    return key.replace("/", "__") + ".npy"
+
+
+def build_cache(sources: list[str], cache_dir: str, rebuild: bool = False) -> dict:
+    """Convert the finished episodes of the shards into the memory-mappable cache, returns its metadata.
+
+    Nothing is done if the cache already holds the same, unchanged shards.
+    """
+    shards = _source_shards(sources)
+    stamps = {shard: _stamp(shard) for shard in shards}
+    meta_path = os.path.join(cache_dir, META_FILE)
+    if not rebuild and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta["sources"] == stamps:
+            return meta
+
+    # first pass: episode table, and shape and dtype of every key
+    episodes, layout = [], {}
+    total = 0
+    for shard_id, shard in enumerate(shards):
+        with h5py.File(shard, "r") as f:
+            for name, demo in f["data"].items():
+                if "success" not in demo.attrs:
+                    continue
+                length = int(demo.attrs["num_samples"])
+                for key in demo_keys(demo):
+                    shape, dtype = key_layout(demo, key)
+                    layout.setdefault(key, (shape, dtype.str))
+                    if (shape, dtype.str) != layout[key]:
+                        raise ValueError(f"'{shard}/{name}/{key}' does not match the layout {layout[key]}.")
+                episodes.append([shard_id, name, total, length, bool(demo.attrs["success"])])
+                total += length
+    if not episodes:
+        raise ValueError(f"No finished episodes in {shards}.")
+
+    # second pass: copy every episode into the flat arrays
+    os.makedirs(cache_dir, exist_ok=True)
+    arrays = {
+        key: np.lib.format.open_memmap(
+            os.path.join(cache_dir, _cache_file(key)), mode="w+", dtype=np.dtype(dtype), shape=(total, *shape)
+        )
+        for key, (shape, dtype) in layout.items()
+    }
+    for shard_id, shard in enumerate(shards):
+        with h5py.File(shard, "r") as f:
+            for _, name, start, length, _ in (ep for ep in episodes if ep[0] == shard_id):
+                demo = f["data"][name]
+                for key, array in arrays.items():
+                    if demo.attrs.get("compacted", False):
+                        array[start : start + length] = read_key(demo, key)
+                    else:
+                        demo[key].read_direct(array, dest_sel=np.s_[start : start + length])
+    for array in arrays.values():
+        array.flush()
+
+    meta = {
+        "sources": stamps,
+        "keys": {key: [list(shape), dtype] for key, (shape, dtype) in layout.items()},
+        "episodes": episodes,
+    }
+    # written last, an interrupted conversion is redone
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+    return meta
+
+
+class DemoWindowDataset(Dataset):
+    """Windows of ``window`` consecutive steps of the recorded episodes, from the memory-mapped cache.
+
+    Sample ``i`` is a dict ``{key: (window, ...)}`` of the requested keys. Episodes shorter than the window are
+    skipped, consecutive windows of an episode start ``stride`` steps apart. With ``__getitems__`` a whole
+    batch is gathered with one fancy-indexing read per key, use :func:`collate_windows` as ``collate_fn``.
+
+    Args:
+        sources: HDF5 shards recorded by ``object_override.py`` and/or ``index.json`` files of ``collect_farm.py``.
+        cache_dir: Directory of the memory-mapped cache, built on first use.
+        window: Number of steps per sample.
+        stride: Step between the starts of consecutive windows of an episode.
+        keys: Keys to load, e.g. ``["obs/policy", "actions"]``, all by default.
+        successful_only: Only use the episodes recorded as successful.
+    """
+
+    def __init__(
+        self,
+        sources: list[str],
+        cache_dir: str,
+        window: int = 16,
+        stride: int = 1,
+        keys: list[str] | None = None,
+        successful_only: bool = False,
+    ):
+        if window < 1 or stride < 1:
+            raise ValueError(f"The window and stride must be positive, got {window} and {stride}.")
+        self.cache_dir = cache_dir
+        self.window = window
+        meta = build_cache(sources, cache_dir)
+        self.keys = list(meta["keys"]) if keys is None else keys
+        missing = set(self.keys) - set(meta["keys"])
+        if missing:
+            raise ValueError(f"Keys {sorted(missing)} are not recorded, available: {sorted(meta['keys'])}.")
+
+        episodes = [ep for ep in meta["episodes"] if ep[4] or not successful_only]
+        starts = np.array([ep[2] for ep in episodes], dtype=np.int64)
+        lengths = np.array([ep[3] for ep in episodes], dtype=np.int64)
+        self.num_episodes = len(episodes)
+        # flat row of the first step of every window
+        num_windows = np.maximum((lengths - window) // stride + 1, 0)
+        offsets = np.arange(num_windows.sum()) - np.repeat(np.cumsum(num_windows) - num_windows, num_windows)
+        self.window_starts = np.repeat(starts, num_windows) + offsets * stride
+        self.window_episodes = np.repeat(np.arange(self.num_episodes), num_windows)
+        self._steps = np.arange(window)
+
+        self._arrays: dict[str, np.ndarray] | None = None
+        self._pid = None
+
+    def __len__(self) -> int:
+        return len(self.window_starts)
+
+    def __getstate__(self):
+        # the memory-maps are reopened in the worker instead of pickled
+        state = self.__dict__.copy()
+        state["_arrays"] = None
+        return state
+
+    @property
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Memory-maps of the keys, opened once per process (copy-on-write, so slices are writable views)."""
+        if self._arrays is None or self._pid != os.getpid():
+            self._arrays = {
+                key: np.load(os.path.join(self.cache_dir, _cache_file(key)), mmap_mode="c") for key in self.keys
+            }
+            self._pid = os.getpid()
+        return self._arrays
+
+    def __getitem__(self, index: int) -> dict[str, np.ndarray]:
+        start = self.window_starts[index]
+        return {key: array[start : start + self.window] for key, array in self.arrays.items()}
+
+    def __getitems__(self, indices: list[int]) -> dict[str, np.ndarray]:
+        rows = self.window_starts[np.asarray(indices)][:, None] + self._steps
+        return {key: array[rows] for key, array in self.arrays.items()}
+
+
+def collate_windows(batch: dict[str, np.ndarray] | list[dict[str, np.ndarray]]) -> dict[str, torch.Tensor]:
+    """``collate_fn`` of :class:`DemoWindowDataset`, the batch is already gathered by ``__getitems__``."""
+    if isinstance(batch, list):
+        batch = {key: np.stack([sample[key] for sample in batch]) for key in batch[0]}
+    return {key: torch.from_numpy(np.ascontiguousarray(value)) for key, value in batch.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the memory-mapped cache of demos and measure the loading rate.")
+    parser.add_argument("sources", type=str, nargs="+", help="HDF5 shards and/or index.json of collect_farm.py.")
+    parser.add_argument("--cache", type=str, required=True, help="Cache directory.")
+    parser.add_argument("--window", type=int, default=16, help="Steps per sample.")
+    parser.add_argument("--batch_size", type=int, default=256, help="Windows per batch.")
+    parser.add_argument("--num_workers", type=int, default=0, help="DataLoader worker processes.")
+    parser.add_argument("--batches", type=int, default=200, help="Number of batches to time.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dataset = DemoWindowDataset(args.sources, args.cache, window=args.window)
+    print(f"{dataset.num_episodes} episodes, {len(dataset)} windows ({time.perf_counter() - start:.2f} s to index)")
+
+    loader = DataLoader(
+        dataset,
+        batch_size=args.batch_size,
+        shuffle=True,
+        num_workers=args.num_workers,
+        collate_fn=collate_windows,
+        persistent_workers=args.num_workers > 0,
+    )
+    num_batches = 0
+    start = time.perf_counter()
+    while num_batches < args.batches:
+        for batch in loader:
+            num_batches += 1
+            if num_batches >= args.batches:
+                break
+    elapsed = time.perf_counter() - start
+    shapes = {key: tuple(value.shape) for key, value in batch.items()}
+    print(f"{num_batches / elapsed:.1f} batches/s, {num_batches * args.batch_size / elapsed:.0f} windows/s, {shapes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Asynchronous capture of the rendered camera frames of every environment into per-episode chunks.
+
+The sim loop copies the ``(num_envs, H, W, C)`` frames of a step into a chunk buffer from a pool of reusable
+shared-memory buffers, one copy and no encoding. A full chunk is handed to the encoder processes, each owns
+the environments ``env_id % num_workers`` and writes their frames per episode as compressed image chunks
+(``.npz``) or appends them to one video per episode (``.mp4``, needs ``imageio`` with ffmpeg). The chunks of
+an environment are encoded in order by the same process, which keeps the video of an episode open until the
+episode ends. When all buffers are still being encoded the frames of the step are dropped and counted, the
+sim loop never waits for the encoders.
+
+The encoders are spawned, not forked from the sim process with its CUDA context and Isaac Sim threads. The
+output directory must be new or empty, the chunks of an earlier capture would mix with the new episodes.
+
+    <output_dir>/
+        capture.json                                shape, format, fps, dropped frames
+        env_<e>/episode_<k>/steps_<first>.npz       frames (n, H, W, C), steps (n,)
+        env_<e>/episode_<k>.mp4                     whole episode, + episode_<k>.npy steps (n,)
+
+``steps`` is the step index of every frame within its episode, the frame captured before step ``t`` matches
+sample ``t`` of the recorded demo (``--output``).
+
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --enable_cameras --capture frames --output demos.hdf5
+python .\\frame_capture.py --num_envs 4 --steps 500 --size 128
+
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import torch
+
+FORMATS = ("npz", "mp4")
+
+
+# open videos of the encoder process, (output_dir, env_id, episode) -> (writer, steps of the written frames)
+_VIDEOS = {}
+
+
+def _encode_chunk(
+    shm_name: str,
+    shape: tuple[int, ...],
+    num_frames: int,
+    episodes: np.ndarray,
+    steps: np.ndarray,
+    env_ids: list[int],
+    ended: list[tuple[int, int]],
+    output_dir: str,
+    file_format: str,
+    fps: int,
+) -> int:
+    """Write the frames of a chunk per environment and episode, runs in an encoder process.
+
+    ``ended`` are the ``(env_id, episode)`` that ended since the last chunk, their videos are closed after
+    their last frames of this chunk.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frames = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)[:num_frames]
+        for env_id in env_ids:
+            for episode in np.unique(episodes[:num_frames, env_id]):
+                rows = np.flatnonzero(episodes[:num_frames, env_id] == episode)
+                env_steps = steps[rows, env_id]
+                env_frames = frames[rows, env_id]
+                if file_format == "npz":
+                    episode_dir = os.path.join(output_dir, f"env_{env_id}", f"episode_{episode}")
+                    os.makedirs(episode_dir, exist_ok=True)
+                    path = os.path.join(episode_dir, f"steps_{env_steps[0]:06d}.npz")
+                    np.savez_compressed(path, frames=env_frames, steps=env_steps)
+                else:
+                    _append_video(output_dir, env_id, int(episode), env_frames, env_steps, fps)
+        _close_videos(output_dir, ended)
+        return num_frames
+    finally:
+        shm.close()
+
+
+def _append_video(output_dir: str, env_id: int, episode: int, frames: np.ndarray, steps: np.ndarray, fps: int):
+    key = (output_dir, env_id, episode)
+    if key not in _VIDEOS:
+        import imageio
+
+        env_dir = os.path.join(output_dir, f"env_{env_id}")
+        os.makedirs(env_dir, exist_ok=True)
+        writer = imageio.get_writer(os.path.join(env_dir, f"episode_{episode}.mp4"), fps=fps)
+        _VIDEOS[key] = (writer, [])
+    writer, written_steps = _VIDEOS[key]
+    for frame in frames:
+        writer.append_data(frame)
+    written_steps.append(steps)
+
+
+def _close_videos(output_dir: str, ended: list[tuple[int, int]] | None = None):
+    """Close the videos of the ended ``(env_id, episode)`` (all open ones of ``output_dir`` if ``None``)."""
+    if ended is None:
+        keys = [key for key in _VIDEOS if key[0] == output_dir]
+    else:
+        keys = [(output_dir, env_id, episode) for env_id, episode in ended]
+    for key in keys:
+        if key in _VIDEOS:
+            writer, written_steps = _VIDEOS.pop(key)
+            writer.close()
+            _, env_id, episode = key
+            np.save(os.path.join(output_dir, f"env_{env_id}", f"episode_{episode}.npy"), np.concatenate(written_steps))
+
+
+class FrameCapture:
+    """Pool of shared-memory chunk buffers filled by the sim loop and encoded by a process pool.
+
+    Args:
+        output_dir: Directory of the encoded chunks.
+        num_envs: Number of environments.
+        frame_shape: ``(H, W, C)`` of the uint8 frames.
+        chunk_size: Steps per chunk buffer.
+        num_buffers: Number of chunk buffers, the steps that can wait for encoding are ``num_buffers * chunk_size``.
+        num_workers: Encoder processes, each encodes the environments ``env_id % num_workers``.
+        file_format: ``"npz"`` (compressed image chunks) or ``"mp4"``.
+        fps: Frame rate of the videos.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        num_envs: int,
+        frame_shape: tuple[int, int, int],
+        chunk_size: int = 32,
+        num_buffers: int = 8,
+        num_workers: int = 2,
+        file_format: str = "npz",
+        fps: int = 30,
+    ):
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown frame format '{file_format}', expected one of {FORMATS}.")
+        if file_format == "mp4":
+            # fail here and not in the encoders
+            import imageio  # noqa: F401
+
+        if os.path.isdir(output_dir) and os.listdir(output_dir):
+            raise ValueError(f"The capture directory '{output_dir}' is not empty.")
+
+        self.output_dir = output_dir
+        self.num_envs = num_envs
+        self.chunk_size = chunk_size
+        self.file_format = file_format
+        self.fps = fps
+        self.num_frames = 0
+        self.num_dropped = 0
+        os.makedirs(output_dir, exist_ok=True)
+
+        self._shape = (chunk_size, num_envs, *frame_shape)
+        nbytes = int(np.prod(self._shape))
+        self._buffers = [shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(num_buffers)]
+        self._arrays = [torch.from_numpy(np.ndarray(self._shape, np.uint8, buffer=b.buf)) for b in self._buffers]
+        self._free = queue.SimpleQueue()
+        for i in range(1, num_buffers):
+            self._free.put(i)
+        self._current = 0
+        self._fill = 0
+        self._episodes = np.zeros((chunk_size, num_envs), dtype=np.int64)
+        self._steps = np.zeros((chunk_size, num_envs), dtype=np.int64)
+
+        # episode and step of every environment
+        self._episode = np.zeros(num_envs, dtype=np.int64)
+        self._step = np.zeros(num_envs, dtype=np.int64)
+
+        # one single-process pool per encoder, the chunks of an environment are encoded in submission order
+        self._encoders = _start_encoders(num_workers)
+        self._env_ids = [list(range(k, num_envs, num_workers)) for k in range(num_workers)]
+        self._ended = [[] for _ in range(num_workers)]
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._futures = set()
+        self._error: BaseException | None = None
+
+    """
+    Sim loop side.
+    """
+
+    def add_frames(self, frames: torch.Tensor | np.ndarray):
+        """Copy the ``(num_envs, H, W, C)`` uint8 frames of the current step, dropped if no buffer is free."""
+        self._raise_error()
+        if self._current is None:
+            try:
+                self._current = self._free.get_nowait()
+            except queue.Empty:
+                self.num_dropped += 1
+                self._step += 1
+                return
+        if isinstance(frames, np.ndarray):
+            frames = torch.from_numpy(frames)
+        # a single device-to-shared-memory copy
+        self._arrays[self._current][self._fill].copy_(frames)
+        self._episodes[self._fill] = self._episode
+        self._steps[self._fill] = self._step
+        self._fill += 1
+        self._step += 1
+        self.num_frames += 1
+        if self._fill == self.chunk_size:
+            self._submit()
+
+    def end_episode(self, env_ids: torch.Tensor | np.ndarray | list[int] | None = None):
+        """Start a new episode for the given environments (all if ``None``)."""
+        if env_ids is None:
+            env_ids = slice(None)
+        elif isinstance(env_ids, torch.Tensor):
+            env_ids = env_ids.cpu().numpy()
+        for env_id in np.arange(self.num_envs)[env_ids]:
+            self._ended[env_id % len(self._encoders)].append((int(env_id), int(self._episode[env_id])))
+        self._episode[env_ids] += 1
+        self._step[env_ids] = 0
+
+    def close(self):
+        """Encode the last partial chunk, wait for the encoders and release the buffers."""
+        if self._current is not None and self._fill > 0:
+            self._submit()
+        for future in list(self._futures):
+            future.result()
+        for encoder in self._encoders:
+            # the videos still open are the episodes running at the end of the capture
+            encoder.submit(_close_videos, self.output_dir).result()
+            encoder.shutdown()
+        with open(os.path.join(self.output_dir, "capture.json"), "w") as f:
+            json.dump(
+                {
+                    "num_envs": self.num_envs,
+                    "frame_shape": list(self._shape[2:]),
+                    "format": self.file_format,
+                    "fps": self.fps,
+                    "num_frames": self.num_frames,
+                    "num_dropped": self.num_dropped,
+                },
+                f,
+                indent=2,
+            )
+        for buffer in self._buffers:
+            buffer.close()
+            buffer.unlink()
+        self._raise_error()
+
+    def _submit(self):
+        buffer_id = self._current
+        episodes = self._episodes[: self._fill].copy()
+        steps = self._steps[: self._fill].copy()
+        self._pending[buffer_id] = len(self._encoders)
+        for k, encoder in enumerate(self._encoders):
+            future = encoder.submit(
+                _encode_chunk,
+                self._buffers[buffer_id].name,
+                self._shape,
+                self._fill,
+                episodes,
+                steps,
+                self._env_ids[k],
+                self._ended[k],
+                self.output_dir,
+                self.file_format,
+                self.fps,
+            )
+            self._ended[k] = []
+            self._futures.add(future)
+            future.add_done_callback(lambda f: self._release(f, buffer_id))
+        self._fill = 0
+        try:
+            self._current = self._free.get_nowait()
+        except queue.Empty:
+            self._current = None
+
+    def _release(self, future, buffer_id: int):
+        # runs on the thread of an encoder pool, the buffer is free once all encoders wrote their environments
+        if future.exception() is not None:
+            self._error = future.exception()
+        with self._lock:
+            self._futures.discard(future)
+            self._pending[buffer_id] -= 1
+            if self._pending[buffer_id] > 0:
+                return
+        self._free.put(buffer_id)
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"Encoding the frames to '{self.output_dir}' failed.") from self._error
+
+
+def _start_encoders(num_workers: int) -> list[ProcessPoolExecutor]:
+    """Spawn one single-process pool per encoder now, not on the first full chunk in the sim loop.
+
+    A spawned process imports the ``__main__`` script, which would launch Isaac Sim again for
+    ``object_override.py``. The encoders only need this module, so the script path is hidden while they start.
+    """
+    context = multiprocessing.get_context("spawn")
+    pools = [ProcessPoolExecutor(max_workers=1, mp_context=context) for _ in range(num_workers)]
+    main_module = sys.modules["__main__"]
+    main_file = main_module.__dict__.pop("__file__", None)
+    try:
+        # the process of a spawn pool starts on the first submit
+        for future in [pool.submit(os.getpid) for pool in pools]:
+            future.result()
+    finally:
+        if main_file is not None:
+            main_module.__file__ = main_file
+    return pools
+
+
+def load_episode_frames(output_dir: str, env_id: int, episode: int) -> tuple[np.ndarray, np.ndarray]:
+    """Frames and step indices of one episode, in step order."""
+    video = os.path.join(output_dir, f"env_{env_id}", f"episode_{episode}.mp4")
+    if os.path.isfile(video):
+        import imageio
+
+        with imageio.get_reader(video) as reader:
+            frames = np.stack([frame for frame in reader])
+        return frames, np.load(video[: -len(".mp4")] + ".npy")
+    episode_dir = os.path.join(output_dir, f"env_{env_id}", f"episode_{episode}")
+    frames, steps = [], []
+    for name in sorted(os.listdir(episode_dir)):
+        if name.endswith(".npz"):
+            with np.load(os.path.join(episode_dir, name)) as chunk:
+                frames.append(chunk["frames"])
+                steps.append(chunk["steps"])
+    return np.concatenate(frames), np.concatenate(steps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capture synthetic frames on CPU and report the capture cost.")
+    parser.add_argument("--num_envs", type=int, default=4, help="Number of environments.")
+    parser.add_argument("--steps", type=int, default=500, help="Number of steps.")
+    parser.add_argument("--size", type=int, default=128, help="Frame width and height.")
+    parser.add_argument("--episode_length", type=int, default=120, help="Steps per synthetic episode.")
+    parser.add_argument("--workers", type=int, default=2, help="Encoder processes.")
+    parser.add_argument("--format", type=str, default="npz", choices=FORMATS, help="Output format.")
+    parser.add_argument("--output_dir", type=str, default=None, help="Output directory, a new temporary one if unset.")
+    args = parser.parse_args()
+    if args.output_dir is None:
+        args.output_dir = tempfile.mkdtemp(prefix="frames_bench_")
+
+    capture = FrameCapture(
+        args.output_dir, args.num_envs, (args.size, args.size, 3), num_workers=args.workers, file_format=args.format
+    )
+    # moving gradient, compressible like a rendered scene
+    y, x = np.mgrid[: args.size, : args.size]
+    latencies = np.zeros(args.steps)
+    for t in range(args.steps):
+        frames = np.stack([((x + y + 4 * t + 16 * e) % 256).astype(np.uint8) for e in range(args.num_envs)])
+        frames = np.repeat(frames[..., None], 3, axis=-1)
+        start = time.perf_counter()
+        capture.add_frames(frames)
+        if (t + 1) % args.episode_length == 0:
+            capture.end_episode()
+        latencies[t] = time.perf_counter() - start
+    start = time.perf_counter()
+    capture.close()
+    print(
+        f"add_frames p50 {np.percentile(latencies, 50) * 1e3:.3f} ms, p99 {np.percentile(latencies, 99) * 1e3:.3f} ms,"
+        f" {capture.num_frames} captured, {capture.num_dropped} dropped, close {time.perf_counter() - start:.2f} s"
+        f" ({args.output_dir})"
+    )
+
+
+if __name__ == "__main__":
+    # from the imported module, the encoders unpickle the functions of frame_capture and not of __main__
+    import frame_capture
+
+    frame_capture.main()
@@ -0,0 +1,324 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Custom labware used to override the object of the Lift task.
+
+Kept free of simulator imports so that it can be shared by every Chills entry point,
+the ``isaaclab.sim`` spawner config is only imported when a multi-asset spawn is requested.
+Torch is imported by the tensor helpers on first use, so listing and validating labware stays fast.
+"""
+
+import copy
+import functools
+import math
+import operator
+import os
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+import yaml
+
+if TYPE_CHECKING:
+    import numpy as np
+    import torch
+
+
+def euler_deg_to_quat_wxyz(
+    euler_deg: "np.ndarray | torch.Tensor | list", device: str | None = None, dtype: "torch.dtype | None" = None
+) -> "torch.Tensor":
+    """Batched extrinsic 'xyz' Euler angles in degrees ``(N, 3)`` to [w,x,y,z] quaternions ``(N, 4)``.
+
+    Same convention as ``scipy.spatial.transform.Rotation.from_euler('xyz', ..., degrees=True)``,
+    computed with torch on ``device`` (the device of the input tensor if not given), ``dtype`` defaults to float32.
+    """
+    import torch
+
+    euler_deg = torch.as_tensor(euler_deg, dtype=torch.float64, device=device)
+    half = torch.deg2rad(euler_deg) * 0.5
+    cx, cy, cz = torch.cos(half).unbind(-1)
+    sx, sy, sz = torch.sin(half).unbind(-1)
+    # q = q_z * q_y * q_x
+    quat = torch.stack(
+        (
+            cx * cy * cz + sx * sy * sz,
+            sx * cy * cz - cx * sy * sz,
+            cx * sy * cz + sx * cy * sz,
+            cx * cy * sz - sx * sy * cz,
+        ),
+        dim=-1,
+    )
+    return quat.to(dtype or torch.float)
+
+
+@functools.lru_cache(maxsize=256)
+def _deg2quat_wxyz(euler_deg: tuple[float, float, float]) -> tuple[float, float, float, float]:
+    half = [math.radians(angle) * 0.5 for angle in euler_deg]
+    (cx, cy, cz), (sx, sy, sz) = [math.cos(a) for a in half], [math.sin(a) for a in half]
+    return (
+        cx * cy * cz + sx * sy * sz,
+        sx * cy * cz - cx * sy * sz,
+        cx * sy * cz + sx * cy * sz,
+        cx * cy * sz - sx * sy * cz,
+    )
+
+
+# Changes from Euler (360') Angles [x,y,z] to Isaac Quaternion [w,x,y,z] format
+def deg2quat_wxyz(euler_deg):
+    # memoized, the labware reuses a few fixed orientations (e.g. upright)
+    return list(_deg2quat_wxyz(tuple(float(angle) for angle in euler_deg)))
+
+
+LABWARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+LABWARE_FILE = "labware.yaml"
+# pose of the object of the Lift task, used for labware whose sidecar sets no pose
+DEFAULT_POS = (0.5, 0.0, 0.055)
+DEFAULT_ROT = (1.0, 0.0, 0.0, 0.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_sidecar(asset_dir: str) -> dict:
+    sidecar_path = os.path.join(asset_dir, LABWARE_FILE)
+    if not os.path.exists(sidecar_path):
+        return {}
+    with open(sidecar_path) as f:
+        return yaml.safe_load(f) or {}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_labware(asset_dir: str) -> dict:
+    # USD written by MeshConverter, the spawn scale and pose of the optional sidecar
+    with open(os.path.join(asset_dir, "config.yaml")) as f:
+        converter_cfg = yaml.load(f, Loader=yaml.FullLoader)
+    overrides = {"spawn.usd_path": os.path.join(asset_dir, converter_cfg["usd_file_name"])}
+
+    sidecar = _load_sidecar(asset_dir)
+    if sidecar:
+        if "scale" in sidecar:
+            overrides["spawn.scale"] = tuple(sidecar["scale"])
+        if "pos" in sidecar:
+            overrides["init_state.pos"] = list(sidecar["pos"])
+        if "rot" in sidecar:
+            overrides["init_state.rot"] = list(sidecar["rot"])
+        elif "euler_deg" in sidecar:
+            overrides["init_state.rot"] = deg2quat_wxyz(sidecar["euler_deg"])
+    return overrides
+
+
+class LabwareRegistry(Mapping):
+    """Labware discovered from the ``<root>/<name>/config.yaml`` files that ``MeshConverter`` writes.
+
+    Maps the asset directory name (case-insensitive) to the ``obj_override`` dict of the labware. Only the
+    directory listing happens up front, the config and the ``labware.yaml`` pose sidecar of an entry are read
+    on first access. The sidecar is optional and holds the spawn scale and initial pose, and the grasp point of
+    the scripted device (see :meth:`grasp_offset`):
+
+    .. code-block:: yaml
+
+        scale: [0.01, 0.01, 0.01]
+        pos: [0.5, 0.0, 0.055]
+        euler_deg: [90, 0, 0]  # or rot: [w, x, y, z]
+        grasp_offset: [0.0, 0.0, 0.04]
+
+    Adding a vessel is converting its mesh into ``chills/assets/<name>/`` and, if needed, adding the sidecar.
+    """
+
+    def __init__(self, root: str = LABWARE_DIR):
+        self.root = root
+        self._asset_dirs: dict[str, str] | None = None
+
+    def _index(self) -> dict[str, str]:
+        if self._asset_dirs is None:
+            self._asset_dirs = {
+                entry.name.lower(): entry.path
+                for entry in sorted(os.scandir(self.root), key=lambda entry: entry.name)
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "config.yaml"))
+            }
+        return self._asset_dirs
+
+    def _asset_dir(self, name: str) -> str:
+        try:
+            return self._index()[name.lower()]
+        except KeyError:
+            raise KeyError(f"Unknown labware '{name}', available: {list(self)}") from None
+
+    def __getitem__(self, name: str) -> dict:
+        return dict(_load_labware(self._asset_dir(name)))
+
+    def grasp_offset(self, name: str) -> tuple[float, float, float] | None:
+        """Grasp point [m] of the labware in its rotated frame, ``None`` if the sidecar has none."""
+        offset = _load_sidecar(self._asset_dir(name)).get("grasp_offset")
+        return None if offset is None else tuple(float(v) for v in offset)
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+
+# Custom labware in chills/assets
+Labwear = LabwareRegistry()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_paths(cfg_type: type, keys: tuple[str, ...]) -> tuple[tuple[operator.attrgetter | None, str], ...]:
+    # cached per config class and key set, the template is validated before it is filled
+    compiled = []
+    for key in keys:
+        parent, _, leaf = key.rpartition(".")
+        compiled.append((operator.attrgetter(parent) if parent else None, leaf))
+    return tuple(compiled)
+
+
+def _invalid_keys(template: object, keys) -> list[str]:
+    invalid = []
+    for key in keys:
+        target = template
+        for part in key.split("."):
+            if not part or not hasattr(target, part):
+                invalid.append(key)
+                break
+            target = getattr(target, part)
+    return invalid
+
+
+class OverridePlan:
+    """Dotted-key overrides (e.g. ``"spawn.usd_path"``) validated and compiled once against a config.
+
+    The attribute paths are resolved into ``operator.attrgetter`` once per config class and key set. Applying the
+    plan looks up every parent before setting any value, so a config is either fully overridden or untouched.
+
+    Example:
+
+    .. code-block:: python
+
+        plan = OverridePlan.compile(env_cfg.scene.object, Labwear["Beaker"])  # raises on bad keys
+        object_cfgs = plan.variants(env_cfg.scene.object, [{"init_state.pos": pos} for pos in positions])
+    """
+
+    def __init__(self, cfg_type: type, keys: tuple[str, ...], values: dict):
+        self.cfg_type = cfg_type
+        self.keys = keys
+        self.values = values
+        self._paths = _compile_paths(cfg_type, keys)
+
+    @classmethod
+    def compile(cls, template: object, overrides: dict) -> "OverridePlan":
+        """Validate the keys against the config instance ``template``.
+
+        Raises:
+            ValueError: Listing all the keys that do not resolve to an attribute of the config.
+        """
+        keys = tuple(overrides)
+        invalid = _invalid_keys(template, keys)
+        if invalid:
+            raise ValueError(f"Invalid override keys for '{type(template).__name__}': {invalid}")
+        return cls(type(template), keys, dict(overrides))
+
+    def apply(self, cfg: object, values: dict | None = None) -> object:
+        """Override ``cfg`` in place with the plan values, or with ``values`` for (a subset of) the plan keys."""
+        if not isinstance(cfg, self.cfg_type):
+            raise TypeError(f"Override plan compiled for '{self.cfg_type.__name__}', got '{type(cfg).__name__}'.")
+        if values is None:
+            values = self.values
+        elif not values.keys() <= self.values.keys():
+            raise ValueError(f"Keys not in the override plan: {sorted(values.keys() - self.values.keys())}")
+        targets = [
+            (getter(cfg) if getter else cfg, leaf, values[key])
+            for key, (getter, leaf) in zip(self.keys, self._paths)
+            if key in values
+        ]
+        for target, leaf, value in targets:
+            setattr(target, leaf, value)
+        return cfg
+
+    def apply_many(self, cfgs: list, values: list[dict] | None = None) -> list:
+        """Apply the plan to every config, with the matching entry of ``values`` if given."""
+        if values is None:
+            return [self.apply(cfg) for cfg in cfgs]
+        if len(values) != len(cfgs):
+            raise ValueError(f"Got {len(values)} value sets for {len(cfgs)} configs.")
+        return [self.apply(self.apply(cfg), cfg_values) for cfg, cfg_values in zip(cfgs, values)]
+
+    def variants(self, template: object, values: list[dict]) -> list:
+        """Copies of ``template`` with the plan applied, each overridden with its entry of ``values``."""
+        return self.apply_many([copy.deepcopy(template) for _ in values], values)
+
+
+def obj_override(obj : object, overrides : dict) -> object:
+    """Dynamically override the object spawn parameters in the environment confg."""
+    # validated for all keys before anything is overridden
+    return OverridePlan.compile(obj, overrides).apply(obj)
+
+
+def multi_obj_override(obj: object, labware: list[dict]) -> object:
+    """Spawn the labware round-robin over the environments, environment ``i`` gets ``labware[i % len(labware)]``.
+
+    All entries must share the same ``spawn.scale`` as a multi-asset spawn has a single scale.
+    The per-environment poses are not part of the config, see :func:`labware_pose_table`.
+    """
+    import isaaclab.sim as sim_utils
+
+    scales = {tuple(cfg.get("spawn.scale", obj.spawn.scale)) for cfg in labware}
+    if len(scales) != 1:
+        raise ValueError(f"Multi-asset spawn needs a single 'spawn.scale' for all labware, got: {scales}")
+
+    spawn = obj.spawn
+    obj.spawn = sim_utils.MultiUsdFileCfg(
+        usd_path=[cfg["spawn.usd_path"] for cfg in labware],
+        random_choice=False,
+        scale=scales.pop(),
+        rigid_props=spawn.rigid_props,
+        mass_props=spawn.mass_props,
+        collision_props=spawn.collision_props,
+        activate_contact_sensors=spawn.activate_contact_sensors,
+        semantic_tags=spawn.semantic_tags,
+    )
+    # first entry is the config default, every environment is overwritten from the pose table
+    obj_override(obj, {key: value for key, value in labware[0].items() if key.startswith("init_state.")})
+    return obj
+
+
+def labware_pose(
+    cfg: dict, default_pos: tuple[float, ...] = DEFAULT_POS, default_rot: tuple[float, ...] = DEFAULT_ROT
+) -> tuple[list[float], list[float]]:
+    """Initial position and [w,x,y,z] rotation of a labware, the defaults for what its sidecar does not set."""
+    return list(cfg.get("init_state.pos", default_pos)), list(cfg.get("init_state.rot", default_rot))
+
+
+def labware_pose_table(
+    labware: list[dict],
+    num_envs: int,
+    device: str,
+    default_pos: tuple[float, ...] = DEFAULT_POS,
+    default_rot: tuple[float, ...] = DEFAULT_ROT,
+) -> "tuple[torch.Tensor, torch.Tensor, torch.Tensor]":
+    """Resolve the labware index, position and [w,x,y,z] rotation of every environment once.
+
+    Follows the round-robin assignment of :func:`multi_obj_override`. Labware without a pose in its sidecar
+    (or without a sidecar) gets ``default_pos`` and ``default_rot``.
+
+    Returns:
+        Labware index ``(num_envs,)``, position ``(num_envs, 3)`` and rotation ``(num_envs, 4)``.
+    """
+    import torch
+
+    labware_ids = torch.arange(num_envs, device=device) % len(labware)
+    poses = [labware_pose(cfg, default_pos, default_rot) for cfg in labware]
+    pos = torch.tensor([pos for pos, _ in poses], dtype=torch.float, device=device)
+    rot = torch.tensor([rot for _, rot in poses], dtype=torch.float, device=device)
+    return labware_ids, pos[labware_ids], rot[labware_ids]
+
+
+def apply_labware_poses(asset, pos: "torch.Tensor", rot: "torch.Tensor"):
+    """Write the per-environment poses into the default root state of the object.
+
+    The reset events of the Lift task sample around ``default_root_state``, so every following
+    ``env.reset()`` spawns each environment at the pose of its own labware.
+    """
+    asset.data.default_root_state[:, 0:3] = pos
+    asset.data.default_root_state[:, 3:7] = rot
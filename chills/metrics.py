@@ -0,0 +1,288 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Episode success and grasp-quality metrics per labware, live in the teleop loop or offline on recordings.
+
+Per environment and step, as batched tensor operations over all environments:
+
+- success: the episode ended by ``object_reached_goal``
+- lift: the object rose more than ``lift_height`` above its start height, time-to-lift is the first such step
+- drop: a lifted object fell back below ``drop_height`` above its start height
+
+The finished episodes are aggregated per labware with ``index_add_``. Offline, the episodes of a recording are
+padded into one batch and replayed through the same :class:`EpisodeMetrics`, one time step for all of them.
+
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --num_envs 16 --multi_labware --metrics
+python .\\metrics.py farm\\index.json
+python .\\metrics.py demos.hdf5 --labware beaker con_flask round_bot
+
+"""
+
+import argparse
+import json
+import os
+
+import h5py
+import numpy as np
+import torch
+
+from compaction import read_key
+
+OBJECT_TERM = "object_position"
+
+
+class EpisodeMetrics:
+    """Per-environment episode state and per-labware totals of the success and grasp metrics.
+
+    Args:
+        labware_ids: Labware index of every environment ``(num_envs,)``.
+        labware_names: Name of every labware index.
+        lift_height: Height above the start height that counts as lifted [m].
+        drop_height: Height above the start height a lifted object has to fall below to count as dropped [m].
+        step_dt: Duration of an environment step [s], to report the time-to-lift in seconds.
+    """
+
+    def __init__(
+        self,
+        labware_ids: torch.Tensor,
+        labware_names: list[str],
+        lift_height: float = 0.04,
+        drop_height: float = 0.01,
+        step_dt: float | None = None,
+    ):
+        self.labware_ids = labware_ids
+        self.labware_names = labware_names
+        self.lift_height = lift_height
+        self.drop_height = drop_height
+        self.step_dt = step_dt
+        num_envs, device = len(labware_ids), labware_ids.device
+
+        # running episode of every environment
+        self._start_height = torch.full((num_envs,), float("nan"), device=device)
+        self._steps = torch.zeros(num_envs, dtype=torch.long, device=device)
+        self._time_to_lift = torch.full((num_envs,), -1, dtype=torch.long, device=device)
+        self._lifted = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        self._drops = torch.zeros(num_envs, dtype=torch.long, device=device)
+
+        # totals per labware
+        num_labware = len(labware_names)
+        self.totals = {
+            key: torch.zeros(num_labware, dtype=torch.long, device=device)
+            for key in ("episodes", "successes", "lifts", "time_to_lift", "drops", "steps")
+        }
+
+    def start(self, height: torch.Tensor, env_ids: torch.Tensor | None = None):
+        """Set the start height of the episodes of ``env_ids`` (all by default), e.g. after ``env.reset()``."""
+        env_ids = slice(None) if env_ids is None else env_ids
+        self._start_height[env_ids] = height[env_ids]
+
+    def update(self, height: torch.Tensor, reached_goal: torch.Tensor, dones: torch.Tensor):
+        """Account one step of all environments.
+
+        Args:
+            height: Object height of every environment after the step ``(num_envs,)``. For the environments that
+                are done it is the height after their reset, it starts their next episode.
+            reached_goal: Whether the episode ended by reaching the goal ``(num_envs,)``.
+            dones: Whether the episode ended (terminated or truncated) ``(num_envs,)``.
+        """
+        running = ~dones
+        # without start() the first height is the start height
+        unset = torch.isnan(self._start_height)
+        self._start_height[unset] = height[unset]
+        relative = height - self._start_height
+        self._steps += 1
+
+        above = running & (relative > self.lift_height)
+        below = running & (relative < self.drop_height)
+        first_lift = above & (self._time_to_lift < 0)
+        self._time_to_lift[first_lift] = self._steps[first_lift]
+        self._drops += (self._lifted & below).long()
+        # hysteresis between the drop and lift heights
+        self._lifted = (self._lifted | above) & ~below
+
+        if dones.any():
+            env_ids = dones.nonzero().flatten()
+            self.end(env_ids, reached_goal[env_ids], height[env_ids])
+
+    def end(self, env_ids: torch.Tensor, success: torch.Tensor, start_height: torch.Tensor):
+        """End the episodes of ``env_ids`` outside of ``update()``, e.g. on a manual reset.
+
+        Args:
+            env_ids: Environments whose episode ended.
+            success: Whether each of them succeeded.
+            start_height: Object height after their reset, the start of their next episode.
+        """
+        labware_ids = self.labware_ids[env_ids]
+        lifted = self._time_to_lift[env_ids] >= 0
+        values = {
+            "episodes": torch.ones_like(env_ids),
+            "successes": success.long(),
+            "lifts": lifted.long(),
+            "time_to_lift": torch.where(lifted, self._time_to_lift[env_ids], 0),
+            "drops": self._drops[env_ids],
+            "steps": self._steps[env_ids],
+        }
+        for key, value in values.items():
+            self.totals[key].index_add_(0, labware_ids, value)
+
+        # the reset environments start their next episode from the given height
+        self._start_height[env_ids] = start_height
+        self._steps[env_ids] = 0
+        self._time_to_lift[env_ids] = -1
+        self._lifted[env_ids] = False
+        self._drops[env_ids] = 0
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Metrics of every labware with finished episodes, and of all labware together (``"all"``)."""
+        totals = {key: value.cpu().numpy() for key, value in self.totals.items()}
+        rows = {name: {key: value[i] for key, value in totals.items()} for i, name in enumerate(self.labware_names)}
+        rows["all"] = {key: value.sum() for key, value in totals.items()}
+        summary = {}
+        for name, row in rows.items():
+            if row["episodes"] == 0:
+                continue
+            summary[name] = {
+                "episodes": int(row["episodes"]),
+                "success_rate": row["successes"] / row["episodes"],
+                "lift_rate": row["lifts"] / row["episodes"],
+                "time_to_lift": row["time_to_lift"] / row["lifts"] if row["lifts"] else float("nan"),
+                "drops_per_episode": row["drops"] / row["episodes"],
+                "mean_length": row["steps"] / row["episodes"],
+            }
+            if self.step_dt is not None:
+                summary[name]["time_to_lift"] *= self.step_dt
+        return summary
+
+    def print_summary(self):
+        unit = "s" if self.step_dt is not None else "steps"
+        header = (
+            f"{'labware':<12} {'episodes':>9} {'success':>8} {'lifted':>8} {f'to lift [{unit}]':>15}"
+            f" {'drops/ep':>9} {'length':>8}"
+        )
+        print(header)
+        print("-" * len(header))
+        for name, row in self.summary().items():
+            print(
+                f"{name:<12} {row['episodes']:>9} {row['success_rate']:>8.1%} {row['lift_rate']:>8.1%}"
+                f" {row['time_to_lift']:>15.2f} {row['drops_per_episode']:>9.2f} {row['mean_length']:>8.1f}"
+            )
+
+
+def _recordings(sources: list[str], labware: list[str] | None) -> list[tuple[str, list[str]]]:
+    """Shards with the labware their environments were assigned round-robin."""
+    recordings = []
+    for source in sources:
+        if source.endswith(".json"):
+            with open(source) as f:
+                index = json.load(f)
+            for shard in index["shards"]:
+                recordings.append((os.path.join(os.path.dirname(source), shard["path"]), shard["labware"]))
+        else:
+            recordings.append((source, labware or ["unknown"]))
+    return recordings
+
+
+def object_height_index(data: h5py.Group, obs_key: str = "obs/policy", term: str = OBJECT_TERM) -> int:
+    """Index of the object z in the ``obs_key`` observations, from the layout the recorder stored.
+
+    Raises:
+        ValueError: If the recording has no observation layout or the group has no ``term``.
+    """
+    if "obs_layout" not in data.attrs:
+        raise ValueError(f"'{data.file.filename}' has no observation layout, pass the height index.")
+    group = obs_key.split("/", 1)[1]
+    offset = 0
+    for name, shape in json.loads(data.attrs["obs_layout"]).get(group, []):
+        if name == term:
+            return offset + 2
+        offset += int(np.prod(shape))
+    raise ValueError(f"'{data.file.filename}' has no '{term}' term in its '{group}' observations.")
+
+
+def evaluate_recordings(
+    sources: list[str],
+    labware: list[str] | None = None,
+    height_index: int | None = None,
+    obs_key: str = "obs/policy",
+    device: str = "cpu",
+    **kwargs,
+) -> EpisodeMetrics:
+    """Metrics of the finished episodes of HDF5 recordings and/or ``collect_farm.py`` index files.
+
+    The labware of an episode is its ``labware`` attribute, or for recordings without it the round-robin
+    assignment over the ``env_id`` of the shard labware (``labware`` for plain HDF5 sources).
+
+    Args:
+        sources: HDF5 shards and/or ``index.json`` files.
+        labware: Labware of the environments (round-robin over the ``env_id``) of plain HDF5 sources.
+        height_index: Index of the object height in the ``obs_key`` observations, from the recorded
+            observation layout if ``None``.
+        obs_key: Observations the object height is read from.
+        device: Torch device of the evaluation.
+        kwargs: Passed to :class:`EpisodeMetrics`.
+    """
+    names, heights, successes, labware_ids = [], [], [], []
+    for path, shard_labware in _recordings(sources, labware):
+        with h5py.File(path, "r") as f:
+            index = height_index if height_index is not None else object_height_index(f["data"], obs_key)
+            for demo in f["data"].values():
+                if "success" not in demo.attrs:
+                    continue
+                if "labware" in demo.attrs:
+                    env_labware = str(demo.attrs["labware"])
+                    episode_labware = [env_labware]
+                else:
+                    env_labware = shard_labware[int(demo.attrs["env_id"]) % len(shard_labware)]
+                    episode_labware = shard_labware
+                for name in episode_labware:
+                    if name not in names:
+                        names.append(name)
+                heights.append(read_key(demo, obs_key)[:, index])
+                successes.append(bool(demo.attrs["success"]))
+                labware_ids.append(names.index(env_labware))
+    if not heights:
+        raise ValueError(f"No finished episodes in {sources}.")
+
+    # (num_episodes, max_length + 1) padded heights, sample t is the height after t steps
+    lengths = torch.tensor([len(h) for h in heights], device=device)
+    batch = torch.zeros((len(heights), int(lengths.max()) + 1), device=device)
+    for i, h in enumerate(heights):
+        batch[i, : len(h)] = torch.from_numpy(np.asarray(h, dtype=np.float32))
+    success = torch.tensor(successes, device=device)
+
+    metrics = EpisodeMetrics(torch.tensor(labware_ids, device=device), names, **kwargs)
+    metrics.start(batch[:, 0])
+    for t in range(1, batch.shape[1]):
+        # the height after the last step is not recorded, like the reset height the env returns for it
+        metrics.update(batch[:, t], success, lengths == t)
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Success and grasp metrics of recorded episodes per labware.")
+    parser.add_argument("sources", type=str, nargs="+", help="HDF5 recordings and/or index.json of collect_farm.py.")
+    parser.add_argument(
+        "--labware", type=str, nargs="*", default=None, help="Labware of the envs of HDF5 sources without labware attrs."
+    )
+    parser.add_argument(
+        "--height_index", type=int, default=None, help="Object height in the policy obs, for recordings without layout."
+    )
+    parser.add_argument("--lift_height", type=float, default=0.04, help="Height that counts as lifted [m].")
+    parser.add_argument("--drop_height", type=float, default=0.01, help="Height that counts as dropped [m].")
+    parser.add_argument("--json", type=str, default=None, help="Also write the metrics to this JSON file.")
+    args = parser.parse_args()
+
+    metrics = evaluate_recordings(
+        args.sources, args.labware, args.height_index, lift_height=args.lift_height, drop_height=args.drop_height
+    )
+    metrics.print_summary()
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump({name: {k: float(v) for k, v in row.items()} for name, row in metrics.summary().items()}, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,37 @@
 
 # Code based on IsaacLab\scripts\environments\teleoperation\teleop_se3_agent.py
 
-"""
+r"""
 python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0
 python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --teleop_device spacemouse 
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --num_envs 3 --multi_labware
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --output demos.hdf5
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --labware beaker
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --startup_times startup.json
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --profile teleop_trace.json
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --num_envs 16 --multi_labware --fast_reset
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --num_envs 16 --multi_labware --metrics
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --teleop_device scripted --num_envs 64 --multi_labware --output demos.hdf5 --headless
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --teleop_device policy --checkpoint policy.pt --num_envs 256 --multi_labware --metrics --headless
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --teleop_device spacemouse --async_input --dead_zone 0.01
+python .\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --num_envs 16 --output demos.hdf5 --capture frames
+python .\object_override.py --list_labware
+python .\object_override.py --dry_run --labware beaker --num_envs 64
 
-use obj_cfg = list(Labwear.values())[0] # or Labwear[next(iter(Labwear))] # Below to chnage the enviorment object
+--labware picks the object from the labware in chills/assets (see labware.py), "none" keeps the task's object
+--list_labware, --validate and --dry_run return before Isaac Sim is launched (see startup.py)
 
 """
 
 # Import base main 
  
 import argparse
-from isaaclab.app import AppLauncher 
+import os
+import sys
+
+from startup import StartupTimer, resolve_labware, run_light_command
+
+startup_timer = StartupTimer()
 
 # argparse command line arguments
 parser = argparse.ArgumentParser(description="Keyboard teleoperation for Isaac Lab environments.")
@@ -25,78 +44,380 @@ parser.add_argument("--teleop_device", type=str, default="keyboard", help="Devic
 parser.add_argument("--task", type=str, default="Isaac-Lift-Cube-Franka-v0", help="Name of the task.")
 parser.add_argument("--sensitivity", type=float, default=2.0, help="Sensitivity factor.")
 parser.add_argument("--enable_pinocchio", action="store_true", default=False, help="Enable Pinocchio.",)
+parser.add_argument(
+    "--labware", type=str, default="con_flask", help="Labware in chills/assets to teleoperate, 'none' for the default."
+)
+parser.add_argument(
+    "--output", type=str, default=None, help="Record the teleop episodes to this HDF5 file (e.g. demos.hdf5)."
+)
+parser.add_argument(
+    "--multi_labware",
+    type=str,
+    nargs="*",
+    default=None,
+    help="Spawn a different labware in each environment, round-robin over the given names (all by default).",
+)
+parser.add_argument("--seed", type=int, default=None, help="Seed of the environment and the scripted device.")
+parser.add_argument(
+    "--grasp_offset",
+    type=float,
+    nargs=3,
+    default=None,
+    help="Grasp point [m] of the scripted device in the labware frame, overrides the labware.yaml 'grasp_offset'.",
+)
+parser.add_argument("--max_episodes", type=int, default=None, help="Stop after this many finished episodes.")
+parser.add_argument("--progress", type=str, default=None, help="Periodically write the progress to this JSON file.")
+parser.add_argument(
+    "--async_input",
+    action="store_true",
+    default=False,
+    help="Read the keyboard or spacemouse on its own thread.",
+)
+parser.add_argument("--input_rate", type=float, default=200.0, help="Device rate [Hz] of --async_input.")
+parser.add_argument("--smoothing", type=float, default=0.0, help="Smoothing of the --async_input delta pose [0, 1).")
+parser.add_argument("--dead_zone", type=float, default=0.0, help="Dead zone of the --async_input delta pose.")
+parser.add_argument(
+    "--checkpoint", type=str, default=None, help="TorchScript or state_dict policy of --teleop_device policy."
+)
+parser.add_argument(
+    "--activation", type=str, default="elu", choices=["elu", "relu", "tanh"], help="Activation of a state_dict MLP."
+)
+parser.add_argument("--chunk_size", type=int, default=1, help="Actions predicted per query of the policy.")
+parser.add_argument("--execute_steps", type=int, default=None, help="Steps each action chunk is replayed.")
+parser.add_argument(
+    "--ensemble_decay", type=float, default=None, help="Temporal ensembling of the action chunks with this decay."
+)
+parser.add_argument(
+    "--fast_reset", action="store_true", default=False, help="Reset the object poses from a precomputed table."
+)
+parser.add_argument("--reset_states", type=int, default=1024, help="Initial states per labware of --fast_reset.")
+parser.add_argument("--reset_yaw", type=float, default=0.0, help="Random yaw range [deg] (+-) of --fast_reset.")
+parser.add_argument(
+    "--metrics", action="store_true", default=False, help="Print the success and grasp metrics per labware at exit."
+)
+parser.add_argument(
+    "--profile",
+    type=str,
+    nargs="?",
+    const="teleop_trace.json",
+    default=None,
+    help="Time the loop sections, write a Chrome trace to this file and print a summary at exit.",
+)
+parser.add_argument(
+    "--capture", type=str, default=None, help="Capture the camera frames of every environment to this directory."
+)
+parser.add_argument("--capture_format", type=str, default="npz", choices=["npz", "mp4"], help="Format of --capture.")
+parser.add_argument("--camera_size", type=int, default=128, help="Width and height of the --capture frames.")
+parser.add_argument("--list_labware", action="store_true", default=False, help="List the labware and exit.")
+parser.add_argument("--validate", action="store_true", default=False, help="Validate all labware and exit.")
+parser.add_argument(
+    "--dry_run", action="store_true", default=False, help="Validate and print the resolved configuration and exit."
+)
+parser.add_argument(
+    "--startup_times", type=str, nargs="?", const="-", default=None, help="Report the startup stage times (to JSON)."
+)
+
+# Light commands, answered without launching Isaac Sim or importing torch
+if "-h" not in sys.argv and "--help" not in sys.argv:
+    light_args, _ = parser.parse_known_args()
+    if light_args.list_labware or light_args.validate or light_args.dry_run:
+        sys.exit(run_light_command(light_args))
 
 # Isaac Sim app launcher 
+with startup_timer.stage("import isaaclab.app"):
+    from isaaclab.app import AppLauncher
+
 AppLauncher.add_app_launcher_args(parser)
 args_cli = parser.parse_args()
+# the batched devices step with the observations and reset per environment, they are not read on a thread
+if args_cli.async_input and args_cli.teleop_device.lower() in ("scripted", "policy"):
+    parser.error(f"--async_input only applies to the keyboard and spacemouse, not '{args_cli.teleop_device}'.")
+if args_cli.capture is not None:
+    # checked again by FrameCapture, here before the app is launched
+    if os.path.isdir(args_cli.capture) and os.listdir(args_cli.capture):
+        parser.error(f"The --capture directory '{args_cli.capture}' is not empty.")
+    args_cli.enable_cameras = True
+# unknown or unconverted labware fails here, not after the app is launched
+labware_names = resolve_labware(args_cli)
 app_launcher_args = vars(args_cli)
-app_launcher = AppLauncher(app_launcher_args)
-simulation_app = app_launcher.app
+with startup_timer.stage("launch app"):
+    app_launcher = AppLauncher(app_launcher_args)
+    simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
-import torch
-import omni.log
-import isaaclab_tasks   
-import numpy as np
-import gymnasium as gym 
-from isaaclab.devices import  Se3Keyboard, Se3SpaceMouse 
-from isaaclab.managers import TerminationTermCfg as DoneTerm 
-from isaaclab_tasks.manager_based.manipulation.lift import mdp
-from isaaclab_tasks.utils import parse_env_cfg
-from scipy.spatial.transform import Rotation as R 
-import os 
-
-# Changes from Euler (360') Angles [x,y,z] to Isaac Quaternion [w,x,y,z] format
-def deg2quat_wxyz(euler_deg):
-    quat_xyzw = R.from_euler('xyz', euler_deg, degrees=True).as_quat()
-    quat_wxyz = np.roll(quat_xyzw, 1)  # xyzw -> wxyz
-    return quat_wxyz.tolist()
-
-cwd = os.getcwd()
-Labwear = {
-    "Beaker": {
-        "spawn.usd_path": os.path.join(cwd, "assets", "beaker", "beaker.usd"),
-        "spawn.scale": (0.01, 0.01, 0.01),
-        "init_state.pos": [0.5, 0, 0.055],
-        "init_state.rot": deg2quat_wxyz([90, 0, 0]), # This is upright
-    }, 
-    "Round_Bot": {
-        "spawn.usd_path": os.path.join(cwd, "assets", "round_bot", "round_bot.usd"),
-        "spawn.scale": (0.01, 0.01, 0.01),
-        "init_state.pos": [0.5, 0, 0.055],
-        "init_state.rot": deg2quat_wxyz([90, 0, 0]), # This is upright
-    },
-    "Conical_flask": {
-        "spawn.usd_path": os.path.join(cwd, "assets", "con_flask", "con_flask.usd"),
-        "spawn.scale": (0.01, 0.01, 0.01),
-        "init_state.pos": [0.5, 0, 0.055],
-        "init_state.rot": deg2quat_wxyz([0, 0, 90]), # This is upright
-    },
-    
-}
-# Comment the following line to use the default object in the environment
-obj_cfg = list(Labwear.values())[2] # or Labwear[next(iter(Labwear))] 
-
-def obj_override(obj : object, overrides : dict) -> object:
-    """Dynamically override the object spawn parameters in the environment confg."""
-    for key, value in overrides.items():
-        parts = key.split(".")
-        target = obj
-        for part in parts[:-1]:
-            target = getattr(target, part)
-        setattr(target, parts[-1], value)
-    return obj
-
-def pre_process_actions(
-    teleop_data: tuple[np.ndarray, bool] | list[tuple[np.ndarray, np.ndarray, np.ndarray]], num_envs: int, device: str) -> torch.Tensor:
-    """ Convert teleop data to  Processed actions as a tensor """
-    # resolve gripper command, convert to torch and computes actions
-    delta_pose, gripper_command = teleop_data
-    delta_pose = torch.tensor(delta_pose, dtype=torch.float, device=device).repeat(num_envs, 1)
-    gripper_vel = torch.zeros((delta_pose.shape[0], 1), dtype=torch.float, device=device)
-    gripper_vel[:] = -1 if gripper_command else 1
-    return torch.concat([delta_pose, gripper_vel], dim=1)
+with startup_timer.stage("import torch"):
+    import torch
+with startup_timer.stage("import isaaclab_tasks"):
+    import omni.log
+    import isaaclab_tasks   
+    import gymnasium as gym 
+    from isaaclab.devices import  Se3Keyboard, Se3SpaceMouse 
+    import isaaclab.sim as sim_utils
+    from isaaclab.managers import EventTermCfg as EventTerm
+    from isaaclab.sensors import TiledCameraCfg
+    from isaaclab.managers import TerminationTermCfg as DoneTerm 
+    from isaaclab_tasks.manager_based.manipulation.lift import mdp
+    from isaaclab_tasks.utils import parse_env_cfg
+
+from actions import ActionBuffer
+from recorder import EpisodeRecorder, observation_layout
+from teleop_input import AsyncTeleop
+from scripted_teleop import ScriptedTeleop
+from policy_teleop import PolicyTeleop, load_policy
+from collect_farm import ProgressWriter
+from profiler import NullProfiler, StepProfiler
+from reset_cache import InitialStateTable, capture_episode_state, reset_object_from_table, unlifted_env_ids
+from metrics import EpisodeMetrics
+from frame_capture import FrameCapture
+from labware import Labwear, deg2quat_wxyz, apply_labware_poses, labware_pose_table, multi_obj_override, obj_override
+
+
+def configure_scene(env_cfg) -> tuple[list[dict], list[str]]:
+    """Set the labware, the reset events and the camera of the task config.
+
+    Returns:
+        The override dicts of the spawned labware (round-robin over the environments) and their names.
+    """
+    # Set the object to be teleoperated, labware without a pose in its sidecar spawns at the task's object pose
+    init_state = env_cfg.scene.object.init_state
+    task_pose = {"init_state.pos": list(init_state.pos), "init_state.rot": list(init_state.rot)}
+    if args_cli.multi_labware is not None:
+        # one labware per environment, round-robin over the labware resolved before the launch
+        names = labware_names
+        labware = [{**task_pose, **Labwear[name]} for name in names]
+        env_cfg.scene.object = multi_obj_override(env_cfg.scene.object, labware)
+        env_cfg.scene.replicate_physics = False
+    elif labware_names:
+        obj_cfg = Labwear[labware_names[0]]
+        env_cfg.scene.object = obj_override(env_cfg.scene.object, obj_cfg)
+        labware = [{**task_pose, **obj_cfg}]
+        names = labware_names
+    else:
+        # the task's object
+        labware = [task_pose]
+        names = ["task"]
+
+    env_cfg.commands.object_pose.resampling_time_range = (1.0e9, 1.0e9)
+    env_cfg.terminations.object_reached_goal = DoneTerm(func=mdp.object_reached_goal)
+    if args_cli.fast_reset:
+        # draw the reset poses from a table sampled once per labware instead of randomizing on every reset
+        table = InitialStateTable(
+            labware,
+            args_cli.num_envs,
+            env_cfg.sim.device,
+            num_states=args_cli.reset_states,
+            yaw_range_deg=(-args_cli.reset_yaw, args_cli.reset_yaw),
+            seed=args_cli.seed or 0,
+        )
+        env_cfg.events.reset_object_position = EventTerm(
+            func=reset_object_from_table, mode="reset", params={"table": table}
+        )
+    if args_cli.capture is not None:
+        # one tiled camera per environment in front of the table, looking back at the robot
+        env_cfg.scene.camera = TiledCameraCfg(
+            prim_path="{ENV_REGEX_NS}/Camera",
+            offset=TiledCameraCfg.OffsetCfg(pos=(1.4, 0.0, 0.6), rot=deg2quat_wxyz([0, 20, 180]), convention="world"),
+            data_types=["rgb"],
+            spawn=sim_utils.PinholeCameraCfg(focal_length=24.0, clipping_range=(0.1, 10.0)),
+            width=args_cli.camera_size,
+            height=args_cli.camera_size,
+        )
+    return labware, names
+
+
+def create_teleop_interface(env, labware: list[dict], names: list[str], policy_obs_fn):
+    """Create the teleop device of ``--teleop_device``, read on its own thread with ``--async_input``."""
+    if args_cli.teleop_device.lower() == "keyboard":
+        teleop_interface = Se3Keyboard(
+            pos_sensitivity=0.05 * args_cli.sensitivity, rot_sensitivity=0.05 * args_cli.sensitivity
+        )
+    elif args_cli.teleop_device.lower() == "spacemouse":
+        teleop_interface = Se3SpaceMouse(
+            pos_sensitivity=0.05 * args_cli.sensitivity, rot_sensitivity=0.05 * args_cli.sensitivity
+        )
+    elif args_cli.teleop_device.lower() == "scripted":
+        # approach-grasp-lift of every environment's labware, closed loop on the scene state
+        labware_ids, labware_pos, labware_rot = labware_pose_table(labware, env.num_envs, env.device)
+        if args_cli.grasp_offset is not None:
+            grasp_offset = args_cli.grasp_offset
+        else:
+            # per labware from its sidecar, the task's object is grasped at its origin
+            offsets = [Labwear.grasp_offset(name) if name in Labwear else (0.0, 0.0, 0.0) for name in names]
+            missing = [name for name, offset in zip(names, offsets) if offset is None]
+            if missing:
+                omni.log.warn(
+                    f"No 'grasp_offset' in the labware.yaml of {missing}, the scripted device grasps their origin."
+                    " Set it in the sidecar or pass --grasp_offset."
+                )
+            offsets = [(0.0, 0.0, 0.0) if offset is None else offset for offset in offsets]
+            grasp_offset = torch.tensor(offsets, dtype=torch.float, device=env.device)[labware_ids]
+        ee_frame, obj = env.scene["ee_frame"], env.scene["object"]
+        teleop_interface = ScriptedTeleop(
+            env.num_envs,
+            env.device,
+            labware_pos,
+            labware_rot,
+            ee_pos_fn=lambda: ee_frame.data.target_pos_w[:, 0, :] - env.scene.env_origins,
+            object_pos_fn=lambda: obj.data.root_pos_w - env.scene.env_origins,
+            grasp_offset=grasp_offset,
+            max_delta=0.05 * args_cli.sensitivity,
+            seed=args_cli.seed or 0,
+        )
+    elif args_cli.teleop_device.lower() == "policy":
+        if args_cli.checkpoint is None:
+            raise ValueError("The policy device needs a --checkpoint.")
+        # one batched forward pass over the policy observations of all environments per step
+        teleop_interface = PolicyTeleop(
+            load_policy(args_cli.checkpoint, env.device, args_cli.activation),
+            env.num_envs,
+            env.device,
+            obs_fn=policy_obs_fn,
+            chunk_size=args_cli.chunk_size,
+            execute_steps=args_cli.execute_steps,
+            ensemble_decay=args_cli.ensemble_decay,
+        )
+    else:
+        raise ValueError(
+            f"Invalid device interface '{args_cli.teleop_device}'."
+            " Supported: 'keyboard', 'spacemouse', 'scripted', 'policy'."
+        )
+
+    # read the device at its own rate, the loop samples the latest input
+    if args_cli.async_input:
+        teleop_interface = AsyncTeleop(
+            teleop_interface, rate_hz=args_cli.input_rate, smoothing=args_cli.smoothing, dead_zone=args_cli.dead_zone
+        )
+    return teleop_interface
+
+
+class EpisodeTracker:
+    """Episode boundaries of the recorder, the frame capture, the metrics, the progress and the batched devices.
+
+    The episodes end on the auto-resets of the env (:meth:`after_step`) or on the resets requested by the loop
+    (:meth:`restart`), both per environment.
+
+    Args:
+        env: The environment.
+        teleop_interface: The teleop device, the batched ones keep per-environment state.
+        labware: Override dicts of the labware, round-robin over the environments.
+        names: Names of the labware, for the metrics.
+        profiler: Times the recording and the resets.
+    """
+
+    def __init__(self, env, teleop_interface, labware: list[dict], names: list[str], profiler):
+        self.env = env
+        self.teleop_interface = teleop_interface
+        self.profiler = profiler
+        self.all_env_ids = torch.arange(env.num_envs, device=env.device)
+
+        # record the episodes with their labware, the 'R' reset marks the episode boundaries
+        labware_ids, _, _ = labware_pose_table(labware, env.num_envs, env.device)
+        self.recorder = None
+        if args_cli.output is not None:
+            self.recorder = EpisodeRecorder(
+                args_cli.output,
+                env.num_envs,
+                env_name=args_cli.task,
+                labware=[names[i] for i in labware_ids.tolist()],
+                obs_layout=observation_layout(env),
+            )
+
+        # success, lift and drop rates per labware
+        self.metrics = None
+        if args_cli.metrics:
+            self.metrics = EpisodeMetrics(labware_ids, names, step_dt=env.step_dt)
+
+        # camera frames encoded off the sim loop
+        self.capture = None
+        if args_cli.capture is not None:
+            self.capture = FrameCapture(
+                args_cli.capture,
+                env.num_envs,
+                (args_cli.camera_size, args_cli.camera_size, 3),
+                file_format=args_cli.capture_format,
+                fps=round(1.0 / env.step_dt),
+            )
+
+        # episode counts for --max_episodes and the --progress file of collect_farm.py
+        self.progress = ProgressWriter(args_cli.progress)
+
+    def object_height(self) -> torch.Tensor:
+        return self.env.scene["object"].data.root_pos_w[:, 2] - self.env.scene.env_origins[:, 2]
+
+    def start(self, env_ids: torch.Tensor | None = None):
+        """Start the episodes of the freshly reset environments, all of them after the first reset."""
+        if env_ids is None:
+            env_ids = self.all_env_ids
+            if self.metrics is not None:
+                self.metrics.start(self.object_height())
+        # the initial state of the new episodes, to replay them from the same start
+        if self.recorder is not None and len(env_ids) > 0:
+            self.recorder.start_episode(env_ids, capture_episode_state(self.env, env_ids))
+
+    def add_frames(self):
+        if self.capture is not None:
+            # the frame before the step, aligned with the recorded observations
+            with self.profiler.section("capture"):
+                self.capture.add_frames(self.env.scene["camera"].data.output["rgb"])
+
+    def after_step(self, obs: dict, actions: torch.Tensor, rewards: torch.Tensor, dones: torch.Tensor):
+        """Record the step and restart the episodes the env finished and auto-reset."""
+        # terminated also covers failures (object_dropping), only reaching the goal is a success
+        reached_goal = self.env.termination_manager.get_term("object_reached_goal")
+        done_ids = dones.nonzero().flatten()
+        if self.recorder is not None:
+            with self.profiler.section("record"):
+                self.recorder.add_step(obs, actions, rewards)
+                # finished environments are auto-reset by the env and start a new episode
+                if len(done_ids) > 0:
+                    self.recorder.end_episode(done_ids, success=reached_goal[dones])
+                    self.start(done_ids)
+        if self.capture is not None and len(done_ids) > 0:
+            self.capture.end_episode(done_ids)
+        self.progress.update(len(done_ids), int(reached_goal.sum()), self.env.num_envs)
+        if self.metrics is not None:
+            self.metrics.update(self.object_height(), reached_goal, dones)
+        if len(done_ids) > 0:
+            # the pending actions belong to the finished episodes
+            self._reset_device(done_ids)
+
+    def restart(self, env_ids: torch.Tensor, success: torch.Tensor) -> dict:
+        """End the episodes of ``env_ids``, reset these environments and start their next episode.
+
+        Returns:
+            The observations after the reset.
+        """
+        if self.recorder is not None:
+            self.recorder.end_episode(env_ids, success=success)
+        if self.capture is not None:
+            self.capture.end_episode(env_ids)
+        with self.profiler.section("reset"):
+            obs, _ = self.env.reset(env_ids=env_ids)
+        self.start(env_ids)
+        if self.metrics is not None:
+            self.metrics.end(env_ids, success, self.object_height()[env_ids])
+        self._reset_device(env_ids)
+        self.progress.update(len(env_ids), int(success.sum()))
+        return obs
+
+    def _reset_device(self, env_ids: torch.Tensor):
+        if isinstance(self.teleop_interface, (PolicyTeleop, ScriptedTeleop)):
+            self.teleop_interface.reset(env_ids)
+
+    def close(self, complete: bool = True):
+        """Close the outputs, the episodes still running are discarded unless ``complete``."""
+        if self.recorder is not None:
+            if not complete:
+                self.recorder.end_episode(discard=True)
+            self.recorder.close()
+        if self.capture is not None:
+            self.capture.close()
+            print(f"Captured {self.capture.num_frames} steps to {args_cli.capture}, {self.capture.num_dropped} dropped")
+        self.progress.update(force=True)
+        if self.metrics is not None:
+            self.metrics.print_summary()
+
 
 def main():
     """Running keyboard teleoperation with Isaac Lab manipulation environment."""
@@ -105,16 +426,19 @@ def main():
     env_cfg.env_name = args_cli.task
     env_cfg.terminations.time_out = None
 
-    # Set the object to be teleoperated
-    if os.path.exists(obj_cfg.get("spawn.usd_path", "")):
-        env_cfg.scene.object = obj_override(env_cfg.scene.object, obj_cfg)
-             
-    env_cfg.commands.object_pose.resampling_time_range = (1.0e9, 1.0e9)
-    env_cfg.terminations.object_reached_goal = DoneTerm(func=mdp.object_reached_goal)
-    env = gym.make(args_cli.task, cfg=env_cfg).unwrapped
+    if args_cli.seed is not None:
+        env_cfg.seed = args_cli.seed
+
+    labware, names = configure_scene(env_cfg)
+    with startup_timer.stage("create environment"):
+        env = gym.make(args_cli.task, cfg=env_cfg).unwrapped
     
     print(f"Environment: {env}")
 
+    if args_cli.multi_labware is not None:
+        _, labware_pos, labware_rot = labware_pose_table(labware, env.num_envs, env.device)
+        apply_labware_poses(env.scene["object"], labware_pos, labware_rot)
+
     # Flags for controlling teleoperation flow
     should_reset_recording_instance = False
     teleoperation_active = True
@@ -126,44 +450,82 @@ def main():
         nonlocal should_reset_recording_instance
         should_reset_recording_instance = True
 
-    # create controller
-    if args_cli.teleop_device.lower() == "keyboard":
-        teleop_interface = Se3Keyboard(
-            pos_sensitivity=0.05 * args_cli.sensitivity, rot_sensitivity=0.05 * args_cli.sensitivity
-        )
-    elif args_cli.teleop_device.lower() == "spacemouse":
-        teleop_interface = Se3SpaceMouse(
-            pos_sensitivity=0.05 * args_cli.sensitivity, rot_sensitivity=0.05 * args_cli.sensitivity
-        )
-    else:
-        raise ValueError(
-            f"Invalid device interface '{args_cli.teleop_device}'. Supported: 'keyboard', 'spacemouse', 'gamepad',"
-            " 'handtracking', 'handtracking_abs'."
-        )
+    # create controller, the policy reads the observations of the current step
+    teleop_interface = create_teleop_interface(env, labware, names, lambda: obs["policy"])
 
     # add teleoperation key for env reset (for all devices)
     teleop_interface.add_callback("R", reset_recording_instance)
     print(teleop_interface)
 
+    # persistent action buffer, written in place every step
+    action_buffer = ActionBuffer(env.num_envs, env.device)
+
+    # opt-in timing of the loop sections
+    profiler = NullProfiler()
+    if args_cli.profile is not None:
+        synchronize = torch.cuda.synchronize if "cuda" in str(env.device) else None
+        profiler = StepProfiler(synchronize=synchronize)
+
+    # recorder, frame capture, metrics and progress of the episodes
+    episodes = EpisodeTracker(env, teleop_interface, labware, names, profiler)
+
     # reset environment
-    env.reset()
+    with startup_timer.stage("first reset"):
+        obs, _ = env.reset()
+    episodes.start()
     teleop_interface.reset()
+    if args_cli.startup_times is not None:
+        startup_timer.report(args_cli.startup_times)
 
+    complete = True
     while simulation_app.is_running():
         with torch.inference_mode():
-            teleop_data = teleop_interface.advance()
+            with profiler.section("advance"):
+                teleop_data = teleop_interface.advance()
 
             # Only apply teleop commands, compute and aply actions when active
             if teleoperation_active:
-                actions = pre_process_actions(teleop_data, env.num_envs, env.device)
-                env.step(actions)
+                with profiler.section("actions"):
+                    actions = action_buffer(teleop_data)
+                episodes.add_frames()
+                with profiler.section("step"):
+                    next_obs, rewards, terminated, truncated, _ = env.step(actions)
+                episodes.after_step(obs, actions, rewards, terminated | truncated)
+                obs = next_obs
+
+                if isinstance(teleop_interface, ScriptedTeleop):
+                    # environments through the script end their episode and start the next demo
+                    finished_ids = teleop_interface.finished.nonzero().flatten()
+                    if len(finished_ids) > 0:
+                        obs = episodes.restart(finished_ids, teleop_interface.succeeded(finished_ids))
+
+                if args_cli.max_episodes is not None and episodes.progress.episodes >= args_cli.max_episodes:
+                    # the episodes still running are incomplete
+                    complete = False
+                    break
 
             else:
-                env.sim.render()
+                with profiler.section("render"):
+                    env.sim.render()
 
             if should_reset_recording_instance:
-                env.reset()
+                # per-environment reset of the failed grasps, the environments holding their object up keep going
+                reset_ids = unlifted_env_ids(env)
+                if len(reset_ids) == 0:
+                    reset_ids = episodes.all_env_ids
+                obs = episodes.restart(reset_ids, torch.zeros_like(reset_ids, dtype=torch.bool))
                 should_reset_recording_instance = False
+
+    episodes.close(complete)
+    if args_cli.profile is not None:
+        profiler.print_summary()
+        profiler.export_chrome_trace(args_cli.profile)
+        print(f"Trace written to {args_cli.profile}, open it in https://ui.perfetto.dev")
+    if args_cli.async_input:
+        teleop_interface.close()
+        print(f"Input-to-action latency: {teleop_interface.latency_stats()}")
+    if isinstance(teleop_interface, PolicyTeleop):
+        print(f"Policy inference latency: {teleop_interface.latency_stats()}")
     env.close()
 
 
@@ -0,0 +1,264 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Trained policy as a teleop device, to evaluate it closed loop on the labware through the same Chills loop.
+
+Every ``advance()`` runs one batched forward pass over the observations of all environments and returns the
+``(num_envs, 6)`` delta pose and ``(num_envs,)`` gripper mask like ``ScriptedTeleop``. The checkpoint is a
+TorchScript module or a ``state_dict`` of an MLP (plain, ``{"state_dict": ...}``, or an rsl_rl
+``{"model_state_dict": ...}`` whose ``actor.`` layers are used), the layer sizes are read from the weights and
+the activation is ``--activation``. Weights the MLP would not apply, e.g. an observation normalizer, are an error.
+
+Policies predicting ``chunk_size`` future actions per query (action chunking) either replay each chunk for
+``execute_steps`` steps, or are queried every step with the predictions of the last ``chunk_size`` queries for
+the current step averaged (temporal ensembling, weights ``exp(-ensemble_decay * i)`` with ``i = 0`` for the
+oldest prediction).
+
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --teleop_device policy --checkpoint policy.pt --num_envs 256 --multi_labware --metrics --headless
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --teleop_device policy --checkpoint act.pt --chunk_size 16 --ensemble_decay 0.01
+python .\\policy_teleop.py --num_envs 1024 --chunk_size 16 --ensemble_decay 0.01
+
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+import torch
+from torch import nn
+
+from teleop_input import LATENCY_PERCENTILES
+
+ACTIVATIONS = {"elu": nn.ELU, "relu": nn.ReLU, "tanh": nn.Tanh}
+# entries of an rsl_rl checkpoint that inference does not need: the training state, the critic and the action noise
+TRAINING_KEYS = ("optimizer_state_dict", "iter", "infos")
+UNUSED_PREFIXES = ("critic.", "std", "log_std")
+
+
+class MLPPolicy(nn.Module):
+    """MLP from the observations to ``chunk_size`` actions, the architecture of the ``state_dict`` checkpoints."""
+
+    def __init__(self, layer_dims: list[int], activation: str = "elu"):
+        super().__init__()
+        layers = []
+        for i, (dim_in, dim_out) in enumerate(zip(layer_dims[:-1], layer_dims[1:])):
+            layers.append(nn.Linear(dim_in, dim_out))
+            if i < len(layer_dims) - 2:
+                layers.append(ACTIVATIONS[activation]())
+        self.net = nn.Sequential(*layers)
+
+    def forward(self, obs: torch.Tensor) -> torch.Tensor:
+        return self.net(obs)
+
+
+def _mlp_state_dict(checkpoint: dict) -> dict[str, torch.Tensor]:
+    """Weights of the MLP in a checkpoint, keyed like :class:`MLPPolicy`.
+
+    Raises:
+        ValueError: If the checkpoint has entries the MLP would silently ignore, e.g. ``obs_normalizer``.
+    """
+    unexpected = []
+    for wrapper in ("state_dict", "model_state_dict"):
+        if wrapper in checkpoint:
+            unexpected += [key for key in checkpoint if key != wrapper and key not in TRAINING_KEYS]
+            checkpoint = checkpoint[wrapper]
+            break
+    if any(key.startswith("actor.") for key in checkpoint):
+        prefix = "actor."
+        unexpected += [key for key in checkpoint if not key.startswith((prefix, *UNUSED_PREFIXES))]
+    else:
+        prefix = "net."
+        unexpected += [key for key in checkpoint if not key.startswith(prefix)]
+    if unexpected:
+        raise ValueError(f"Unexpected entries in the checkpoint, not part of an MLP policy: {unexpected}")
+    return {"net." + key[len(prefix) :]: value for key, value in checkpoint.items() if key.startswith(prefix)}
+
+
+def load_policy(path: str, device: str, activation: str = "elu") -> nn.Module:
+    """Load a TorchScript or ``state_dict`` checkpoint for inference on ``device``.
+
+    ``activation`` is the one of the hidden layers of a ``state_dict`` MLP (see :data:`ACTIVATIONS`).
+    """
+    try:
+        policy = torch.jit.load(path, map_location=device)
+    except RuntimeError:
+        checkpoint = torch.load(path, map_location=device, weights_only=True)
+        if not isinstance(checkpoint, dict):
+            raise ValueError(f"'{path}' is neither TorchScript nor a state_dict of an MLP.")
+        state_dict = _mlp_state_dict(checkpoint)
+        weights = sorted(
+            (key for key in state_dict if key.endswith(".weight")), key=lambda key: int(key.split(".")[1])
+        )
+        if not weights:
+            raise ValueError(f"'{path}' is neither TorchScript nor a state_dict of an MLP.")
+        layer_dims = [state_dict[weights[0]].shape[1]] + [state_dict[key].shape[0] for key in weights]
+        policy = MLPPolicy(layer_dims, activation)
+        # the Linear layers of MLPPolicy are every other module of the Sequential
+        renamed = {}
+        for i, key in enumerate(weights):
+            renamed[f"net.{2 * i}.weight"] = state_dict[key]
+            renamed[f"net.{2 * i}.bias"] = state_dict[key[: -len("weight")] + "bias"]
+        policy.load_state_dict(renamed)
+    return policy.to(device).eval()
+
+
+class PolicyTeleop:
+    """Batched policy inference with the interface of ``Se3Keyboard``.
+
+    Args:
+        policy: Module mapping the ``(num_envs, obs_dim)`` observations to ``(num_envs, chunk_size * action_dim)``
+            or ``(num_envs, chunk_size, action_dim)`` actions, see :func:`load_policy`.
+        num_envs: Number of environments.
+        device: Torch device of the policy and the commands.
+        obs_fn: Returns the ``(num_envs, obs_dim)`` observations of the current step.
+        chunk_size: Actions predicted per query.
+        execute_steps: Steps each chunk is replayed before the next query, ``chunk_size`` by default. Not used with
+            temporal ensembling.
+        ensemble_decay: Decay of the temporal ensembling weights, ``None`` disables it.
+        action_dim: Size of an action, the delta pose and the gripper command (closed below 0).
+        latency_window: Number of the most recent forward passes kept for :meth:`latency_stats`.
+    """
+
+    def __init__(
+        self,
+        policy: nn.Module,
+        num_envs: int,
+        device: str,
+        obs_fn: Callable[[], torch.Tensor],
+        chunk_size: int = 1,
+        execute_steps: int | None = None,
+        ensemble_decay: float | None = None,
+        action_dim: int = 7,
+        latency_window: int = 1000,
+    ):
+        execute_steps = chunk_size if execute_steps is None else execute_steps
+        if not 1 <= execute_steps <= chunk_size:
+            raise ValueError(f"execute_steps must be in [1, {chunk_size}], got {execute_steps}.")
+        self.policy = policy
+        self.num_envs = num_envs
+        self.device = device
+        self.obs_fn = obs_fn
+        self.chunk_size = chunk_size
+        self.execute_steps = execute_steps
+        self.ensemble_decay = ensemble_decay
+        self.action_dim = action_dim
+        self._synchronize = torch.cuda.synchronize if "cuda" in str(device) else None
+        self._callbacks = {}
+
+        # chunk being replayed and the step of every environment in it, a new chunk is due at execute_steps
+        self._chunk = torch.zeros((num_envs, chunk_size, action_dim), device=device)
+        self._chunk_step = torch.full((num_envs,), execute_steps, dtype=torch.long, device=device)
+        # temporal ensembling: weighted sum and weights of the predictions for the next chunk_size steps, as a
+        # ring over the steps starting at _head. A prediction k steps ahead is used at age k, so its weight
+        # exp(decay * k) (proportional to exp(-decay * i) of the oldest-first index i) is known when it is made.
+        if ensemble_decay is not None:
+            self._weights = torch.exp(ensemble_decay * torch.arange(chunk_size, dtype=torch.float, device=device))
+            self._sum = torch.zeros((num_envs, chunk_size, action_dim), device=device)
+            self._weight_sum = torch.zeros((num_envs, chunk_size), device=device)
+            self._head = 0
+        self._action = torch.zeros((num_envs, action_dim), device=device)
+
+        self._latency = np.zeros(latency_window)
+        self.num_queries = 0
+
+    def __str__(self) -> str:
+        msg = f"Policy teleop device: {self.__class__.__name__}\n"
+        msg += f"\tEnvironments: {self.num_envs}\n"
+        msg += f"\tChunk size: {self.chunk_size}, "
+        if self.ensemble_decay is not None:
+            msg += f"temporal ensembling (decay {self.ensemble_decay})"
+        else:
+            msg += f"{self.execute_steps} steps executed per query"
+        return msg
+
+    def add_callback(self, key: str, func):
+        # no keys to press, kept for the interface of the other devices
+        self._callbacks[key] = func
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Drop the pending actions of the given environments (all by default), e.g. after their reset."""
+        env_ids = slice(None) if env_ids is None else env_ids
+        self._chunk_step[env_ids] = self.execute_steps
+        if self.ensemble_decay is not None:
+            self._sum[env_ids] = 0.0
+            self._weight_sum[env_ids] = 0.0
+
+    def advance(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Delta pose ``(num_envs, 6)`` and gripper mask ``(num_envs,)`` of the next step."""
+        if self.ensemble_decay is not None:
+            chunk = self._query()
+            ring = (self._head + torch.arange(self.chunk_size, device=self.device)) % self.chunk_size
+            self._sum[:, ring] += self._weights[:, None] * chunk
+            self._weight_sum[:, ring] += self._weights
+            self._action.copy_(self._sum[:, self._head] / self._weight_sum[:, self._head, None])
+            # the slot of the current step becomes the one chunk_size - 1 steps ahead
+            self._sum[:, self._head] = 0.0
+            self._weight_sum[:, self._head] = 0.0
+            self._head = (self._head + 1) % self.chunk_size
+        else:
+            due = self._chunk_step >= self.execute_steps
+            if due.any():
+                # one pass for all environments, only the due ones take their new chunk
+                chunk = self._query()
+                self._chunk[due] = chunk[due]
+                self._chunk_step[due] = 0
+            self._action.copy_(self._chunk[torch.arange(self.num_envs, device=self.device), self._chunk_step])
+            self._chunk_step += 1
+        return self._action[:, :6], self._action[:, 6] < 0
+
+    def _query(self) -> torch.Tensor:
+        """Forward pass of all environments, ``(num_envs, chunk_size, action_dim)``, timed."""
+        start = time.perf_counter()
+        with torch.inference_mode():
+            chunk = self.policy(self.obs_fn()).view(self.num_envs, self.chunk_size, self.action_dim)
+        if self._synchronize is not None:
+            self._synchronize()
+        self._latency[self.num_queries % len(self._latency)] = time.perf_counter() - start
+        self.num_queries += 1
+        return chunk
+
+    def latency_stats(self) -> dict[str, float]:
+        """Percentiles of the inference latency in milliseconds, and the number of forward passes."""
+        samples = self._latency[: min(self.num_queries, len(self._latency))]
+        if len(samples) == 0:
+            return {}
+        percentiles = np.percentile(samples * 1e3, LATENCY_PERCENTILES)
+        stats = {f"p{p}_ms": float(value) for p, value in zip(LATENCY_PERCENTILES, percentiles)}
+        stats["queries"] = self.num_queries
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the batched inference latency of a policy checkpoint.")
+    parser.add_argument("--checkpoint", type=str, default=None, help="TorchScript or state_dict, random MLP if unset.")
+    parser.add_argument("--num_envs", type=int, default=1024, help="Number of environments.")
+    parser.add_argument("--obs_dim", type=int, default=35, help="Observation size of the random MLP.")
+    parser.add_argument("--activation", type=str, default="elu", choices=list(ACTIVATIONS), help="MLP activation.")
+    parser.add_argument("--chunk_size", type=int, default=1, help="Actions predicted per query.")
+    parser.add_argument("--ensemble_decay", type=float, default=None, help="Temporal ensembling decay.")
+    parser.add_argument("--steps", type=int, default=500, help="Number of steps.")
+    parser.add_argument("--device", type=str, default="cuda" if torch.cuda.is_available() else "cpu", help="Device.")
+    args = parser.parse_args()
+
+    if args.checkpoint is not None:
+        policy = load_policy(args.checkpoint, args.device, args.activation)
+    else:
+        policy = MLPPolicy([args.obs_dim, 256, 256, 7 * args.chunk_size], args.activation).to(args.device).eval()
+    obs = torch.randn((args.num_envs, args.obs_dim), device=args.device)
+    device = PolicyTeleop(
+        policy, args.num_envs, args.device, lambda: obs, args.chunk_size, ensemble_decay=args.ensemble_decay
+    )
+    print(device)
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        device.advance()
+    elapsed = time.perf_counter() - start
+    print(f"{args.steps / elapsed:.0f} steps/s for {args.num_envs} envs, inference {device.latency_stats()}")
+
+
+if __name__ == "__main__":
+    main()
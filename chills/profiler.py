@@ -0,0 +1,145 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Per-step timing of the teleop loop, exported as a Chrome trace / Perfetto JSON and a summary table.
+
+The sections (``advance``, ``actions``, ``step``, ``reset``, ``render``, ...) are recorded into preallocated
+ring buffers, one ``perf_counter_ns`` pair and three array writes per section, the oldest events are
+overwritten once ``capacity`` is reached. Open the trace in https://ui.perfetto.dev or ``chrome://tracing``.
+
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --profile teleop_trace.json
+
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
+
+import numpy as np
+
+PERCENTILES = (50, 90, 99)
+
+
+class StepProfiler:
+    """Ring buffer of timed sections.
+
+    Args:
+        capacity: Number of section events kept.
+        synchronize: Called before a section ends, e.g. ``torch.cuda.synchronize`` to include the GPU work
+            queued by the section instead of only its launch.
+    """
+
+    def __init__(self, capacity: int = 1 << 20, synchronize: Callable[[], None] | None = None):
+        self.capacity = capacity
+        self.synchronize = synchronize
+        self.names: list[str] = []
+        self._sections: dict[str, _Section] = {}
+        self._section = np.zeros(capacity, dtype=np.int16)
+        self._start = np.zeros(capacity, dtype=np.int64)
+        self._duration = np.zeros(capacity, dtype=np.int64)
+        self.num_events = 0
+        self._origin = time.perf_counter_ns()
+
+    def section(self, name: str) -> "_Section":
+        """Context timing the enclosed code as ``name``, one reused object per name."""
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, len(self.names))
+            self.names.append(name)
+        return section
+
+    def _record(self, section_id: int, start: int, end: int):
+        i = self.num_events % self.capacity
+        self._section[i] = section_id
+        self._start[i] = start
+        self._duration[i] = end - start
+        self.num_events += 1
+
+    def events(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Section ids, start and duration [ns] of the kept events, oldest first."""
+        if self.num_events <= self.capacity:
+            order = np.arange(self.num_events)
+        else:
+            order = np.roll(np.arange(self.capacity), -(self.num_events % self.capacity))
+        return self._section[order], self._start[order], self._duration[order]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count, total, mean and percentiles [ms] of every section, over the kept events."""
+        sections, _, durations = self.events()
+        total = durations.sum()
+        summary = {}
+        for section_id, name in enumerate(self.names):
+            duration_ms = durations[sections == section_id] * 1e-6
+            if len(duration_ms) == 0:
+                continue
+            summary[name] = {
+                "count": len(duration_ms),
+                "total_ms": duration_ms.sum(),
+                "share": duration_ms.sum() * 1e6 / total,
+                "mean_ms": duration_ms.mean(),
+                **{f"p{p}_ms": value for p, value in zip(PERCENTILES, np.percentile(duration_ms, PERCENTILES))},
+                "max_ms": duration_ms.max(),
+            }
+        return summary
+
+    def print_summary(self):
+        summary = self.summary()
+        header = f"{'section':<10} {'count':>8} {'share':>7} {'mean [ms]':>10}" + "".join(
+            f" {f'p{p} [ms]':>10}" for p in PERCENTILES
+        ) + f" {'max [ms]':>10}"
+        print(header)
+        print("-" * len(header))
+        for name, stats in summary.items():
+            print(
+                f"{name:<10} {stats['count']:>8} {stats['share']:>7.1%} {stats['mean_ms']:>10.3f}"
+                + "".join(f" {stats[f'p{p}_ms']:>10.3f}" for p in PERCENTILES)
+                + f" {stats['max_ms']:>10.3f}"
+            )
+        if self.num_events > self.capacity:
+            print(f"(last {self.capacity} of {self.num_events} events)")
+
+    def export_chrome_trace(self, path: str):
+        """Write the kept events as complete ("X") events of the Chrome trace format."""
+        sections, starts, durations = self.events()
+        pid = os.getpid()
+        events = [
+            {"name": self.names[section_id], "ph": "X", "ts": start, "dur": duration, "pid": pid, "tid": 0}
+            for section_id, start, duration in zip(
+                sections.tolist(), ((starts - self._origin) / 1e3).tolist(), (durations / 1e3).tolist()
+            )
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+class _Section:
+    """Reusable timing context of one section name (not re-entrant)."""
+
+    __slots__ = ("profiler", "section_id", "start")
+
+    def __init__(self, profiler: StepProfiler, section_id: int):
+        self.profiler = profiler
+        self.section_id = section_id
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc):
+        if self.profiler.synchronize is not None:
+            self.profiler.synchronize()
+        self.profiler._record(self.section_id, self.start, time.perf_counter_ns())
+
+
+class NullProfiler:
+    """Stand-in without overhead when profiling is disabled."""
+
+    _context = nullcontext()
+
+    def section(self, name: str):
+        return self._context
@@ -0,0 +1,254 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Recorder of teleop demonstrations into a chunked, compressed HDF5 dataset.
+
+Every environment is recorded as its own episode, the file layout follows the robomimic style
+used by Isaac Lab:
+
+    data/                       attrs: env_name, num_envs, total, obs_layout (see observation_layout)
+        demo_0/                 attrs: num_samples, env_id, success, labware, initial_<key> (see start_episode)
+            actions             (T, action_dim)
+            rewards             (T,)
+            obs/<group>/<term>  (T, ...)
+
+The sim loop only copies the step to host memory, the HDF5 writes happen on a background thread. The queue
+between them is bounded, when the disk cannot keep up the sim loop waits for the writer (backpressure) instead
+of buffering without limit.
+"""
+
+import json
+import queue
+import threading
+
+import h5py
+import numpy as np
+import torch
+
+
+def _to_numpy(value) -> np.ndarray:
+    """Host copy of a tensor/array, the sim may overwrite its buffers in place after the step."""
+    if isinstance(value, torch.Tensor):
+        return value.detach().to("cpu", copy=True).numpy()
+    return np.array(value, copy=True)
+
+
+def _flatten(tree: dict | torch.Tensor | np.ndarray, prefix: str) -> dict[str, np.ndarray]:
+    """Flatten (nested) observation groups into ``{"obs/<group>/<term>": array}``."""
+    if not isinstance(tree, dict):
+        return {prefix: _to_numpy(tree)}
+    flat = {}
+    for key, value in tree.items():
+        flat.update(_flatten(value, f"{prefix}/{key}"))
+    return flat
+
+
+def observation_layout(env) -> dict[str, list]:
+    """Terms and per-environment shapes of every observation group, ``{group: [[term, shape], ...]}``.
+
+    The terms of a group are concatenated in this order in its recorded ``obs/<group>`` stream.
+    """
+    manager = env.observation_manager
+    return {
+        group: [[term, list(shape)] for term, shape in zip(terms, manager.group_obs_term_dim[group])]
+        for group, terms in manager.active_terms.items()
+    }
+
+
+class EpisodeRecorder:
+    """Streams the observations, actions and rewards of every environment to an HDF5 file.
+
+    Steps are batched over the environments, ``(num_envs, ...)``. They are buffered on the writer thread
+    and appended ``chunk_size`` steps at a time, which is also the HDF5 chunk length along time.
+
+    Args:
+        path: Output ``.hdf5`` file, overwritten if it exists.
+        num_envs: Number of parallel environments.
+        env_name: Stored as attribute of the ``data`` group.
+        labware: Labware name of every environment, stored as attribute of its episodes.
+        obs_layout: Observation terms of the groups (:func:`observation_layout`), stored as JSON attribute of
+            the ``data`` group.
+        chunk_size: Number of steps per HDF5 chunk and per write.
+        compression: HDF5 compression filter, ``"gzip"``, ``"lzf"`` or ``None``.
+        max_queue: Steps and commands that may wait for the writer thread before ``add_step`` blocks,
+            ``4 * chunk_size`` by default.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        num_envs: int,
+        env_name: str = "",
+        labware: list[str] | None = None,
+        obs_layout: dict[str, list] | None = None,
+        chunk_size: int = 256,
+        compression: str | None = "gzip",
+        max_queue: int | None = None,
+    ):
+        if labware is not None and len(labware) != num_envs:
+            raise ValueError(f"Expected the labware of {num_envs} environments, got {len(labware)}.")
+        self.path = path
+        self.num_envs = num_envs
+        self.labware = labware
+        self.chunk_size = chunk_size
+        self.compression = compression
+
+        self._file = h5py.File(path, "w")
+        self._data = self._file.create_group("data")
+        self._data.attrs["env_name"] = env_name
+        self._data.attrs["num_envs"] = num_envs
+        self._data.attrs["total"] = 0
+        if obs_layout is not None:
+            self._data.attrs["obs_layout"] = json.dumps(obs_layout)
+        self._num_demos = 0
+
+        # writer thread state: pending batched steps and the open episode group of every env
+        self._pending: list[dict[str, np.ndarray]] = []
+        self._episodes: list[h5py.Group | None] = [None] * num_envs
+        self._initial_states: list[dict[str, np.ndarray]] = [{} for _ in range(num_envs)]
+
+        self._queue = queue.Queue(maxsize=4 * chunk_size if max_queue is None else max_queue)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="EpisodeRecorder", daemon=True)
+        self._thread.start()
+
+    """
+    Sim loop side.
+    """
+
+    def add_step(self, obs: dict | torch.Tensor, actions: torch.Tensor, rewards: torch.Tensor):
+        """Record the observations the actions were computed from, the actions and the resulting rewards."""
+        self._raise_error()
+        step = _flatten(obs, "obs")
+        step["actions"] = _to_numpy(actions)
+        step["rewards"] = _to_numpy(rewards)
+        self._put(("step", step))
+
+    def start_episode(self, env_ids: torch.Tensor | np.ndarray | list[int], initial_state: dict[str, torch.Tensor]):
+        """Store the initial state ``{key: (len(env_ids), ...)}`` of the next episode of the given environments.
+
+        Called right after their reset, before the first step of the episode. The values are stored as the
+        ``initial_<key>`` attributes of the episode, e.g. to restore the start of a demo for its replay.
+        """
+        self._raise_error()
+        env_ids = _to_numpy(env_ids).reshape(-1)
+        self._put(("start", (env_ids, {key: _to_numpy(value) for key, value in initial_state.items()})))
+
+    def end_episode(
+        self, env_ids: torch.Tensor | np.ndarray | list[int] | None = None, success=False, discard: bool = False
+    ):
+        """Close the current episode of the given environments (all if ``None``).
+
+        ``success`` is a bool or a per-id mask, the next step of these environments starts a new episode.
+        With ``discard`` the episodes are removed from the file instead.
+        """
+        self._raise_error()
+        env_ids = np.arange(self.num_envs) if env_ids is None else _to_numpy(env_ids).reshape(-1)
+        success = np.broadcast_to(_to_numpy(success), env_ids.shape).astype(bool)
+        self._put(("end", (env_ids, success, discard)))
+
+    def close(self):
+        """Close the open episodes, wait for the writer thread and close the file.
+
+        The file is closed also when the writer failed, the error is raised afterwards.
+        """
+        try:
+            if self._thread.is_alive():
+                self.end_episode()
+                self._put(("close", None))
+                self._thread.join()
+        finally:
+            self._file.close()
+        self._raise_error()
+
+    def _put(self, item: tuple):
+        # blocks while the queue is full, but not on a writer thread that died
+        while True:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"Recording to '{self.path}' failed.") from self._error
+
+    """
+    Writer thread side.
+    """
+
+    def _run(self):
+        try:
+            while True:
+                command, payload = self._queue.get()
+                if command == "step":
+                    self._pending.append(payload)
+                    if len(self._pending) >= self.chunk_size:
+                        self._flush()
+                elif command == "start":
+                    env_ids, initial_state = payload
+                    for i, env_id in enumerate(env_ids.tolist()):
+                        self._initial_states[env_id] = {key: value[i] for key, value in initial_state.items()}
+                elif command == "end":
+                    self._flush()
+                    self._finish_episodes(*payload)
+                    # finished episodes stay readable if the process dies before close()
+                    self._file.flush()
+                elif command == "close":
+                    self._file.flush()
+                    return
+        except BaseException as e:
+            self._error = e
+
+    def _flush(self):
+        """Append the pending steps to the episode of every environment."""
+        if not self._pending:
+            return
+        # (T, num_envs, ...) per key
+        block = {key: np.stack([step[key] for step in self._pending]) for key in self._pending[0]}
+        length = len(self._pending)
+        self._pending.clear()
+
+        for env_id in range(self.num_envs):
+            episode = self._episodes[env_id]
+            if episode is None:
+                episode = self._episodes[env_id] = self._data.create_group(f"demo_{self._num_demos}")
+                episode.attrs["env_id"] = env_id
+                episode.attrs["num_samples"] = 0
+                for key, value in self._initial_states[env_id].items():
+                    episode.attrs[f"initial_{key}"] = value
+                self._initial_states[env_id] = {}
+                self._num_demos += 1
+            for key, values in block.items():
+                values = values[:, env_id]
+                if key not in episode:
+                    episode.create_dataset(
+                        key,
+                        shape=(0, *values.shape[1:]),
+                        maxshape=(None, *values.shape[1:]),
+                        dtype=values.dtype,
+                        chunks=(self.chunk_size, *values.shape[1:]),
+                        compression=self.compression,
+                    )
+                dataset = episode[key]
+                dataset.resize(dataset.shape[0] + length, axis=0)
+                dataset[-length:] = values
+            episode.attrs["num_samples"] += length
+
+    def _finish_episodes(self, env_ids: np.ndarray, success: np.ndarray, discard: bool):
+        for env_id, env_success in zip(env_ids.tolist(), success.tolist()):
+            episode = self._episodes[env_id]
+            if episode is None:
+                continue
+            if discard:
+                del self._data[episode.name]
+            else:
+                episode.attrs["success"] = env_success
+                if self.labware is not None:
+                    episode.attrs["labware"] = self.labware[env_id]
+                self._data.attrs["total"] += episode.attrs["num_samples"]
+            self._episodes[env_id] = None
@@ -0,0 +1,205 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Replay the recorded teleop demonstrations of ``object_override.py --output`` through the Lift task.
+
+The episodes are packed over the ``--num_envs`` parallel environments, every environment that finishes
+an episode is reset and refilled with the next one, so all environments keep replaying until the
+dataset is exhausted. The actions are replayed open-loop from the recorded initial state of each episode
+(object pose and goal, see ``reset_cache.restore_episode_state``), so a successful replay confirms the demo.
+Recordings without initial states are replayed from the reset state, set ``--no_randomization`` to disable
+the random object placement of the reset for them.
+
+python .\\replay_demos.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --dataset demos.hdf5 --num_envs 16 --headless
+python .\\replay_demos.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --dataset demos.hdf5 --labware beaker --output regen.hdf5
+
+"""
+
+import argparse
+from isaaclab.app import AppLauncher
+
+# argparse command line arguments
+parser = argparse.ArgumentParser(description="Replay recorded demonstrations in parallel Isaac Lab environments.")
+parser.add_argument("--dataset", type=str, required=True, help="HDF5 file recorded with object_override.py.")
+parser.add_argument("--num_envs", type=int, default=1, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default="Isaac-Lift-Cube-Franka-IK-Rel-v0", help="Name of the task.")
+parser.add_argument("--labware", type=str, default=None, help="Labware in chills/assets to replay with.")
+parser.add_argument("--output", type=str, default=None, help="Record the regenerated episodes to this HDF5 file.")
+parser.add_argument(
+    "--no_randomization", action="store_true", default=False, help="Disable the random object pose on reset."
+)
+
+# Isaac Sim app launcher
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+app_launcher = AppLauncher(vars(args_cli))
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+
+import gymnasium as gym
+import h5py
+import isaaclab_tasks
+import torch
+from isaaclab.managers import TerminationTermCfg as DoneTerm
+from isaaclab_tasks.manager_based.manipulation.lift import mdp
+from isaaclab_tasks.utils import parse_env_cfg
+
+from labware import Labwear, obj_override
+from recorder import EpisodeRecorder, observation_layout
+from reset_cache import capture_episode_state, restore_episode_state
+
+INITIAL_STATE_KEYS = ("object_state", "goal_pose")
+
+
+def load_initial_states(path: str, names: list[str], device: str) -> dict[str, torch.Tensor] | None:
+    """Recorded initial states ``{key: (num_episodes, ...)}`` of the demos, ``None`` if not all have one."""
+    with h5py.File(path, "r") as f:
+        demos = [f["data"][name] for name in names]
+        if not all(f"initial_{key}" in demo.attrs for demo in demos for key in INITIAL_STATE_KEYS):
+            return None
+        return {
+            key: torch.as_tensor(
+                [demo.attrs[f"initial_{key}"] for demo in demos], dtype=torch.float, device=device
+            )
+            for key in INITIAL_STATE_KEYS
+        }
+
+
+def load_episode_actions(path: str, device: str) -> tuple[list[str], torch.Tensor, torch.Tensor]:
+    """Load the actions of every demo, zero padded into one tensor.
+
+    Returns:
+        The demo names, the actions ``(num_episodes + 1, max_length, action_dim)`` and lengths ``(num_episodes + 1,)``.
+        The extra last episode is an idle one (no motion, gripper open) that never ends, it is replayed by the
+        environments left without an episode at the end of the dataset.
+    """
+    with h5py.File(path, "r") as f:
+        names = sorted(f["data"].keys(), key=lambda name: int(name.split("_")[-1]))
+        episodes = [torch.as_tensor(f["data"][name]["actions"][()], dtype=torch.float) for name in names]
+    if not episodes:
+        raise ValueError(f"No episodes found in '{path}'.")
+
+    lengths = torch.tensor([len(actions) for actions in episodes] + [torch.iinfo(torch.long).max], device=device)
+    actions = torch.zeros((len(episodes) + 1, max(len(a) for a in episodes), episodes[0].shape[-1]), device=device)
+    for i, episode_actions in enumerate(episodes):
+        actions[i, : len(episode_actions)] = episode_actions.to(device)
+    actions[-1, :, -1] = 1.0
+    return names, actions, lengths
+
+
+def main():
+    """Replay the demonstrations with Isaac Lab manipulation environment."""
+
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs)
+    env_cfg.env_name = args_cli.task
+    env_cfg.terminations.time_out = None
+    if args_cli.labware is not None:
+        env_cfg.scene.object = obj_override(env_cfg.scene.object, Labwear[args_cli.labware])
+    if args_cli.no_randomization:
+        env_cfg.events.reset_object_position = None
+    env_cfg.commands.object_pose.resampling_time_range = (1.0e9, 1.0e9)
+    env_cfg.terminations.object_reached_goal = DoneTerm(func=mdp.object_reached_goal)
+    env = gym.make(args_cli.task, cfg=env_cfg).unwrapped
+
+    names, episode_actions, episode_lengths = load_episode_actions(args_cli.dataset, env.device)
+    num_episodes = len(names)
+    idle_episode = num_episodes
+    print(f"Replaying {num_episodes} episodes from '{args_cli.dataset}' in {env.num_envs} environments.")
+    initial_states = load_initial_states(args_cli.dataset, names, env.device)
+    if initial_states is None:
+        print("The recording has no initial states, the episodes start from the reset state.")
+
+    recorder = None
+    if args_cli.output is not None:
+        recorder = EpisodeRecorder(
+            args_cli.output,
+            env.num_envs,
+            env_name=args_cli.task,
+            labware=None if args_cli.labware is None else [args_cli.labware] * env.num_envs,
+            obs_layout=observation_layout(env),
+        )
+
+    def start_episodes(ids: torch.Tensor):
+        """Put the freshly reset environments ``ids`` into the initial state of their episode."""
+        ids = ids[episode_ids[ids] != idle_episode]
+        if len(ids) == 0:
+            return
+        if initial_states is not None:
+            restore_episode_state(env, ids, {key: value[episode_ids[ids]] for key, value in initial_states.items()})
+        if recorder is not None:
+            recorder.start_episode(ids, capture_episode_state(env, ids))
+
+    # the first episodes fill the environments, the remaining environments idle
+    env_ids = torch.arange(env.num_envs, device=env.device)
+    episode_ids = torch.where(env_ids < num_episodes, env_ids, idle_episode)
+    step_ids = torch.zeros_like(env_ids)
+    next_episode = min(env.num_envs, num_episodes)
+    success = torch.zeros(num_episodes, dtype=torch.bool, device=env.device)
+    num_finished = 0
+    num_steps = 0
+
+    env.reset()
+    start_episodes(env_ids)
+    # the observations of the restored states
+    obs = env.observation_manager.compute()
+    start_time = time.perf_counter()
+    while simulation_app.is_running() and num_finished < num_episodes:
+        with torch.inference_mode():
+            actions = episode_actions[episode_ids, step_ids]
+            next_obs, rewards, terminated, truncated, _ = env.step(actions)
+            if recorder is not None:
+                recorder.add_step(obs, actions, rewards)
+            step_ids += 1
+            num_steps += 1
+
+            # an episode ends when the env terminates or its recorded actions run out
+            reset_by_env = terminated | truncated
+            done = (episode_ids != idle_episode) & (reset_by_env | (step_ids >= episode_lengths[episode_ids]))
+            if done.any():
+                done_ids = done.nonzero().flatten()
+                # terminated also covers failures (object_dropping), only reaching the goal is a success
+                reached_goal = env.termination_manager.get_term("object_reached_goal")[done_ids]
+                success[episode_ids[done_ids]] = reached_goal
+                if recorder is not None:
+                    recorder.end_episode(done_ids, success=reached_goal)
+
+                # environments that ran out of actions were not auto-reset by the env
+                exhausted_ids = done_ids[~reset_by_env[done_ids]]
+                if len(exhausted_ids) > 0:
+                    env.reset(env_ids=exhausted_ids)
+
+                # refill with the next episodes, idle once the dataset is exhausted
+                num_refill = min(len(done_ids), num_episodes - next_episode)
+                episode_ids[done_ids] = idle_episode
+                episode_ids[done_ids[:num_refill]] = torch.arange(
+                    next_episode, next_episode + num_refill, device=env.device
+                )
+                step_ids[done_ids] = 0
+                next_episode += num_refill
+                num_finished += len(done_ids)
+                start_episodes(done_ids)
+                next_obs = env.observation_manager.compute()
+            obs = next_obs
+
+    elapsed = time.perf_counter() - start_time
+    print(f"Replayed {num_finished}/{num_episodes} episodes, {num_steps} steps in {elapsed:.1f}s.")
+    print(f"Success rate: {success.float().mean().item():.3f}")
+    for name in [names[i] for i in (~success).nonzero().flatten().tolist()][:20]:
+        print(f"  failed: {name}")
+
+    if recorder is not None:
+        # the idle environments replayed no demo
+        recorder.end_episode((episode_ids == idle_episode).nonzero().flatten(), discard=True)
+        recorder.close()
+    env.close()
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
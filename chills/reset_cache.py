@@ -0,0 +1,150 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Per-environment object resets from a precomputed table of initial states.
+
+The Lift task randomizes the object pose on every reset (``reset_object_position``). With ``--fast_reset``
+that event is replaced by :func:`reset_object_from_table`, which draws the new pose of the reset
+environments from a table sampled once per labware, with one gather and one batched pose write. Together
+with the per-environment resets of the terminations (``object_reached_goal``, ``object_dropping``) an
+environment restarts on its own, the others keep their episode. The manual reset (``R``) takes the same path for
+the environments whose object is still down, see :func:`unlifted_env_ids`.
+
+The initial state of an episode (object root state and goal pose) is captured with :func:`capture_episode_state`
+when it starts, stored with the recorded episode, and written back by :func:`restore_episode_state`, so a
+replay starts from the recorded pose instead of a new random one.
+
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --num_envs 16 --multi_labware --fast_reset
+
+"""
+
+import torch
+
+from labware import euler_deg_to_quat_wxyz, labware_pose, labware_pose_table
+
+# position range around the labware pose, same as the reset_object_position event of the Lift task
+DEFAULT_POS_RANGE = ((-0.1, 0.1), (-0.25, 0.25), (0.0, 0.0))
+
+
+def quat_mul_wxyz(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
+    """Hamilton product of ``(..., 4)`` [w,x,y,z] quaternions."""
+    w1, x1, y1, z1 = q1.unbind(-1)
+    w2, x2, y2, z2 = q2.unbind(-1)
+    return torch.stack(
+        (
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        ),
+        dim=-1,
+    )
+
+
+class InitialStateTable:
+    """Randomized initial object poses of every labware, and the labware of every environment.
+
+    The poses are the labware pose (``init_state.pos``/``rot``) with a uniform position offset in ``pos_range``
+    and a uniform world yaw in ``yaw_range_deg``, sampled ``num_states`` times per labware. The environments
+    get their labware round-robin, like :func:`labware.multi_obj_override`.
+
+    Args:
+        labware: Labware override dicts, ``init_state.pos`` and ``init_state.rot`` default to the Lift task pose.
+        num_envs: Number of environments.
+        device: Torch device of the table, the one of the simulation.
+        num_states: Number of sampled states per labware.
+        pos_range: ``(min, max)`` position offset along x, y and z.
+        yaw_range_deg: ``(min, max)`` rotation about the world z axis in degrees.
+        seed: Seed of the table and of the draws.
+    """
+
+    def __init__(
+        self,
+        labware: list[dict],
+        num_envs: int,
+        device: str,
+        num_states: int = 1024,
+        pos_range: tuple[tuple[float, float], ...] = DEFAULT_POS_RANGE,
+        yaw_range_deg: tuple[float, float] = (0.0, 0.0),
+        seed: int = 0,
+    ):
+        self.num_states = num_states
+        self.device = device
+        self._generator = torch.Generator(device=device).manual_seed(seed)
+        self.labware_ids, _, _ = labware_pose_table(labware, num_envs, device)
+
+        num_labware = len(labware)
+        poses = [labware_pose(cfg) for cfg in labware]
+        pos = torch.tensor([pos for pos, _ in poses], dtype=torch.float, device=device)
+        rot = torch.tensor([rot for _, rot in poses], dtype=torch.float, device=device)
+        low, high = torch.tensor(pos_range, dtype=torch.float, device=device).T
+        offsets = low + (high - low) * self._rand((num_labware, num_states, 3))
+        yaw = yaw_range_deg[0] + (yaw_range_deg[1] - yaw_range_deg[0]) * self._rand((num_labware * num_states,))
+        euler = torch.zeros((num_labware * num_states, 3), device=device)
+        euler[:, 2] = yaw
+        yaw_quat = euler_deg_to_quat_wxyz(euler, device=device).view(num_labware, num_states, 4)
+
+        # (num_labware, num_states, 7) positions and [w,x,y,z] rotations in the environment frame
+        rot = quat_mul_wxyz(yaw_quat, rot[:, None].expand_as(yaw_quat))
+        self.states = torch.cat((pos[:, None] + offsets, rot), dim=-1)
+
+    def _rand(self, shape: tuple[int, ...]) -> torch.Tensor:
+        return torch.rand(shape, generator=self._generator, device=self.device)
+
+    def sample(self, env_ids: torch.Tensor) -> torch.Tensor:
+        """Draw an initial ``(len(env_ids), 7)`` pose of the labware of every given environment."""
+        state_ids = torch.randint(self.num_states, (len(env_ids),), generator=self._generator, device=self.device)
+        return self.states[self.labware_ids[env_ids], state_ids]
+
+
+def reset_object_from_table(env, env_ids: torch.Tensor, table: InitialStateTable, asset_name: str = "object"):
+    """Reset event writing the object poses of ``env_ids`` from the table, at rest."""
+    asset = env.scene[asset_name]
+    if env_ids is None:
+        env_ids = torch.arange(env.num_envs, device=env.device)
+    pose = table.sample(env_ids)
+    pose[:, :3] += env.scene.env_origins[env_ids]
+    asset.write_root_pose_to_sim(pose, env_ids=env_ids)
+    asset.write_root_velocity_to_sim(torch.zeros((len(env_ids), 6), device=env.device), env_ids=env_ids)
+
+
+def unlifted_env_ids(env, lift_height: float = 0.04, asset_name: str = "object") -> torch.Tensor:
+    """Environments whose object is less than ``lift_height`` above its default spawn height, e.g. failed grasps."""
+    asset = env.scene[asset_name]
+    height = asset.data.root_pos_w[:, 2] - env.scene.env_origins[:, 2]
+    return (height - asset.data.default_root_state[:, 2] < lift_height).nonzero().flatten()
+
+
+def capture_episode_state(
+    env, env_ids: torch.Tensor, asset_name: str = "object", command_name: str = "object_pose"
+) -> dict[str, torch.Tensor]:
+    """Initial state of the episodes of ``env_ids``, right after their reset.
+
+    Returns:
+        ``object_state``: object root state ``(len(env_ids), 13)`` with the position in the environment frame,
+        ``goal_pose``: goal pose command ``(len(env_ids), 7)`` in the robot base frame.
+    """
+    object_state = env.scene[asset_name].data.root_state_w[env_ids].clone()
+    object_state[:, :3] -= env.scene.env_origins[env_ids]
+    goal_pose = env.command_manager.get_command(command_name)[env_ids].clone()
+    return {"object_state": object_state, "goal_pose": goal_pose}
+
+
+def restore_episode_state(
+    env,
+    env_ids: torch.Tensor,
+    state: dict[str, torch.Tensor],
+    asset_name: str = "object",
+    command_name: str = "object_pose",
+):
+    """Write a state of :func:`capture_episode_state` back into the freshly reset environments ``env_ids``."""
+    object_state = state["object_state"].clone()
+    object_state[:, :3] += env.scene.env_origins[env_ids]
+    asset = env.scene[asset_name]
+    asset.write_root_pose_to_sim(object_state[:, :7], env_ids=env_ids)
+    asset.write_root_velocity_to_sim(object_state[:, 7:], env_ids=env_ids)
+    # the goal is resampled on reset, the success term compares against this command
+    env.command_manager.get_term(command_name).pose_command_b[env_ids] = state["goal_pose"]
@@ -0,0 +1,199 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Scripted teleop device generating approach-grasp-lift demonstrations without an operator.
+
+Every environment runs its own copy of the script (approach above the labware, descend, close the
+gripper, lift, hold), all of them batched in tensors, so each ``advance()`` returns a ``(num_envs, 6)``
+delta pose and a ``(num_envs,)`` gripper mask, which ``ActionBuffer`` assembles as usual.
+
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --teleop_device scripted --num_envs 64 --multi_labware --output demos.hdf5 --headless
+
+"""
+
+from collections.abc import Callable
+
+import torch
+
+# phases of the script
+APPROACH, DESCEND, GRASP, LIFT, HOLD = range(5)
+PHASE_NAMES = ("approach", "descend", "grasp", "lift", "hold")
+
+
+def quat_apply_wxyz(quat: torch.Tensor, vec: torch.Tensor) -> torch.Tensor:
+    """Rotate the ``(N, 3)`` vectors by the ``(N, 4)`` [w,x,y,z] quaternions."""
+    xyz = quat[:, 1:]
+    t = 2.0 * torch.linalg.cross(xyz, vec, dim=-1)
+    return vec + quat[:, :1] * t + torch.linalg.cross(xyz, t, dim=-1)
+
+
+class ScriptedTeleop:
+    """Batched approach-grasp-lift script with the interface of ``Se3Keyboard``.
+
+    The grasp point of every environment is its labware position, plus ``grasp_offset`` given in the labware
+    frame and rotated by the labware rotation. The delta pose is a clipped proportional step towards the target
+    of the current phase, expressed in the robot base frame like the IK-Rel actions.
+
+    The end-effector and object positions come from ``ee_pos_fn`` and ``object_pos_fn`` when given (closed
+    loop, e.g. read from the scene). Without ``ee_pos_fn`` the end-effector is dead reckoned from ``home_pos``
+    and the sent deltas, without ``object_pos_fn`` the grasp point is the nominal labware pose.
+
+    Args:
+        num_envs: Number of environments.
+        device: Torch device of the commands.
+        labware_pos: Labware position of every environment ``(num_envs, 3)`` in the environment frame.
+        labware_rot: Labware [w,x,y,z] rotation of every environment ``(num_envs, 4)``.
+        ee_pos_fn: Returns the ``(num_envs, 3)`` end-effector positions in the environment frame.
+        object_pos_fn: Returns the ``(num_envs, 3)`` object positions in the environment frame.
+        grasp_offset: Grasp point in the labware frame, relative to its origin, ``(3,)`` or per environment
+            ``(num_envs, 3)``.
+        approach_height: Height above the grasp point the gripper approaches first.
+        lift_height: Height the labware is lifted by.
+        gain: Proportional gain from the position error to the delta pose.
+        max_delta: Clip of every delta pose component, the keyboard step at sensitivity 2 is 0.1.
+        action_scale: Scale of the IK-Rel actions, used to dead reckon the end-effector.
+        tolerance: Distance to the target that ends the approach, descend and lift phases.
+        grasp_steps: Steps the gripper gets to close.
+        hold_steps: Steps the labware is held up before the script is finished.
+        max_phase_steps: Steps after which a phase moves on even if the target was not reached.
+        home_pos: End-effector start position for dead reckoning.
+        noise_std: Standard deviation of the noise added to the delta poses, for more diverse demos.
+        seed: Seed of the noise.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        device: str,
+        labware_pos: torch.Tensor,
+        labware_rot: torch.Tensor,
+        ee_pos_fn: Callable[[], torch.Tensor] | None = None,
+        object_pos_fn: Callable[[], torch.Tensor] | None = None,
+        grasp_offset: tuple[float, float, float] | torch.Tensor = (0.0, 0.0, 0.0),
+        approach_height: float = 0.1,
+        lift_height: float = 0.2,
+        gain: float = 4.0,
+        max_delta: float = 0.1,
+        action_scale: float = 0.5,
+        tolerance: float = 0.01,
+        grasp_steps: int = 20,
+        hold_steps: int = 30,
+        max_phase_steps: int = 300,
+        home_pos: tuple[float, float, float] = (0.4, 0.0, 0.4),
+        noise_std: float = 0.0,
+        seed: int = 0,
+    ):
+        self.num_envs = num_envs
+        self.device = device
+        self.ee_pos_fn = ee_pos_fn
+        self.object_pos_fn = object_pos_fn
+        self.gain = gain
+        self.max_delta = max_delta
+        self.action_scale = action_scale
+        self.tolerance = tolerance
+        self.grasp_steps = grasp_steps
+        self.hold_steps = hold_steps
+        self.max_phase_steps = max_phase_steps
+        self.lift_height = lift_height
+        self.noise_std = noise_std
+
+        labware_pos = torch.as_tensor(labware_pos, dtype=torch.float, device=device).expand(num_envs, 3)
+        labware_rot = torch.as_tensor(labware_rot, dtype=torch.float, device=device).expand(num_envs, 4)
+        offset = torch.as_tensor(grasp_offset, dtype=torch.float, device=device).expand(num_envs, 3)
+        self._grasp_offset = quat_apply_wxyz(labware_rot, offset)
+        self._nominal_grasp_pos = labware_pos + self._grasp_offset
+        self._grasp_pos = self._nominal_grasp_pos.clone()
+        self._home_pos = torch.tensor(home_pos, dtype=torch.float, device=device)
+        self._ee_pos = self._home_pos.repeat(num_envs, 1)
+
+        # target height above the grasp point and gripper state (closed) of every phase
+        self._phase_height = torch.tensor(
+            [approach_height, 0.0, 0.0, lift_height, lift_height], dtype=torch.float, device=device
+        )
+        self._phase_closed = torch.tensor([False, False, True, True, True], device=device)
+        # phases left on reaching the target, the others on their step count
+        self._phase_reach = torch.tensor([True, True, False, True, False], device=device)
+        self._phase_steps = torch.tensor(
+            [max_phase_steps, max_phase_steps, grasp_steps, max_phase_steps, hold_steps], device=device
+        )
+
+        self.phase = torch.zeros(num_envs, dtype=torch.long, device=device)
+        self._phase_timer = torch.zeros(num_envs, dtype=torch.long, device=device)
+        self._finished = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        self._needs_grasp_pos = torch.ones(num_envs, dtype=torch.bool, device=device)
+        self._delta_pose = torch.zeros((num_envs, 6), dtype=torch.float, device=device)
+        self._generator = torch.Generator(device=device).manual_seed(seed)
+        self._callbacks = {}
+
+    def __str__(self) -> str:
+        msg = f"Scripted teleop device: {self.__class__.__name__}\n"
+        msg += f"\tEnvironments: {self.num_envs}\n"
+        msg += f"\tPhases: {' -> '.join(PHASE_NAMES)}\n"
+        msg += f"\tClosed loop: {self.ee_pos_fn is not None}"
+        return msg
+
+    @property
+    def finished(self) -> torch.Tensor:
+        """Mask of the environments that completed the script."""
+        return self._finished
+
+    def add_callback(self, key: str, func):
+        # no keys to press, kept for the interface of the other devices
+        self._callbacks[key] = func
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Restart the script of the given environments (all by default)."""
+        env_ids = slice(None) if env_ids is None else env_ids
+        self.phase[env_ids] = APPROACH
+        self._phase_timer[env_ids] = 0
+        self._finished[env_ids] = False
+        self._needs_grasp_pos[env_ids] = True
+        self._ee_pos[env_ids] = self._home_pos
+
+    def advance(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Delta pose ``(num_envs, 6)`` and gripper mask ``(num_envs,)`` of the next step."""
+        # the reset events move the object, take the grasp point from its actual pose once per episode
+        if self._needs_grasp_pos.any():
+            ids = self._needs_grasp_pos.nonzero().flatten()
+            if self.object_pos_fn is not None:
+                self._grasp_pos[ids] = self.object_pos_fn()[ids] + self._grasp_offset[ids]
+            else:
+                self._grasp_pos[ids] = self._nominal_grasp_pos[ids]
+            self._needs_grasp_pos[ids] = False
+
+        ee_pos = self.ee_pos_fn() if self.ee_pos_fn is not None else self._ee_pos
+        target = self._grasp_pos.clone()
+        target[:, 2] += self._phase_height[self.phase]
+        error = target - ee_pos
+
+        # next phase once the target is reached or the phase ran out of steps
+        self._phase_timer += 1
+        reached = self._phase_reach[self.phase] & (torch.linalg.norm(error, dim=-1) < self.tolerance)
+        timed_out = self._phase_timer >= self._phase_steps[self.phase]
+        advance = (reached | timed_out) & ~self._finished
+        self._finished |= advance & (self.phase == HOLD)
+        self.phase += (advance & (self.phase < HOLD)).long()
+        self._phase_timer[advance] = 0
+
+        # proportional step, the orientation is kept
+        self._delta_pose[:, :3] = torch.clamp(self.gain * error, -self.max_delta, self.max_delta)
+        if self.noise_std > 0.0:
+            noise = torch.randn((self.num_envs, 3), generator=self._generator, device=self.device)
+            self._delta_pose[:, :3] += self.noise_std * noise
+        self._delta_pose[self._finished, :3] = 0.0
+        if self.ee_pos_fn is None:
+            self._ee_pos += self.action_scale * self._delta_pose[:, :3]
+        return self._delta_pose, self._phase_closed[self.phase]
+
+    def succeeded(self, env_ids: torch.Tensor) -> torch.Tensor:
+        """Whether the labware of the environments is lifted by at least half the lift height.
+
+        Needs ``object_pos_fn``, without it the finished environments count as successful.
+        """
+        if self.object_pos_fn is None:
+            return self._finished[env_ids].clone()
+        height = self.object_pos_fn()[env_ids, 2] - (self._grasp_pos[env_ids, 2] - self._grasp_offset[env_ids, 2])
+        return height > 0.5 * self.lift_height
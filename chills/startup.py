@@ -0,0 +1,180 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Startup instrumentation and the lightweight commands of ``object_override.py``.
+
+The commands (list the labware, validate the overrides, dry-run the configuration) only need the labware
+registry, they run before the app is launched and without importing torch or Isaac Lab.
+
+python .\\object_override.py --list_labware
+python .\\object_override.py --validate
+python .\\object_override.py --dry_run --labware beaker --num_envs 64
+python .\\object_override.py --startup_times startup.json
+
+"""
+
+import copy
+import json
+import math
+import os
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from labware import Labwear, OverridePlan
+
+# the fields of the object config (``RigidObjectCfg`` spawned from a ``UsdFileCfg``) the labware may override,
+# with their defaults, so that the overrides are compiled and applied without importing Isaac Lab
+LABWARE_TEMPLATE = SimpleNamespace(
+    spawn=SimpleNamespace(
+        usd_path=None,
+        scale=None,
+        rigid_props=None,
+        mass_props=None,
+        collision_props=None,
+        activate_contact_sensors=False,
+        semantic_tags=None,
+        visible=True,
+    ),
+    init_state=SimpleNamespace(
+        pos=(0.0, 0.0, 0.0), rot=(1.0, 0.0, 0.0, 0.0), lin_vel=(0.0, 0.0, 0.0), ang_vel=(0.0, 0.0, 0.0)
+    ),
+)
+
+
+class StartupTimer:
+    """Wall time of the named startup stages (imports, app launch, environment creation, ...)."""
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.stages: list[tuple[str, float]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start))
+
+    def report(self, path: str | None = None):
+        """Print the stage times, and write them as JSON to ``path`` if given (``"-"`` only prints)."""
+        total = time.perf_counter() - self.start_time
+        print("-" * 80)
+        print(f"{'startup stage':<40} {'time [s]':>10}")
+        for name, duration in self.stages:
+            print(f"{name:<40} {duration:>10.3f}")
+        print(f"{'total':<40} {total:>10.3f}")
+        print("-" * 80)
+        if path and path != "-":
+            with open(path, "w") as f:
+                json.dump({"stages": dict(self.stages), "total": total}, f, indent=2)
+
+
+def _is_vector(value, size: int) -> bool:
+    return isinstance(value, (list, tuple)) and len(value) == size
+
+
+def validate_labware(overrides: dict) -> list[str]:
+    """Problems of a labware override dict, empty when it is valid.
+
+    The overrides are compiled into an :class:`OverridePlan` and applied to a copy of :data:`LABWARE_TEMPLATE`,
+    the values are checked on the resulting config.
+    """
+    try:
+        cfg = OverridePlan.compile(LABWARE_TEMPLATE, overrides).apply(copy.deepcopy(LABWARE_TEMPLATE))
+    except ValueError as e:
+        return [str(e)]
+
+    errors = []
+    if cfg.spawn.usd_path is None:
+        errors.append("missing 'spawn.usd_path'")
+    elif not os.path.exists(cfg.spawn.usd_path):
+        errors.append(f"USD file not found: {cfg.spawn.usd_path}")
+    if cfg.spawn.scale is not None and (not _is_vector(cfg.spawn.scale, 3) or min(cfg.spawn.scale) <= 0):
+        errors.append(f"'spawn.scale' must be 3 positive values, got {cfg.spawn.scale}")
+    for name in ("pos", "lin_vel", "ang_vel"):
+        if not _is_vector(getattr(cfg.init_state, name), 3):
+            errors.append(f"'init_state.{name}' must have 3 values, got {getattr(cfg.init_state, name)}")
+    rot = cfg.init_state.rot
+    if not _is_vector(rot, 4) or not math.isclose(math.sqrt(sum(v * v for v in rot)), 1.0, rel_tol=1e-3):
+        errors.append(f"'init_state.rot' must be a unit [w,x,y,z] quaternion, got {rot}")
+    return errors
+
+
+def _selected_labware(args_cli) -> list[str]:
+    if args_cli.multi_labware is not None:
+        return args_cli.multi_labware or list(Labwear)
+    if args_cli.labware.lower() == "none":
+        return []
+    return [args_cli.labware]
+
+
+def is_converted(name: str) -> bool:
+    """Whether the USD of the labware exists."""
+    return os.path.exists(Labwear[name].get("spawn.usd_path", ""))
+
+
+def resolve_labware(args_cli) -> list[str]:
+    """Names of the labware to spawn, checked before the app is launched.
+
+    A bare ``--multi_labware`` takes all converted labware, named labware must exist and be converted.
+    Empty for the task's object (``--labware none``).
+
+    Raises:
+        ValueError: If a name is unknown or not converted, or ``--multi_labware`` leaves no labware to spawn.
+    """
+    names = _selected_labware(args_cli)
+    unknown = [name for name in names if name not in Labwear]
+    if unknown:
+        raise ValueError(f"Unknown labware {unknown}, available: {list(Labwear)}")
+    if args_cli.multi_labware == []:
+        names = [name for name in names if is_converted(name)]
+    else:
+        missing = [name for name in names if not is_converted(name)]
+        if missing:
+            raise ValueError(f"Labware {missing} has no USD, convert it with assets/convert_mesh.py first.")
+    if args_cli.multi_labware is not None and not names:
+        raise ValueError(f"--multi_labware has no converted labware to spawn in '{Labwear.root}'.")
+    return names
+
+
+def run_light_command(args_cli) -> int:
+    """Run the requested lightweight command, returns the exit code."""
+    if args_cli.list_labware:
+        for name in Labwear:
+            print(name)
+        return 0
+
+    names = list(Labwear) if args_cli.validate else _selected_labware(args_cli)
+    num_errors = 0
+    valid_names = []
+    for name in names:
+        try:
+            errors = validate_labware(Labwear[name])
+        except (KeyError, OSError) as e:
+            errors = [str(e)]
+        num_errors += len(errors)
+        print(f"{name}: {'ok' if not errors else 'invalid'}")
+        for error in errors:
+            print(f"  - {error}")
+        if not errors and Labwear.grasp_offset(name) is None:
+            print("  note: no 'grasp_offset' in labware.yaml, the scripted device grasps the origin")
+        if not errors:
+            valid_names.append(name)
+
+    if args_cli.dry_run:
+        print("-" * 80)
+        print(f"task:           {args_cli.task}")
+        print(f"num_envs:       {args_cli.num_envs}")
+        print(f"teleop_device:  {args_cli.teleop_device} (sensitivity {args_cli.sensitivity})")
+        print(f"output:         {args_cli.output}")
+        print(f"labware:        {'round-robin ' if args_cli.multi_labware is not None else ''}{names or 'task default'}")
+        # the invalid labware is reported above
+        for name in valid_names:
+            for key, value in Labwear[name].items():
+                print(f"  {name}.{key} = {value}")
+    return 1 if num_errors else 0
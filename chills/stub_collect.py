@@ -0,0 +1,104 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+CPU collection worker with the command line of ``object_override.py``, against the stub environment.
+
+Runs the scripted device, action assembly and recording of a farm worker without Isaac Sim, so
+``collect_farm.py --stub`` exercises the whole farm (sharding, progress, restarts, index) on any machine.
+``--crash_prob`` makes the worker exit with an error at random steps to test the restarts.
+
+python .\\stub_collect.py --num_envs 16 --multi_labware --output stub.hdf5 --max_episodes 100
+
+"""
+
+import argparse
+import os
+import random
+import sys
+
+import torch
+
+from actions import ActionBuffer
+from collect_farm import ProgressWriter
+from labware import Labwear, labware_pose_table
+from recorder import EpisodeRecorder, observation_layout
+from scripted_teleop import ScriptedTeleop
+from stub_env import StubEnv
+
+parser = argparse.ArgumentParser(description="Scripted data collection against the CPU stub environment.")
+parser.add_argument("--num_envs", type=int, default=16, help="Number of environments to simulate.")
+parser.add_argument("--multi_labware", type=str, nargs="*", default=None, help="Labware of the environments.")
+parser.add_argument("--output", type=str, default=None, help="Record the episodes to this HDF5 file.")
+parser.add_argument("--seed", type=int, default=0, help="Seed of the environment and the scripted device.")
+parser.add_argument("--max_episodes", type=int, default=100, help="Stop after this many finished episodes.")
+parser.add_argument("--progress", type=str, default=None, help="Periodically write the progress to this JSON file.")
+parser.add_argument("--device", type=str, default="cpu", help="Torch device of the stub environment.")
+parser.add_argument(
+    "--termination_prob", type=float, default=0.0, help="Per step termination probability of the stub environment."
+)
+parser.add_argument("--crash_prob", type=float, default=0.0, help="Per step probability of exiting with an error.")
+
+
+def main():
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    names = args.multi_labware or list(Labwear)
+    labware = [Labwear[name] for name in names]
+    env = StubEnv(args.num_envs, args.device, termination_prob=args.termination_prob, seed=args.seed)
+    labware_ids, labware_pos, labware_rot = labware_pose_table(labware, env.num_envs, env.device)
+    teleop_interface = ScriptedTeleop(env.num_envs, env.device, labware_pos, labware_rot, seed=args.seed)
+    action_buffer = ActionBuffer(env.num_envs, env.device)
+    recorder = None
+    if args.output is not None:
+        recorder = EpisodeRecorder(
+            args.output,
+            env.num_envs,
+            env_name="stub",
+            labware=[names[i] for i in labware_ids.tolist()],
+            obs_layout=observation_layout(env),
+        )
+    progress = ProgressWriter(args.progress)
+
+    obs, _ = env.reset()
+    teleop_interface.reset()
+    with torch.inference_mode():
+        while progress.episodes < args.max_episodes:
+            if rng.random() < args.crash_prob:
+                # no cleanup, like a simulator crash
+                print("stub_collect: simulated crash", flush=True)
+                os._exit(1)
+
+            actions = action_buffer(teleop_interface.advance())
+            next_obs, rewards, terminated, truncated, _ = env.step(actions)
+            dones = terminated | truncated
+            if recorder is not None:
+                recorder.add_step(obs, actions, rewards)
+                if dones.any():
+                    recorder.end_episode(dones.nonzero().flatten(), success=terminated[dones])
+            obs = next_obs
+            progress.update(int(dones.sum()), int(terminated.sum()), env.num_envs)
+
+            if dones.any():
+                teleop_interface.reset(dones.nonzero().flatten())
+            finished_ids = teleop_interface.finished.nonzero().flatten()
+            if len(finished_ids) > 0:
+                success = teleop_interface.succeeded(finished_ids)
+                if recorder is not None:
+                    recorder.end_episode(finished_ids, success=success)
+                obs, _ = env.reset(env_ids=finished_ids)
+                teleop_interface.reset(finished_ids)
+                progress.update(len(finished_ids), int(success.sum()))
+
+    if recorder is not None:
+        recorder.end_episode(discard=True)
+        recorder.close()
+    progress.update(force=True)
+    env.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+CPU stand-ins for the Lift environment and the teleop devices, without Isaac Sim.
+
+They follow the interfaces the Chills loops use, so the host side (action assembly, recording, ...)
+can be benchmarked and exercised on a plain CPU box.
+"""
+
+import numpy as np
+import torch
+
+# terms and sizes of the Lift ``policy`` observations, concatenated in this order
+LIFT_POLICY_TERMS = (
+    ("joint_pos", 9),
+    ("joint_vel", 9),
+    ("object_position", 3),
+    ("target_object_position", 7),
+    ("actions", 7),
+)
+
+
+class StubEnv:
+    """Minimal stand-in of the unwrapped ``ManagerBasedRLEnv`` of the Lift task.
+
+    Observations have the layout of the Lift ``policy`` group (35 values). Every step, each environment
+    terminates with probability ``termination_prob`` and is auto-reset, like the ``object_reached_goal`` term.
+
+    Args:
+        num_envs: Number of parallel environments.
+        device: Torch device of the tensors.
+        action_dim: Size of the actions, 7 for the IK-Rel Lift task.
+        obs_dim: Size of the ``policy`` observations.
+        termination_prob: Per step and environment termination probability.
+        seed: Seed of the terminations and observations.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        device: str = "cpu",
+        action_dim: int = 7,
+        obs_dim: int = 35,
+        termination_prob: float = 0.0,
+        seed: int = 0,
+    ):
+        self.num_envs = num_envs
+        self.device = device
+        self.action_dim = action_dim
+        self.termination_prob = termination_prob
+        self.sim = _StubSim()
+        self.observation_manager = _StubObservationManager(obs_dim, action_dim)
+        self.common_step_counter = 0
+        self.episode_length_buf = torch.zeros(num_envs, dtype=torch.long, device=device)
+
+        self._generator = torch.Generator(device=device).manual_seed(seed)
+        self._obs = torch.zeros((num_envs, obs_dim), device=device)
+        self._rewards = torch.zeros(num_envs, device=device)
+        self._terminated = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        self._truncated = torch.zeros(num_envs, dtype=torch.bool, device=device)
+
+    def reset(self, seed: int | None = None, env_ids: torch.Tensor | None = None, options=None):
+        env_ids = slice(None) if env_ids is None else env_ids
+        self._obs[env_ids] = 0.0
+        self.episode_length_buf[env_ids] = 0
+        return {"policy": self._obs.clone()}, {}
+
+    def step(self, actions: torch.Tensor):
+        if actions.shape != (self.num_envs, self.action_dim):
+            raise ValueError(
+                f"Expected actions of shape {(self.num_envs, self.action_dim)}, got {tuple(actions.shape)}."
+            )
+        self.common_step_counter += 1
+        self.episode_length_buf += 1
+        # last action term and noisy state
+        self._obs[:, : -self.action_dim].normal_(generator=self._generator)
+        self._obs[:, -self.action_dim :] = actions
+        self._rewards.copy_(actions[:, 2])
+        if self.termination_prob > 0.0:
+            self._terminated = torch.rand(self.num_envs, generator=self._generator, device=self.device)
+            self._terminated = self._terminated < self.termination_prob
+            if self._terminated.any():
+                self.reset(env_ids=self._terminated.nonzero().flatten())
+        obs = {"policy": self._obs.clone()}
+        return obs, self._rewards.clone(), self._terminated.clone(), self._truncated.clone(), {}
+
+    def close(self):
+        pass
+
+
+class _StubSim:
+    def render(self):
+        pass
+
+
+class _StubObservationManager:
+    """Term layout of the ``policy`` group, the Lift terms for the default sizes."""
+
+    def __init__(self, obs_dim: int, action_dim: int):
+        terms = LIFT_POLICY_TERMS
+        if (obs_dim, action_dim) != (sum(size for _, size in terms), terms[-1][1]):
+            terms = (("state", obs_dim - action_dim), ("actions", action_dim))
+        self.active_terms = {"policy": [term for term, _ in terms]}
+        self.group_obs_term_dim = {"policy": [(size,) for _, size in terms]}
+
+
+class StubTeleop:
+    """Teleop device replaying a smooth scripted motion, same interface as ``Se3Keyboard``.
+
+    ``advance()`` returns ``(delta_pose, gripper_command)`` with a ``(6,)`` float array, the gripper closes
+    every other ``gripper_period`` steps.
+    """
+
+    def __init__(self, pos_sensitivity: float = 0.1, rot_sensitivity: float = 0.1, gripper_period: int = 100):
+        self.pos_sensitivity = pos_sensitivity
+        self.rot_sensitivity = rot_sensitivity
+        self.gripper_period = gripper_period
+        self._callbacks = {}
+        self._step = 0
+        self._delta_pose = np.zeros(6)
+
+    def __str__(self) -> str:
+        return f"Scripted stub teleop device: {self.__class__.__name__}"
+
+    def reset(self):
+        self._step = 0
+
+    def add_callback(self, key: str, func):
+        self._callbacks[key] = func
+
+    def advance(self) -> tuple[np.ndarray, bool]:
+        phase = 2.0 * np.pi * self._step / self.gripper_period
+        self._delta_pose[:3] = self.pos_sensitivity * np.array([np.cos(phase), np.sin(phase), np.sin(0.5 * phase)])
+        self._delta_pose[3:] = self.rot_sensitivity * np.array([0.0, 0.0, np.sin(phase)])
+        gripper_command = (self._step // self.gripper_period) % 2 == 1
+        self._step += 1
+        return self._delta_pose.copy(), gripper_command
@@ -0,0 +1,155 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Teleop device read on its own thread, decoupled from the simulation loop.
+
+The worker thread polls ``advance()`` of the wrapped device at the device rate, filters the delta pose
+(dead zone, exponential smoothing) and publishes the latest sample into a single slot. The sim loop reads
+the slot without waiting, so a slow device read no longer delays ``env.step`` and a slow step no longer
+holds back the device. The slot is one tuple replaced by a single reference assignment, which is atomic
+under the GIL, so neither side takes a lock.
+
+python .\\object_override.py --task Isaac-Lift-Cube-Franka-IK-Rel-v0 --async_input --input_rate 200 --dead_zone 0.01
+
+"""
+
+import threading
+import time
+
+import numpy as np
+
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+class AsyncTeleop:
+    """Wraps a teleop device (``Se3Keyboard``, ``Se3SpaceMouse``, ...) and reads it on a background thread.
+
+    It has the interface of the wrapped device: ``advance()`` returns the latest ``(delta_pose, gripper_command)``
+    and ``add_callback``/``reset`` are forwarded. The age of the sample returned by every ``advance()`` call,
+    from the device read to its use for an action, is kept in a ring buffer (see :meth:`latency_stats`).
+
+    Only for the single-command devices, the batched ``ScriptedTeleop`` and ``PolicyTeleop`` return per-environment
+    tensors computed from the current observations and are stepped on the sim loop.
+
+    Args:
+        device: Teleop device with ``advance()``, ``reset()`` and ``add_callback()``.
+        rate_hz: Rate the device is polled at.
+        smoothing: Exponential smoothing factor of the delta pose in ``[0, 1)``, 0 disables it.
+        dead_zone: Delta pose components with a smaller magnitude are set to zero.
+        latency_window: Number of latency samples kept.
+    """
+
+    def __init__(
+        self,
+        device,
+        rate_hz: float = 200.0,
+        smoothing: float = 0.0,
+        dead_zone: float = 0.0,
+        latency_window: int = 4096,
+    ):
+        if rate_hz <= 0.0:
+            raise ValueError(f"The input rate must be positive, got {rate_hz}.")
+        if not 0.0 <= smoothing < 1.0:
+            raise ValueError(f"The smoothing factor must be in [0, 1), got {smoothing}.")
+        self.device = device
+        self.period = 1.0 / rate_hz
+        self.smoothing = smoothing
+        self.dead_zone = dead_zone
+
+        # latest sample (delta_pose, gripper_command, read time, sequence number), replaced as a whole
+        self._slot = (np.zeros(6), False, time.perf_counter(), 0)
+        self._filtered = None
+        self._reset_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._error = None
+
+        self._latency = np.zeros(latency_window)
+        self._num_latency = 0
+        self.num_reads = 0
+        self.num_stale = 0
+        self._last_seq = 0
+
+        self._thread = threading.Thread(target=self._run, name="teleop-input", daemon=True)
+        self._thread.start()
+
+    def __str__(self) -> str:
+        return f"{self.device}\n\tRead asynchronously at {1.0 / self.period:.0f} Hz by {self.__class__.__name__}"
+
+    """
+    Sim side.
+    """
+
+    def advance(self) -> tuple[np.ndarray, bool]:
+        """Latest filtered ``(delta_pose, gripper_command)``, never blocks on the device."""
+        if self._error is not None:
+            raise RuntimeError("The teleop input thread failed.") from self._error
+        delta_pose, gripper_command, read_time, seq = self._slot
+        self._latency[self._num_latency % len(self._latency)] = time.perf_counter() - read_time
+        self._num_latency += 1
+        # the same sample used for consecutive actions, the sim loop outruns the device
+        if seq == self._last_seq:
+            self.num_stale += 1
+        self._last_seq = seq
+        return delta_pose, gripper_command
+
+    def add_callback(self, key: str, func):
+        self.device.add_callback(key, func)
+
+    def reset(self):
+        """Reset the device and the filter, done by the input thread before its next read."""
+        self._reset_event.set()
+
+    def close(self):
+        self._stop_event.set()
+        self._thread.join()
+
+    def latency_stats(self) -> dict[str, float]:
+        """Percentiles of the input-to-action latency in milliseconds, and the share of stale samples."""
+        samples = self._latency[: min(self._num_latency, len(self._latency))]
+        if len(samples) == 0:
+            return {}
+        percentiles = np.percentile(samples * 1e3, LATENCY_PERCENTILES)
+        stats = {f"p{p}_ms": float(value) for p, value in zip(LATENCY_PERCENTILES, percentiles)}
+        stats["stale"] = self.num_stale / self._num_latency
+        return stats
+
+    """
+    Input thread.
+    """
+
+    def _run(self):
+        next_time = time.perf_counter()
+        try:
+            while not self._stop_event.is_set():
+                if self._reset_event.is_set():
+                    self._reset_event.clear()
+                    self.device.reset()
+                    self._filtered = None
+                delta_pose, gripper_command = self.device.advance()
+                read_time = time.perf_counter()
+                delta_pose = self._filter(np.asarray(delta_pose, dtype=float))
+                self.num_reads += 1
+                self._slot = (delta_pose, gripper_command, read_time, self.num_reads)
+
+                next_time += self.period
+                sleep_time = next_time - time.perf_counter()
+                if sleep_time > 0.0:
+                    time.sleep(sleep_time)
+                else:
+                    # the device is slower than the rate, do not try to catch up
+                    next_time = time.perf_counter()
+        except Exception as e:
+            self._error = e
+
+    def _filter(self, delta_pose: np.ndarray) -> np.ndarray:
+        if self.dead_zone > 0.0:
+            delta_pose = np.where(np.abs(delta_pose) < self.dead_zone, 0.0, delta_pose)
+        if self.smoothing > 0.0:
+            if self._filtered is not None:
+                delta_pose = self.smoothing * self._filtered + (1.0 - self.smoothing) * delta_pose
+            self._filtered = delta_pose
+        # a new array every read, the published one is never written again
+        return delta_pose.copy()
@@ -0,0 +1,12 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import sys
+
+# the Chills modules import their siblings, as when run from the chills (or chills/assets) directory
+CHILLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(CHILLS_DIR, "assets"))
+sys.path.insert(0, CHILLS_DIR)
@@ -0,0 +1,66 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the collection farm with the CPU stub workers, one of them killed mid-run."""
+
+import argparse
+import os
+import time
+
+import h5py
+
+from collect_farm import INDEX_FILE, Worker, read_progress, split_labware, write_index
+from labware import Labwear
+
+# the progress is written once a second, the victim has too many episodes to finish before the kill
+EPISODES = [40, 160]
+
+
+def _finished_demos(path: str) -> list[str]:
+    with h5py.File(path, "r") as f:
+        return [name for name, demo in f["data"].items() if "success" in demo.attrs]
+
+
+def _wait(condition, timeout: float = 120.0):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline, "the farm workers did not finish in time"
+        time.sleep(0.05)
+
+
+def test_killed_worker_shards_are_indexed_once(tmp_path):
+    args = argparse.Namespace(output_dir=str(tmp_path), num_envs=4, stub=True, max_restarts=3, worker_args=[])
+    subsets = split_labware(list(Labwear), 2)
+    workers = [Worker(k, subsets[k], EPISODES[k], 1000 * k, args) for k in range(2)]
+    for worker in workers:
+        worker.launch()
+
+    # kill worker 1 once it recorded some episodes, it restarts for the remaining ones into a new shard
+    victim = workers[1]
+    _wait(lambda: read_progress(victim.progress_path).get("episodes", 0) > 0 or victim.process.poll() is not None)
+    victim.process.kill()
+    _wait(lambda: not any([worker.poll() for worker in workers]))
+
+    index = write_index(str(tmp_path), workers)
+
+    assert [shard["attempt"] for shard in victim.shards] == [0, 1]
+    assert victim.shards[0]["returncode"] != 0
+    assert not any(worker.failed for worker in workers)
+
+    # every shard on disk is listed exactly once, readable or skipped
+    listed = [shard["path"] for shard in index["shards"]] + index["skipped"]
+    on_disk = sorted(name for name in os.listdir(tmp_path) if name.endswith(".hdf5"))
+    assert sorted(listed) == on_disk
+    assert len(set(listed)) == len(listed)
+    assert os.path.isfile(tmp_path / INDEX_FILE)
+
+    # every finished episode of a shard is counted once, the restarts do not repeat seeds
+    for shard in index["shards"]:
+        demos = _finished_demos(os.path.join(tmp_path, shard["path"]))
+        assert shard["num_demos"] == shard["episodes"] == len(demos) == len(set(demos))
+    assert index["num_demos"] == sum(shard["num_demos"] for shard in index["shards"])
+    assert index["num_demos"] >= sum(EPISODES)
+    assert sum(shard.get("num_demos", 0) for shard in index["shards"] if shard["worker"] == 1) >= victim.episodes
+    assert len({shard["seed"] for shard in victim.shards}) == len(victim.shards)
@@ -0,0 +1,93 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Round trip of recordings through the compaction: idle frames, empty episodes and the error bound."""
+
+import h5py
+import numpy as np
+import pytest
+
+from compaction import RUN_LENGTHS, compact_file, demo_keys, error_bound, expand_file, max_error, read_key
+
+STEP = 1e-4
+
+
+def _idle_episode(rng: np.random.Generator, num_runs: int) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Streams of ``num_runs`` distinct frames, each repeated a random number of times."""
+    run_lengths = rng.integers(1, 20, size=num_runs)
+    frames = {
+        "actions": rng.uniform(-1.0, 1.0, size=(num_runs, 7)).astype(np.float32),
+        "rewards": rng.uniform(0.0, 1.0, size=num_runs).astype(np.float32),
+        # large values, where the float32 rounding adds to the quantization error
+        "obs/policy/object_position": rng.uniform(-100.0, 100.0, size=(num_runs, 3)).astype(np.float32),
+        "obs/policy/phase": rng.integers(0, 5, size=(num_runs, 1)).astype(np.int64),
+    }
+    # consecutive runs differ by more than the quantization step
+    frames["actions"][:, 0] = np.arange(num_runs) * 0.01
+    return {key: np.repeat(values, run_lengths, axis=0) for key, values in frames.items()}, run_lengths
+
+
+def _write_recording(path: str, episodes: list[dict[str, np.ndarray]]):
+    with h5py.File(path, "w") as f:
+        data = f.create_group("data")
+        data.attrs["env_name"] = "test"
+        for k, streams in enumerate(episodes):
+            demo = data.create_group(f"demo_{k}")
+            demo.attrs["num_samples"] = len(streams["actions"])
+            demo.attrs["success"] = True
+            for key, values in streams.items():
+                demo.create_dataset(key, data=values)
+
+
+@pytest.fixture
+def recording(tmp_path):
+    rng = np.random.default_rng(0)
+    idle, run_lengths = _idle_episode(rng, 50)
+    empty = {key: values[:0] for key, values in idle.items()}
+    single, _ = _idle_episode(rng, 1)
+    path = str(tmp_path / "demos.hdf5")
+    _write_recording(path, [idle, empty, single])
+    return path, [idle, empty, single], run_lengths
+
+
+def test_round_trip(recording, tmp_path):
+    path, episodes, run_lengths = recording
+    compacted = str(tmp_path / "compact.hdf5")
+    compact_file(path, compacted, STEP, raw_keys=("rewards",))
+
+    with h5py.File(compacted, "r") as f:
+        for k, streams in enumerate(episodes):
+            demo = f["data"][f"demo_{k}"]
+            assert demo.attrs["compacted"]
+            assert demo.attrs["num_samples"] == len(streams["actions"])
+            assert sorted(demo_keys(demo)) == sorted(streams)
+            assert demo[RUN_LENGTHS][()].sum() == len(streams["actions"])
+            for key, values in streams.items():
+                expanded = read_key(demo, key)
+                assert expanded.shape == values.shape
+                assert expanded.dtype == values.dtype
+                if key in ("rewards", "obs/policy/phase"):
+                    np.testing.assert_array_equal(expanded, values)
+        # the idle frames are elided, one kept frame per run
+        np.testing.assert_array_equal(f["data/demo_0"][RUN_LENGTHS][()], run_lengths)
+        assert f["data/demo_0/actions"].shape == (len(run_lengths), 7)
+        assert f["data/demo_1/actions"].shape == (0, 7)
+
+    expanded = str(tmp_path / "expanded.hdf5")
+    expand_file(compacted, expanded)
+    assert max_error(compacted, expanded) == 0.0
+
+
+def test_error_bound(recording, tmp_path):
+    path, _, _ = recording
+    compacted = str(tmp_path / "compact.hdf5")
+    compact_file(path, compacted, STEP)
+
+    bound = error_bound(path, STEP)
+    # half a float32 ulp at 100
+    assert STEP / 2 < bound <= STEP / 2 + 4e-6
+    assert max_error(path, compacted) <= bound
+    # the quantization error dominates
+    assert max_error(path, compacted) > 0.9 * STEP / 2
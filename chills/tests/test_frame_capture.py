@@ -0,0 +1,109 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the asynchronous frame capture with synthetic frames on CPU."""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from frame_capture import FrameCapture, load_episode_frames
+
+NUM_ENVS = 3
+SIZE = 8
+# steps per episode of every environment, the episodes end at different steps and cross the chunks
+EPISODE_LENGTHS = [[5, 40, 12], [33, 7], [70]]
+
+
+def _frames(steps: np.ndarray) -> np.ndarray:
+    """(num_envs, H, W, 3) frames with the step of every environment in its pixels."""
+    return np.broadcast_to((steps % 256).astype(np.uint8)[:, None, None, None], (NUM_ENVS, SIZE, SIZE, 3)).copy()
+
+
+def _run_episodes(capture: FrameCapture):
+    """Step all environments, each ends its episodes after ``EPISODE_LENGTHS`` steps."""
+    episode = np.zeros(NUM_ENVS, dtype=int)
+    step = np.zeros(NUM_ENVS, dtype=int)
+    num_steps = max(sum(lengths) for lengths in EPISODE_LENGTHS)
+    for _ in range(num_steps):
+        capture.add_frames(_frames(step))
+        step += 1
+        ended = [
+            e
+            for e in range(NUM_ENVS)
+            if episode[e] < len(EPISODE_LENGTHS[e]) and step[e] == EPISODE_LENGTHS[e][episode[e]]
+        ]
+        if ended:
+            capture.end_episode(ended)
+            episode[ended] += 1
+            step[ended] = 0
+
+
+def _check_episodes(output_dir: str):
+    for env_id, lengths in enumerate(EPISODE_LENGTHS):
+        for episode, length in enumerate(lengths):
+            frames, steps = load_episode_frames(output_dir, env_id, episode)
+            np.testing.assert_array_equal(steps, np.arange(length))
+            assert frames.shape == (length, SIZE, SIZE, 3)
+            np.testing.assert_array_equal(frames[:, 0, 0, 0], np.arange(length) % 256)
+
+
+def test_episodes_are_step_contiguous(tmp_path):
+    capture = FrameCapture(str(tmp_path), NUM_ENVS, (SIZE, SIZE, 3), chunk_size=8, num_buffers=64, num_workers=2)
+    _run_episodes(capture)
+    capture.close()
+
+    assert capture.num_dropped == 0
+    _check_episodes(str(tmp_path))
+    assert os.path.isfile(tmp_path / "capture.json")
+
+
+def test_one_video_per_episode(tmp_path):
+    pytest.importorskip("imageio")
+    capture = FrameCapture(
+        str(tmp_path), NUM_ENVS, (SIZE, SIZE, 3), chunk_size=8, num_buffers=64, num_workers=2, file_format="mp4"
+    )
+    _run_episodes(capture)
+    capture.close()
+
+    for env_id, lengths in enumerate(EPISODE_LENGTHS):
+        videos = {name for name in os.listdir(tmp_path / f"env_{env_id}") if name.endswith(".mp4")}
+        # the episode running at the end of the capture is kept too
+        assert videos - {f"episode_{len(lengths)}.mp4"} == {f"episode_{episode}.mp4" for episode in range(len(lengths))}
+        for episode, length in enumerate(lengths):
+            frames, steps = load_episode_frames(str(tmp_path), env_id, episode)
+            np.testing.assert_array_equal(steps, np.arange(length))
+            assert len(frames) == length
+
+
+def test_add_frames_does_not_wait_for_the_encoders(tmp_path):
+    capture = FrameCapture(str(tmp_path), NUM_ENVS, (SIZE, SIZE, 3), chunk_size=4, num_buffers=2, num_workers=1)
+    # keep the encoder busy, the chunks queue up behind it until no buffer is free
+    busy = capture._encoders[0].submit(time.sleep, 1.0)
+    latencies = []
+    step = np.zeros(NUM_ENVS, dtype=int)
+    for _ in range(40):
+        start = time.perf_counter()
+        capture.add_frames(_frames(step))
+        latencies.append(time.perf_counter() - start)
+        step += 1
+    assert not busy.done()
+    assert max(latencies) < 0.1
+    assert capture.num_frames + capture.num_dropped == 40
+    assert capture.num_dropped > 0
+    capture.close()
+
+    # the frames kept before the buffers ran out are still step-aligned
+    frames, steps = load_episode_frames(str(tmp_path), 0, 0)
+    np.testing.assert_array_equal(frames[:, 0, 0, 0], steps)
+    assert len(steps) == capture.num_frames
+
+
+def test_non_empty_directory_is_refused(tmp_path):
+    (tmp_path / "env_0").mkdir()
+    with pytest.raises(ValueError, match="not empty"):
+        FrameCapture(str(tmp_path), NUM_ENVS, (SIZE, SIZE, 3), num_workers=1)
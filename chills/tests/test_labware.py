@@ -0,0 +1,101 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the Euler angle to quaternion conversions of the labware against scipy, and of the pose table."""
+
+import itertools
+
+import numpy as np
+import pytest
+import torch
+from scipy.spatial.transform import Rotation
+
+from labware import (
+    DEFAULT_POS,
+    DEFAULT_ROT,
+    LabwareRegistry,
+    _deg2quat_wxyz,
+    deg2quat_wxyz,
+    euler_deg_to_quat_wxyz,
+    labware_pose_table,
+)
+
+AXIS_ALIGNED = [list(angles) for angles in itertools.product((-180.0, -90.0, 0.0, 90.0, 180.0), repeat=3)]
+
+
+def _random_angles(num: int) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-360.0, 360.0, size=(num, 3))
+
+
+def _scipy_wxyz(euler_deg) -> np.ndarray:
+    return np.roll(Rotation.from_euler("xyz", euler_deg, degrees=True).as_quat(), 1, axis=-1)
+
+
+def assert_same_rotation(quat: np.ndarray, expected: np.ndarray, atol: float = 1e-6):
+    """q and -q are the same rotation."""
+    quat, expected = np.atleast_2d(quat), np.atleast_2d(expected)
+    sign = np.where(np.sum(quat * expected, axis=-1, keepdims=True) < 0, -1.0, 1.0)
+    np.testing.assert_allclose(sign * quat, expected, atol=atol)
+
+
+@pytest.mark.parametrize("euler_deg", [AXIS_ALIGNED, _random_angles(1000)], ids=["axis_aligned", "random"])
+def test_euler_deg_to_quat_wxyz(euler_deg):
+    quat = euler_deg_to_quat_wxyz(euler_deg, dtype=torch.float64)
+    assert quat.shape == (len(euler_deg), 4)
+    assert_same_rotation(quat.numpy(), _scipy_wxyz(euler_deg), atol=1e-12)
+
+
+def test_euler_deg_to_quat_wxyz_dtype():
+    euler_deg = torch.as_tensor(_random_angles(10))
+    quat = euler_deg_to_quat_wxyz(euler_deg)
+    assert quat.dtype == torch.float32
+    assert_same_rotation(quat.numpy(), _scipy_wxyz(euler_deg.numpy()))
+
+
+@pytest.mark.parametrize("euler_deg", AXIS_ALIGNED + _random_angles(50).tolist())
+def test_deg2quat_wxyz(euler_deg):
+    assert_same_rotation(np.array(deg2quat_wxyz(euler_deg)), _scipy_wxyz(euler_deg), atol=1e-12)
+
+
+def test_deg2quat_wxyz_memoized():
+    euler_deg = _random_angles(20)
+    uncached = [_deg2quat_wxyz.__wrapped__(tuple(angles)) for angles in euler_deg.tolist()]
+    _deg2quat_wxyz.cache_clear()
+    for _ in range(2):
+        # the first pass fills the cache, the second one reads it
+        assert [deg2quat_wxyz(angles) for angles in euler_deg] == [list(quat) for quat in uncached]
+    assert _deg2quat_wxyz.cache_info().hits == len(euler_deg)
+    # the cached result is not shared between callers
+    quat = deg2quat_wxyz([0.0, 0.0, 90.0])
+    quat[0] = 2.0
+    assert deg2quat_wxyz([0, 0, 90]) != quat
+
+
+def test_deg2quat_wxyz_matches_batched():
+    euler_deg = _random_angles(100)
+    batched = euler_deg_to_quat_wxyz(euler_deg, dtype=torch.float64).numpy()
+    np.testing.assert_allclose([deg2quat_wxyz(angles) for angles in euler_deg], batched, atol=1e-12)
+
+
+def test_pose_table_defaults_without_sidecar(tmp_path):
+    # a converted labware without labware.yaml, and one whose sidecar sets only the scale
+    for name, sidecar in (("plain", None), ("scaled", "scale: [0.01, 0.01, 0.01]\n")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "config.yaml").write_text(f"usd_file_name: {name}.usd\n")
+        if sidecar is not None:
+            (tmp_path / name / "labware.yaml").write_text(sidecar)
+    registry = LabwareRegistry(str(tmp_path))
+    placed = {"init_state.pos": [0.4, 0.1, 0.06], "init_state.rot": [0.0, 0.0, 0.0, 1.0]}
+    labware = [registry["plain"], registry["scaled"], placed]
+
+    labware_ids, pos, rot = labware_pose_table(labware, 5, "cpu")
+    assert labware_ids.tolist() == [0, 1, 2, 0, 1]
+    expected_pos = torch.tensor([DEFAULT_POS, DEFAULT_POS, placed["init_state.pos"], DEFAULT_POS, DEFAULT_POS])
+    expected_rot = torch.tensor([DEFAULT_ROT, DEFAULT_ROT, placed["init_state.rot"], DEFAULT_ROT, DEFAULT_ROT])
+    torch.testing.assert_close(pos, expected_pos)
+    torch.testing.assert_close(rot, expected_rot)
+
+    _, pos, _ = labware_pose_table(labware[:1], 1, "cpu", default_pos=(0.6, 0.0, 0.1))
+    torch.testing.assert_close(pos, torch.tensor([[0.6, 0.0, 0.1]]))
@@ -0,0 +1,50 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the level of detail cache and its stored deviation."""
+
+import os
+
+import numpy as np
+
+import mesh_lod
+from mesh_lod import cached_lod, write_obj
+from obj_mesh import ObjMesh
+
+
+def _write_grid(path: str, n: int = 40):
+    y, x = np.mgrid[:n, :n]
+    vertices = np.stack([x, y, np.sin(x / 5.0) * np.cos(y / 7.0)], -1).reshape(-1, 3).astype(np.float32)
+    cells = (np.arange(n - 1)[:, None] * n + np.arange(n - 1)).reshape(-1)
+    faces = np.concatenate([np.stack([cells, cells + 1, cells + n], 1), np.stack([cells + 1, cells + n + 1, cells + n], 1)])
+    write_obj(path, ObjMesh(vertices=vertices, faces=faces.astype(np.int32), normals=np.empty((0, 3), np.float32)))
+
+
+def test_cache_hit_returns_the_stored_deviation(tmp_path, monkeypatch):
+    mesh_path = str(tmp_path / "grid.obj")
+    _write_grid(mesh_path)
+    lod_path, lod_deviation = cached_lod(mesh_path, 500)
+    assert os.path.isfile(lod_path)
+    assert os.path.isfile(os.path.splitext(lod_path)[0] + ".json")
+    assert 0 < lod_deviation.relative_max < 0.1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a cached level is not measured again")
+
+    monkeypatch.setattr(mesh_lod, "deviation", fail)
+    assert cached_lod(mesh_path, 500) == (lod_path, lod_deviation)
+
+
+def test_cache_hit_without_deviation_measures_it(tmp_path):
+    mesh_path = str(tmp_path / "grid.obj")
+    _write_grid(mesh_path)
+    lod_path, lod_deviation = cached_lod(mesh_path, 500)
+    os.remove(os.path.splitext(lod_path)[0] + ".json")
+
+    cached_path, cached_deviation = cached_lod(mesh_path, 500)
+    assert cached_path == lod_path
+    # measured on the cached OBJ, which holds the positions to 7 digits
+    np.testing.assert_allclose(cached_deviation.max, lod_deviation.max, rtol=1e-3)
+    assert os.path.isfile(os.path.splitext(lod_path)[0] + ".json")
@@ -0,0 +1,85 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the streaming OBJ loader against a per-line reference parser."""
+
+import time
+
+import numpy as np
+import pytest
+
+from obj_mesh import load_obj
+
+
+def _line_loop_obj(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Naive per-line parser, the baseline the vectorized loader has to beat."""
+    vertices, faces = [], []
+    with open(path) as f:
+        for line in f:
+            tokens = line.split("#", 1)[0].split()
+            if not tokens:
+                continue
+            if tokens[0] == "v":
+                vertices.append([float(v) for v in tokens[1:4]])
+            elif tokens[0] == "f":
+                corners = [int(token.split("/")[0]) for token in tokens[1:]]
+                corners = [c - 1 if c > 0 else c + len(vertices) for c in corners]
+                faces.extend([corners[0], corners[i], corners[i + 1]] for i in range(1, len(corners) - 1))
+    return np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.int32)
+
+
+def _write_grid_obj(path, n: int):
+    """``n x n`` vertex grid with two triangles per cell, ``v/vt/vn`` corners and a few comments."""
+    rng = np.random.default_rng(0)
+    vertices = np.concatenate([np.stack(np.mgrid[:n, :n], -1).reshape(-1, 2), rng.random((n * n, 1))], 1)
+    cells = (np.arange(n - 1)[:, None] * n + np.arange(n - 1)).reshape(-1) + 1
+    triangles = np.concatenate(
+        [np.stack([cells, cells + 1, cells + n], 1), np.stack([cells + 1, cells + n + 1, cells + n], 1)]
+    )
+    with open(path, "w") as f:
+        f.write("# grid\n")
+        f.write("".join(f"v {x:.6f} {y:.6f} {z:.6f}\n" for x, y, z in vertices))
+        f.write("vn 0 0 1 # up\n")
+        f.write("".join(f"f {a}/{a}/1 {b}/{b}/1 {c}/{c}/1\n" for a, b, c in triangles))
+
+
+def test_load_obj_comments_and_relative_indices(tmp_path):
+    path = tmp_path / "quad.obj"
+    path.write_text(
+        "# header\nv 0 0 0 # origin\nv 1 0 0\nv 0 1 0  # third\nvn 0 0 1 #n\nv 0 0 1\n"
+        "f 1/1/1 2/2/1 3 # a/b\nf -4 -2 -1\nf 1 2 3 4\n"
+    )
+    mesh = load_obj(str(path))
+    vertices, faces = _line_loop_obj(str(path))
+    np.testing.assert_array_equal(mesh.vertices, vertices)
+    np.testing.assert_array_equal(mesh.faces, faces)
+    np.testing.assert_array_equal(mesh.normals, [[0, 0, 1]])
+
+
+@pytest.mark.parametrize("block_size", [64, 1 << 22])
+def test_load_obj_matches_line_loop(tmp_path, block_size):
+    path = tmp_path / "grid.obj"
+    _write_grid_obj(path, 40)
+    mesh = load_obj(str(path), block_size=block_size)
+    vertices, faces = _line_loop_obj(str(path))
+    np.testing.assert_allclose(mesh.vertices, vertices)
+    np.testing.assert_array_equal(mesh.faces, faces)
+
+
+def test_load_obj_faster_than_line_loop(tmp_path):
+    path = tmp_path / "grid.obj"
+    _write_grid_obj(path, 300)
+
+    def best_time(fn) -> float:
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            fn(str(path))
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    vectorized, line_loop = best_time(load_obj), best_time(_line_loop_obj)
+    # about 3x faster here, the margin leaves room for noisy machines
+    assert 1.5 * vectorized < line_loop, f"load_obj {vectorized:.3f} s, line loop {line_loop:.3f} s"
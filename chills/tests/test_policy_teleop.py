@@ -0,0 +1,109 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Round trips of policy checkpoints through load_policy and the action chunk shapes of PolicyTeleop on CPU."""
+
+import pytest
+import torch
+
+from policy_teleop import MLPPolicy, PolicyTeleop, load_policy
+
+OBS_DIM = 35
+CHUNK_SIZE = 4
+NUM_ENVS = 5
+
+
+@pytest.fixture
+def policy() -> MLPPolicy:
+    torch.manual_seed(0)
+    return MLPPolicy([OBS_DIM, 32, 32, 7 * CHUNK_SIZE], activation="relu").eval()
+
+
+def _rsl_rl_checkpoint(policy: MLPPolicy) -> dict:
+    """Checkpoint layout of rsl_rl, the actor next to the critic, the action noise and the training state."""
+    model = {"actor." + key[len("net.") :]: value for key, value in policy.state_dict().items()}
+    model["critic.0.weight"] = torch.zeros(1, OBS_DIM)
+    model["critic.0.bias"] = torch.zeros(1)
+    model["std"] = torch.ones(7 * CHUNK_SIZE)
+    return {"model_state_dict": model, "optimizer_state_dict": {}, "iter": 100, "infos": None}
+
+
+def _assert_same_policy(loaded: torch.nn.Module, policy: MLPPolicy):
+    obs = torch.randn(NUM_ENVS, OBS_DIM)
+    with torch.inference_mode():
+        torch.testing.assert_close(loaded(obs), policy(obs))
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [lambda sd, _: sd, lambda sd, _: {"state_dict": sd}, lambda _, policy: _rsl_rl_checkpoint(policy)],
+    ids=["plain", "state_dict", "rsl_rl"],
+)
+def test_state_dict_round_trip(policy, tmp_path, wrap):
+    path = str(tmp_path / "policy.pt")
+    torch.save(wrap(policy.state_dict(), policy), path)
+    loaded = load_policy(path, "cpu", activation="relu")
+    assert isinstance(loaded, MLPPolicy)
+    for key, value in policy.state_dict().items():
+        torch.testing.assert_close(loaded.state_dict()[key], value)
+    _assert_same_policy(loaded, policy)
+
+
+def test_activation(policy, tmp_path):
+    path = str(tmp_path / "policy.pt")
+    torch.save(policy.state_dict(), path)
+    obs = torch.randn(NUM_ENVS, OBS_DIM)
+    with torch.inference_mode():
+        assert not torch.allclose(load_policy(path, "cpu", activation="elu")(obs), policy(obs))
+
+
+def test_torchscript_round_trip(policy, tmp_path):
+    path = str(tmp_path / "policy_jit.pt")
+    torch.jit.script(policy).save(path)
+    _assert_same_policy(load_policy(path, "cpu"), policy)
+
+
+def test_unexpected_entries_are_refused(policy, tmp_path):
+    path = str(tmp_path / "policy.pt")
+    checkpoint = _rsl_rl_checkpoint(policy)
+    checkpoint["model_state_dict"]["actor_obs_normalizer._mean"] = torch.zeros(OBS_DIM)
+    torch.save(checkpoint, path)
+    with pytest.raises(ValueError, match="obs_normalizer"):
+        load_policy(path, "cpu")
+
+    torch.save({"state_dict": policy.state_dict(), "obs_normalizer": {"mean": torch.zeros(OBS_DIM)}}, path)
+    with pytest.raises(ValueError, match="obs_normalizer"):
+        load_policy(path, "cpu")
+
+
+def test_chunk_replay(policy):
+    obs = torch.randn(NUM_ENVS, OBS_DIM)
+    with torch.inference_mode():
+        chunk = policy(obs).view(NUM_ENVS, CHUNK_SIZE, 7)
+    device = PolicyTeleop(policy, NUM_ENVS, "cpu", lambda: obs, chunk_size=CHUNK_SIZE, execute_steps=2)
+    for step in range(4):
+        delta_pose, gripper = device.advance()
+        assert delta_pose.shape == (NUM_ENVS, 6)
+        assert gripper.shape == (NUM_ENVS,)
+        torch.testing.assert_close(delta_pose, chunk[:, step % 2, :6])
+    assert device.num_queries == 2
+
+
+def test_temporal_ensembling(policy):
+    obs = torch.randn(NUM_ENVS, OBS_DIM)
+    with torch.inference_mode():
+        chunk = policy(obs).view(NUM_ENVS, CHUNK_SIZE, 7)
+    decay = 0.1
+    device = PolicyTeleop(policy, NUM_ENVS, "cpu", lambda: obs, chunk_size=CHUNK_SIZE, ensemble_decay=decay)
+    for step in range(CHUNK_SIZE + 2):
+        delta_pose, gripper = device.advance()
+        assert delta_pose.shape == (NUM_ENVS, 6)
+        assert gripper.shape == (NUM_ENVS,)
+        # the queries of the last steps predicted the current one at offsets 0..n-1, the oldest weighs most
+        offsets = torch.arange(min(step + 1, CHUNK_SIZE))
+        weights = torch.exp(-decay * (offsets.max() - offsets).float())
+        expected = (weights[:, None] * chunk[:, offsets]).sum(1) / weights.sum()
+        torch.testing.assert_close(delta_pose, expected[:, :6])
+    assert device.num_queries == CHUNK_SIZE + 2
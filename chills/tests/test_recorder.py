@@ -0,0 +1,77 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the recorded labware and observation layout, as read back by the offline metrics, and of close."""
+
+import h5py
+import pytest
+import torch
+
+from metrics import evaluate_recordings, object_height_index
+from recorder import EpisodeRecorder, observation_layout
+from stub_env import StubEnv
+
+NUM_ENVS = 4
+LABWARE = ["beaker", "con_flask", "beaker", "con_flask"]
+
+
+def _record(path: str, **kwargs):
+    env = StubEnv(NUM_ENVS)
+    recorder = EpisodeRecorder(path, NUM_ENVS, env_name="stub", chunk_size=8, **kwargs)
+    obs, _ = env.reset()
+    for step in range(20):
+        actions = torch.zeros((NUM_ENVS, 7))
+        next_obs, rewards, _, _, _ = env.step(actions)
+        recorder.add_step(obs, actions, rewards)
+        obs = next_obs
+        if step == 9:
+            recorder.end_episode([0, 1], success=[True, False])
+    recorder.close()
+
+
+def test_episodes_store_labware_and_layout(tmp_path):
+    path = str(tmp_path / "demos.hdf5")
+    _record(path, labware=LABWARE, obs_layout=observation_layout(StubEnv(NUM_ENVS)))
+
+    with h5py.File(path, "r") as f:
+        # the Lift policy observations, object z after joint_pos (9), joint_vel (9) and object x, y
+        assert object_height_index(f["data"]) == 20
+        for demo in f["data"].values():
+            assert demo.attrs["labware"] == LABWARE[demo.attrs["env_id"]]
+
+    metrics = evaluate_recordings([path])
+    assert sorted(metrics.labware_names) == ["beaker", "con_flask"]
+    summary = metrics.summary()
+    assert summary["beaker"]["episodes"] + summary["con_flask"]["episodes"] == 6
+
+
+def test_recording_without_layout_needs_the_height_index(tmp_path):
+    path = str(tmp_path / "demos.hdf5")
+    _record(path)
+
+    with pytest.raises(ValueError, match="no observation layout"):
+        evaluate_recordings([path])
+    metrics = evaluate_recordings([path], labware=["beaker", "con_flask"], height_index=20)
+    assert sorted(metrics.labware_names) == ["beaker", "con_flask"]
+
+
+def test_labware_of_every_environment(tmp_path):
+    with pytest.raises(ValueError, match="labware of 4 environments"):
+        EpisodeRecorder(str(tmp_path / "demos.hdf5"), NUM_ENVS, labware=["beaker"])
+
+
+def test_close_with_a_pending_writer_error(tmp_path):
+    path = str(tmp_path / "demos.hdf5")
+    recorder = EpisodeRecorder(path, NUM_ENVS, chunk_size=8)
+    recorder.add_step({"policy": torch.zeros(NUM_ENVS, 35)}, torch.zeros(NUM_ENVS, 7), torch.zeros(NUM_ENVS))
+    # an error the writer thread reported while it still runs, close() raises it from end_episode()
+    recorder._error = OSError("disk full")
+    with pytest.raises(RuntimeError, match="failed"):
+        recorder.close()
+
+    # the file was closed before the error was raised
+    assert not recorder._file.id.valid
+    with h5py.File(path, "r") as f:
+        assert "data" in f
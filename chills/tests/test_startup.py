@@ -0,0 +1,44 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests of the labware resolved before the app is launched."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import startup
+from labware import Labwear, LabwareRegistry
+
+
+def _args(labware: str = "none", multi_labware: list[str] | None = None) -> SimpleNamespace:
+    return SimpleNamespace(labware=labware, multi_labware=multi_labware)
+
+
+def test_resolve_labware():
+    assert startup.resolve_labware(_args()) == []
+    assert startup.resolve_labware(_args("beaker")) == ["beaker"]
+    assert startup.resolve_labware(_args(multi_labware=["round_bot", "beaker"])) == ["round_bot", "beaker"]
+    assert startup.resolve_labware(_args(multi_labware=[])) == [
+        name for name in Labwear if startup.is_converted(name)
+    ]
+
+
+@pytest.mark.parametrize("args", [_args("flask"), _args(multi_labware=["beaker", "flask"])])
+def test_unknown_labware_is_refused(args):
+    with pytest.raises(ValueError, match="Unknown labware"):
+        startup.resolve_labware(args)
+
+
+def test_unconverted_labware_is_refused(tmp_path, monkeypatch):
+    # converter config written, USD missing
+    (tmp_path / "vial").mkdir()
+    (tmp_path / "vial" / "config.yaml").write_text("usd_file_name: vial.usd\n")
+    monkeypatch.setattr(startup, "Labwear", LabwareRegistry(str(tmp_path)))
+
+    with pytest.raises(ValueError, match="has no USD"):
+        startup.resolve_labware(_args(multi_labware=["vial"]))
+    with pytest.raises(ValueError, match="no converted labware"):
+        startup.resolve_labware(_args(multi_labware=[]))
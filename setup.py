@@ -19,6 +19,9 @@ EXTENSION_TOML_DATA = toml.load(os.path.join(EXTENSION_PATH, "config", "extensio
 INSTALL_REQUIRES = [
     # NOTE: Add dependencies
     "psutil",
+    "h5py",
+    "pyyaml",
+    "scipy",
 ]
 
 # Installation operation